@@ -925,7 +925,11 @@ export async function deleteRemnantImage(client, authed, remnantId) {
   const bucket = process.env.SUPABASE_BUCKET || "remnant-images";
   const oldPath = String(existingRemnant?.image_path || "").trim();
   let storageRemoved = false;
-  if (oldPath) {
+  if (oldPath.startsWith("by-hash/")) {
+    // Content-addressed photos can be shared by several remnants; the remnant
+    // sync garbage collects them once nothing references them.
+    storageRemoved = false;
+  } else if (oldPath) {
     try {
       const { error: removeError } = await writeClient.storage.from(bucket).remove([oldPath]);
       if (!removeError) storageRemoved = true;
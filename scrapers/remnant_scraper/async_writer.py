@@ -0,0 +1,210 @@
+"""
+Asynchronous remnant writes for the Moraware sync.
+
+With MORAWARE_ASYNC_WRITES on, remnant inserts/updates and photo column
+updates leave the crawl thread: `submit` hands the write to an asyncio event
+loop running on its own thread, and the crawl moves on to the next row or
+page while the loop keeps up to `max_in_flight` PostgREST requests open over
+one pooled HTTP/2 connection.
+
+Writes for the same `moraware_remnant_id` still run in submission order: each
+one waits for the previous write to that id before it is sent. `max_pending`
+bounds the backlog, so a slow database pushes back on the crawl instead of
+growing the queue without limit. Failures are collected and returned by
+`drain()` so the caller can record them like any other row error.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+import httpx
+from supabase import AsyncClientOptions, acreate_client
+
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_MAX_PENDING = 500
+HTTP_TIMEOUT_SEC = 30
+
+
+@dataclass
+class WriteFailure:
+    key: int
+    description: str
+    job_url: str | None
+    error: Exception
+
+
+async def connect_async_client(supabase_url: str, supabase_key: str, max_in_flight: int):
+    """An async Supabase client over one HTTP/2 connection pool sized for `max_in_flight`."""
+    http_client = httpx.AsyncClient(
+        http2=True,
+        timeout=HTTP_TIMEOUT_SEC,
+        limits=httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight),
+    )
+    try:
+        options = AsyncClientOptions(httpx_client=http_client)
+    except TypeError:
+        # Older supabase-py releases build their own httpx client.
+        await http_client.aclose()
+        logging.warning("supabase-py does not accept an httpx client; async writes use its default HTTP/1.1 pool")
+        options = None
+    return await acreate_client(supabase_url, supabase_key, options=options)
+
+
+class AsyncWriter:
+    def __init__(
+        self,
+        client,
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        metrics=None,
+    ):
+        """
+        `client` is a Supabase client (async or sync) or a coroutine function
+        that returns one; it is awaited on the writer's loop.
+        """
+        self.metrics = metrics
+        self.max_in_flight = max(1, max_in_flight)
+        self.failures: list[WriteFailure] = []
+        self.submitted = 0
+        self._pending = threading.BoundedSemaphore(max(1, max_pending))
+        # Unfinished writes, with the job page each one belongs to.
+        self._outstanding: dict[Future, str | None] = {}
+        self._outstanding_lock = threading.Lock()
+        # Latest write per remnant id; only touched on the loop thread.
+        self._tails: dict[int, asyncio.Task] = {}
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="remnant-async-writes", daemon=True)
+        self._thread.start()
+        self.client = asyncio.run_coroutine_threadsafe(self._connect(client), self.loop).result()
+
+    async def _connect(self, client):
+        if inspect.iscoroutinefunction(client):
+            return await client()
+        return client
+
+    def submit(self, key: int, build_query, *, description: str = "", job_url: str | None = None) -> Future:
+        """
+        Queues `build_query(client).execute()` behind earlier writes for `key`.
+        Blocks while `max_pending` writes are already waiting.
+        """
+        self._pending.acquire()
+        future: Future = Future()
+        with self._outstanding_lock:
+            self._outstanding[future] = job_url
+            self.submitted += 1
+        self.loop.call_soon_threadsafe(self._start, key, build_query, description, job_url, future)
+        return future
+
+    def _start(self, key, build_query, description, job_url, future: Future) -> None:
+        # Runs on the loop thread in submission order, so the tail is always the previous write.
+        previous = self._tails.get(key)
+        task = self.loop.create_task(self._run(key, previous, build_query, description, job_url, future))
+        self._tails[key] = task
+
+    async def _run(self, key, previous, build_query, description, job_url, future: Future) -> None:
+        result = error = None
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])
+            async with self._in_flight:
+                started = time.monotonic()
+                query = build_query(self.client)
+                if inspect.iscoroutinefunction(query.execute):
+                    result = await query.execute()
+                else:
+                    result = await self.loop.run_in_executor(None, query.execute)
+                if self.metrics:
+                    self.metrics.add("db_write_async", time.monotonic() - started, requests=1)
+        except Exception as exc:
+            error = exc
+            logging.error(f"Remnant #{key}: async write failed ({description or 'write'}): {exc}")
+        finally:
+            if self._tails.get(key) is asyncio.current_task():
+                del self._tails[key]
+            self._pending.release()
+            with self._outstanding_lock:
+                self._outstanding.pop(future, None)
+                if error is not None:
+                    self.failures.append(WriteFailure(key, description, job_url, error))
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def wait_for(self, key: int) -> None:
+        """Blocks until every write queued so far for `key` has finished."""
+        barrier: Future = Future()
+
+        def check():
+            tail = self._tails.get(key)
+            if tail is None:
+                barrier.set_result(None)
+            else:
+                tail.add_done_callback(lambda _task: barrier.set_result(None))
+
+        self.loop.call_soon_threadsafe(check)
+        barrier.result()
+
+    def after_pending(self, callback, job_url: str | None = None) -> None:
+        """
+        Calls `callback(ok)` once every write queued so far (only those for
+        `job_url`, when given) has finished; `ok` is False when any of them
+        failed. May run on the loop thread.
+        """
+        with self._outstanding_lock:
+            pending = [
+                future
+                for future, future_job_url in self._outstanding.items()
+                if job_url is None or future_job_url == job_url
+            ]
+        if not pending:
+            callback(True)
+            return
+        state = {"remaining": len(pending), "ok": True}
+        state_lock = threading.Lock()
+
+        def done(future: Future) -> None:
+            with state_lock:
+                state["remaining"] -= 1
+                state["ok"] = state["ok"] and future.exception() is None
+                finished = state["remaining"] == 0
+            if finished:
+                callback(state["ok"])
+
+        for future in pending:
+            future.add_done_callback(done)
+
+    def drain(self) -> list[WriteFailure]:
+        """Waits for every queued write. Returns (and clears) the failures so far."""
+        while True:
+            with self._outstanding_lock:
+                outstanding = list(self._outstanding)
+            if not outstanding:
+                break
+            for future in outstanding:
+                try:
+                    future.result()
+                except Exception:
+                    pass
+        with self._outstanding_lock:
+            failures, self.failures = self.failures, []
+        return failures
+
+    def close(self) -> list[WriteFailure]:
+        """Drains the queue and stops the loop. Returns the failures no `drain()` has handed out yet."""
+        failures = self.drain()
+        http_client = getattr(getattr(self.client, "options", None), "httpx_client", None)
+        if http_client is not None:
+            asyncio.run_coroutine_threadsafe(http_client.aclose(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+        return failures
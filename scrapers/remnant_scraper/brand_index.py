@@ -0,0 +1,173 @@
+"""
+Brand prefix index for remnant stone names.
+
+Brand prefixes and aliases ("caesar stone", "x-tone", "one quartz by daltile")
+are tokenized into a trie, so resolving "Cambria Hailey" into brand, supplier
+and stone name is one walk over the first few tokens of the name however many
+brands are loaded. Rules come from the bundled `brand_prefixes.json`, or from
+`supplier_brands` in Supabase; the Supabase build is cached on disk so later
+runs start without touching the DB. The cache records a hash of the bundled
+rules, so editing `brand_prefixes.json` invalidates it before the TTL does.
+"""
+
+import json
+import logging
+import re
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from scrapers.remnant_scraper.lookup_cache import fetch_all_rows, normalize_lookup_name
+from scrapers.remnant_scraper.utils import sha256_bytes
+
+BUNDLED_RULES_PATH = Path(__file__).resolve().parent / "brand_prefixes.json"
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent / "brand_index_cache.json"
+DEFAULT_CACHE_TTL_HOURS = 24
+
+# Hyphens separate tokens too, so "x-tone" also covers "X Tone".
+TOKEN_PATTERN = re.compile(r"[^\s-]+")
+
+
+@dataclass(frozen=True)
+class BrandRule:
+    brand_name: str
+    supplier_name: str | None
+    prefixes: tuple[str, ...]
+
+
+def tokenize(value: str) -> list[str]:
+    return [token.casefold() for token in TOKEN_PATTERN.findall(value or "")]
+
+
+class BrandIndex:
+    def __init__(self, rules: list[BrandRule]):
+        self.rules = list(rules)
+        self._root: dict = {}
+        self.max_depth = 0
+        for rule in self.rules:
+            for prefix in rule.prefixes:
+                tokens = tokenize(prefix)
+                if not tokens:
+                    continue
+                node = self._root
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                # First rule to claim a prefix keeps it.
+                node.setdefault(None, rule)
+                self.max_depth = max(self.max_depth, len(tokens))
+
+    def match(self, cleaned_name: str) -> tuple[BrandRule, str] | None:
+        """
+        Returns the rule for the longest brand prefix of `cleaned_name` plus the
+        stone name after it. A prefix only counts when whitespace and a stone
+        name follow it.
+        """
+        node = self._root
+        best = None
+        # Spans come from the name itself; lowercasing can change its length ("İ").
+        for depth, token_match in enumerate(TOKEN_PATTERN.finditer(cleaned_name)):
+            if depth >= self.max_depth:
+                break
+            node = node.get(token_match.group().casefold())
+            if node is None:
+                break
+            rule = node.get(None)
+            end = token_match.end()
+            if rule and cleaned_name[end:end + 1].isspace() and cleaned_name[end:].strip():
+                best = (rule, cleaned_name[end:].strip())
+        return best
+
+
+def bundled_rules_hash(path: Path = BUNDLED_RULES_PATH) -> str:
+    return sha256_bytes(path.read_bytes())
+
+
+def load_bundled_rules(path: Path = BUNDLED_RULES_PATH) -> list[BrandRule]:
+    return [
+        BrandRule(
+            brand_name=row["brand_name"],
+            supplier_name=row.get("supplier_name"),
+            prefixes=tuple(row.get("prefixes") or [row["brand_name"]]),
+        )
+        for row in json.loads(path.read_text())
+    ]
+
+
+def load_supabase_rules(supabase) -> list[BrandRule]:
+    """One rule per `supplier_brands` row, matched on the brand name itself."""
+    supplier_names = {
+        row["id"]: row.get("name")
+        for row in fetch_all_rows(supabase, "suppliers", "id,name")
+    }
+    return [
+        BrandRule(
+            brand_name=row["brand_name"].strip(),
+            supplier_name=supplier_names.get(row["supplier_id"]),
+            prefixes=(row["brand_name"].strip(),),
+        )
+        for row in fetch_all_rows(supabase, "supplier_brands", "id,supplier_id,brand_name")
+        if (row.get("brand_name") or "").strip()
+    ]
+
+
+def merge_rules(primary: list[BrandRule], extra: list[BrandRule]) -> list[BrandRule]:
+    """Bundled rules win; extra rules only add brands the bundle does not know."""
+    known = {normalize_lookup_name(rule.brand_name) for rule in primary}
+    return primary + [rule for rule in extra if normalize_lookup_name(rule.brand_name) not in known]
+
+
+def read_cached_rules(path: Path, ttl_hours: float, bundled_hash: str) -> list[BrandRule] | None:
+    """Returns the cached rules, or None when the cache is stale or built from other bundled rules."""
+    try:
+        if time.time() - path.stat().st_mtime > ttl_hours * 3600:
+            return None
+        cached = json.loads(path.read_text())
+        if cached.get("bundled_hash") != bundled_hash:
+            return None
+        return [
+            BrandRule(row["brand_name"], row.get("supplier_name"), tuple(row["prefixes"]))
+            for row in cached["rules"]
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_cached_rules(path: Path, rules: list[BrandRule], bundled_hash: str) -> None:
+    try:
+        path.write_text(
+            json.dumps({"bundled_hash": bundled_hash, "rules": [asdict(rule) for rule in rules]}, indent=2)
+        )
+    except OSError as exc:
+        logging.warning(f"Could not write brand index cache {path}: {exc}")
+
+
+def load_brand_index(
+    supabase=None,
+    source: str = "bundled",
+    cache_path: Path = DEFAULT_CACHE_PATH,
+    cache_ttl_hours: float = DEFAULT_CACHE_TTL_HOURS,
+) -> BrandIndex:
+    bundled = load_bundled_rules()
+    if source != "supabase" or supabase is None:
+        return BrandIndex(bundled)
+
+    bundled_hash = bundled_rules_hash()
+    rules = read_cached_rules(cache_path, cache_ttl_hours, bundled_hash)
+    if rules is not None:
+        logging.info(f"Loaded {len(rules)} brand rules from cache {cache_path.name}")
+        return BrandIndex(rules)
+
+    rules = merge_rules(bundled, load_supabase_rules(supabase))
+    write_cached_rules(cache_path, rules, bundled_hash)
+    logging.info(f"Loaded {len(rules)} brand rules ({len(bundled)} bundled) from supplier_brands")
+    return BrandIndex(rules)
+
+
+_default_index: BrandIndex | None = None
+
+
+def default_brand_index() -> BrandIndex:
+    global _default_index
+    if _default_index is None:
+        _default_index = BrandIndex(load_bundled_rules())
+    return _default_index
@@ -3,6 +3,10 @@ from dataclasses import dataclass
 
 from dotenv import load_dotenv
 
+JOB_PAGE_MODES = ("page_source", "http", "selenium")
+BRAND_SOURCES = ("bundled", "supabase")
+IMAGE_PROFILES = ("archive", "balanced", "fast")
+
 
 @dataclass(frozen=True)
 class Settings:
@@ -13,9 +17,33 @@ class Settings:
     supabase_key: str
     supabase_bucket: str
     page_delay_sec: float
+    job_list_page_url: str
+    workers: int
+    driver_restart_after: int
+    job_page_mode: str
+    batch_upsert: bool
+    upsert_chunk_size: int
+    async_writes: bool
+    async_max_in_flight: int
+    image_workers: int
+    image_encode_processes: int
+    image_queue_size: int
+    image_profile: str
+    image_max_dimension: int
+    image_variants: bool
+    content_addressed_storage: bool
+    http_pool_size: int
+    http_retries: int
+    http_per_host_limit: int
+    max_download_mb: int
+    push_metrics: bool
+    notes_dry_compare: bool
+    brand_source: str
+    brand_cache_ttl_hours: float
 
 
-def load_settings() -> Settings:
+def load_settings(require_credentials: bool = True) -> Settings:
+    """`require_credentials=False` is for offline replays, which never log in."""
     load_dotenv()
 
     settings = Settings(
@@ -29,6 +57,31 @@ def load_settings() -> Settings:
         ),
         supabase_bucket=os.getenv("SUPABASE_BUCKET") or "remnant-images",
         page_delay_sec=float(os.getenv("MORAWARE_PAGE_DELAY_SEC", "0.15")),
+        job_list_page_url=os.getenv("MORAWARE_JOB_LIST_PAGE_URL", "").strip(),
+        workers=int(os.getenv("MORAWARE_WORKERS", "1")),
+        driver_restart_after=int(os.getenv("MORAWARE_DRIVER_RESTART_AFTER", "3")),
+        job_page_mode=(os.getenv("MORAWARE_JOB_PAGE_MODE") or "page_source").strip().lower(),
+        batch_upsert=os.getenv("MORAWARE_BATCH_UPSERT", "false").lower() in {"1", "true", "yes"},
+        upsert_chunk_size=int(os.getenv("MORAWARE_UPSERT_CHUNK_SIZE", "200")),
+        async_writes=os.getenv("MORAWARE_ASYNC_WRITES", "false").lower() in {"1", "true", "yes"},
+        async_max_in_flight=int(os.getenv("MORAWARE_ASYNC_MAX_IN_FLIGHT", "8")),
+        image_workers=int(os.getenv("MORAWARE_IMAGE_WORKERS", "0")),
+        image_encode_processes=int(os.getenv("MORAWARE_IMAGE_ENCODE_PROCESSES") or os.cpu_count() or 1),
+        image_queue_size=int(os.getenv("MORAWARE_IMAGE_QUEUE_SIZE", "32")),
+        image_profile=(os.getenv("MORAWARE_IMAGE_PROFILE") or "archive").strip().lower(),
+        image_max_dimension=int(os.getenv("MORAWARE_IMAGE_MAX_DIMENSION") or 0),
+        image_variants=os.getenv("MORAWARE_IMAGE_VARIANTS", "false").lower() in {"1", "true", "yes"},
+        content_addressed_storage=(
+            os.getenv("MORAWARE_CONTENT_ADDRESSED_STORAGE", "false").lower() in {"1", "true", "yes"}
+        ),
+        http_pool_size=int(os.getenv("MORAWARE_HTTP_POOL_SIZE", "16")),
+        http_retries=int(os.getenv("MORAWARE_HTTP_RETRIES", "3")),
+        http_per_host_limit=int(os.getenv("MORAWARE_HTTP_PER_HOST_LIMIT", "8")),
+        max_download_mb=int(os.getenv("MORAWARE_MAX_DOWNLOAD_MB", "40")),
+        push_metrics=os.getenv("MORAWARE_PUSH_METRICS", "false").lower() in {"1", "true", "yes"},
+        notes_dry_compare=os.getenv("MORAWARE_NOTES_DRY_COMPARE", "true").lower() in {"1", "true", "yes"},
+        brand_source=(os.getenv("MORAWARE_BRAND_SOURCE") or "bundled").strip().lower(),
+        brand_cache_ttl_hours=float(os.getenv("MORAWARE_BRAND_CACHE_TTL_HOURS", "24")),
     )
 
     missing = []
@@ -43,7 +96,22 @@ def load_settings() -> Settings:
     if not settings.supabase_key:
         missing.append("SUPABASE_SERVICE_ROLE_KEY")
 
-    if missing:
+    if settings.job_page_mode not in JOB_PAGE_MODES:
+        raise RuntimeError(
+            "MORAWARE_JOB_PAGE_MODE must be one of: " + ", ".join(JOB_PAGE_MODES)
+        )
+
+    if settings.image_profile not in IMAGE_PROFILES:
+        raise RuntimeError(
+            "MORAWARE_IMAGE_PROFILE must be one of: " + ", ".join(IMAGE_PROFILES)
+        )
+
+    if settings.brand_source not in BRAND_SOURCES:
+        raise RuntimeError(
+            "MORAWARE_BRAND_SOURCE must be one of: " + ", ".join(BRAND_SOURCES)
+        )
+
+    if missing and require_credentials:
         raise RuntimeError(
             "Missing required env vars: " + ", ".join(missing)
         )
@@ -0,0 +1,101 @@
+"""
+Content-addressed remnant photo storage.
+
+With MORAWARE_CONTENT_ADDRESSED_STORAGE on, photos are stored once per
+content hash under `by-hash/ab/cd/<sha256>.<ext>` instead of once per remnant,
+so the same photo on several remnants (or re-uploaded after an id change) is
+neither transferred nor stored twice. Objects are never overwritten: an
+existence check runs before each upload. `collect_garbage` removes `by-hash/`
+objects no remnant points at any more, after the end-of-run reconciliation.
+"""
+
+import logging
+import threading
+
+from scrapers.remnant_scraper.utils import sha256_bytes
+
+CONTENT_PREFIX = "by-hash"
+GC_REMOVE_CHUNK_SIZE = 100
+
+
+def build_content_path(content_hash: str, ext: str) -> str:
+    safe_ext = (ext or "jpg").strip().lower().lstrip(".") or "jpg"
+    return f"{CONTENT_PREFIX}/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}.{safe_ext}"
+
+
+def is_content_path(path: str | None) -> bool:
+    return bool(path) and path.startswith(f"{CONTENT_PREFIX}/")
+
+
+class ContentStore:
+    def __init__(self, supabase, bucket: str):
+        self.supabase = supabase
+        self.bucket = bucket
+        # Paths known to exist, so repeated hashes in one run skip the check.
+        self._known: set[str] = set()
+        self._lock = threading.Lock()
+        self.uploaded = 0
+        self.deduplicated = 0
+
+    def exists(self, path: str) -> bool:
+        folder, _, name = path.rpartition("/")
+        entries = self.supabase.storage.from_(self.bucket).list(folder, {"limit": 1, "search": name})
+        return any(entry.get("name") == name for entry in entries or [])
+
+    def put(self, data: bytes, ext: str, content_type: str | None) -> tuple[str, int, int]:
+        """
+        Stores `data` under its content hash. Returns the object path, the
+        number of storage requests made and the bytes uploaded (0 when the
+        object already existed).
+        """
+        path = build_content_path(sha256_bytes(data), ext)
+        with self._lock:
+            if path in self._known:
+                self.deduplicated += 1
+                return path, 0, 0
+
+        requests_made = 1
+        if self.exists(path):
+            uploaded_bytes = 0
+        else:
+            requests_made += 1
+            try:
+                self.supabase.storage.from_(self.bucket).upload(
+                    path,
+                    data,
+                    {"content-type": content_type or "image/jpeg", "upsert": "false"},
+                )
+                uploaded_bytes = len(data)
+            except Exception as exc:
+                # Another worker stored the same bytes between check and upload.
+                if "duplicate" not in str(exc).lower() and "already exists" not in str(exc).lower():
+                    raise
+                uploaded_bytes = 0
+
+        with self._lock:
+            self._known.add(path)
+            if uploaded_bytes:
+                self.uploaded += 1
+            else:
+                self.deduplicated += 1
+        return path, requests_made, uploaded_bytes
+
+    def public_url(self, path: str) -> str:
+        return self.supabase.storage.from_(self.bucket).get_public_url(path)
+
+
+def collect_garbage(supabase, bucket: str, min_age_hours: float = 1.0) -> int:
+    """
+    Removes `by-hash/` objects that no remnant (deleted or not) references
+    through `image_path` or `image_variant_paths`. Returns how many were removed.
+    """
+    response = supabase.rpc(
+        "unreferenced_remnant_content_objects",
+        {"p_bucket": bucket, "p_min_age_hours": min_age_hours},
+    ).execute()
+    paths = [row["name"] for row in (response.data or []) if is_content_path(row.get("name"))]
+    for start in range(0, len(paths), GC_REMOVE_CHUNK_SIZE):
+        supabase.storage.from_(bucket).remove(paths[start:start + GC_REMOVE_CHUNK_SIZE])
+    if paths:
+        logging.info(f"Removed {len(paths)} unreferenced content-addressed photos")
+    return len(paths)
@@ -0,0 +1,309 @@
+"""
+In-memory stand-in for the supabase-py client, for offline replay runs.
+
+Covers the slice of the PostgREST query builder, RPCs and storage API that the
+remnant sync uses, and counts every call so a replay can report DB and
+storage requests per row. It is not a general PostgREST emulator: filters
+compare Python values, and `ilike` only understands `%` wildcards.
+"""
+
+import copy
+import fnmatch
+import threading
+from collections import Counter
+from dataclasses import dataclass
+
+from scrapers.remnant_scraper.content_store import is_content_path
+from scrapers.remnant_scraper.utils import now_iso_utc
+
+
+@dataclass
+class FakeResponse:
+    data: list | dict | None
+    count: int | None = None
+
+
+def _columns(columns: str) -> list[str] | None:
+    names = [name.strip() for name in (columns or "*").split(",") if name.strip()]
+    return None if "*" in names else names
+
+
+class FakeQuery:
+    def __init__(self, client: "FakeSupabase", table_name: str):
+        self.client = client
+        self.table_name = table_name
+        self.operation = "select"
+        self.columns: list[str] | None = None
+        self.payload = None
+        self.on_conflict: list[str] = []
+        self.ignore_duplicates = False
+        self.filters = []
+        self.order_by: tuple[str, bool] | None = None
+        self.row_range: tuple[int, int] | None = None
+        self.row_limit: int | None = None
+
+    # ---- Operations ----
+
+    def select(self, columns: str = "*", **_kwargs) -> "FakeQuery":
+        self.columns = _columns(columns)
+        return self
+
+    def insert(self, payload, **_kwargs) -> "FakeQuery":
+        self.operation, self.payload = "insert", payload
+        return self
+
+    def update(self, payload, **_kwargs) -> "FakeQuery":
+        self.operation, self.payload = "update", payload
+        return self
+
+    def upsert(self, payload, on_conflict: str = "id", ignore_duplicates: bool = False, **_kwargs) -> "FakeQuery":
+        self.operation, self.payload = "upsert", payload
+        self.on_conflict = _columns(on_conflict) or ["id"]
+        self.ignore_duplicates = ignore_duplicates
+        return self
+
+    # ---- Filters ----
+
+    def eq(self, column: str, value) -> "FakeQuery":
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def lt(self, column: str, value) -> "FakeQuery":
+        self.filters.append(lambda row: row.get(column) is not None and row.get(column) < value)
+        return self
+
+    def in_(self, column: str, values) -> "FakeQuery":
+        wanted = set(values)
+        self.filters.append(lambda row: row.get(column) in wanted)
+        return self
+
+    def ilike(self, column: str, pattern: str) -> "FakeQuery":
+        glob = pattern.lower().replace("%", "*")
+        self.filters.append(lambda row: fnmatch.fnmatchcase(str(row.get(column) or "").lower(), glob))
+        return self
+
+    def filter(self, column: str, operator: str, value) -> "FakeQuery":
+        negate = operator.startswith("not.")
+        operator = operator.removeprefix("not.")
+        if operator not in {"is", "eq"} or (operator == "is" and value != "null"):
+            raise NotImplementedError(f"FakeSupabase does not support filter '{operator}.{value}'")
+
+        def test(row: dict) -> bool:
+            if operator == "is":
+                matched = row.get(column) is None
+            else:
+                matched = str(row.get(column)) == str(value)
+            return matched != negate
+
+        self.filters.append(test)
+        return self
+
+    # ---- Modifiers ----
+
+    def order(self, column: str, desc: bool = False) -> "FakeQuery":
+        self.order_by = (column, desc)
+        return self
+
+    def range(self, start: int, end: int) -> "FakeQuery":
+        self.row_range = (start, end)
+        return self
+
+    def limit(self, count: int) -> "FakeQuery":
+        self.row_limit = count
+        return self
+
+    def execute(self) -> FakeResponse:
+        self.client.count_call(f"{self.table_name}.{self.operation}")
+        with self.client.lock:
+            rows = self.client.tables.setdefault(self.table_name, [])
+            if self.operation == "select":
+                result = self._select(rows)
+            elif self.operation == "insert":
+                result = [self.client.insert_row(self.table_name, row) for row in self._payload_rows()]
+            elif self.operation == "update":
+                result = []
+                for row in rows:
+                    if self._matches(row):
+                        row.update(copy.deepcopy(self.payload))
+                        result.append(row)
+            else:
+                result = self._upsert(rows)
+            return FakeResponse(copy.deepcopy(result), len(result))
+
+    def _payload_rows(self) -> list[dict]:
+        return self.payload if isinstance(self.payload, list) else [self.payload]
+
+    def _matches(self, row: dict) -> bool:
+        return all(test(row) for test in self.filters)
+
+    def _select(self, rows: list[dict]) -> list[dict]:
+        selected = [row for row in rows if self._matches(row)]
+        if self.order_by:
+            column, desc = self.order_by
+            selected.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=desc)
+        if self.row_range:
+            selected = selected[self.row_range[0]:self.row_range[1] + 1]
+        if self.row_limit is not None:
+            selected = selected[:self.row_limit]
+        if self.columns is None:
+            return selected
+        return [{column: row.get(column) for column in self.columns} for row in selected]
+
+    def _upsert(self, rows: list[dict]) -> list[dict]:
+        result = []
+        for payload in self._payload_rows():
+            key = tuple(payload.get(column) for column in self.on_conflict)
+            existing = next(
+                (row for row in rows if tuple(row.get(column) for column in self.on_conflict) == key),
+                None,
+            )
+            if existing is None:
+                result.append(self.client.insert_row(self.table_name, payload))
+            elif not self.ignore_duplicates:
+                existing.update(copy.deepcopy(payload))
+                result.append(existing)
+        return result
+
+
+class FakeBucket:
+    def __init__(self, client: "FakeSupabase", bucket: str):
+        self.client = client
+        self.bucket = bucket
+
+    @property
+    def objects(self) -> dict[str, dict]:
+        return self.client.objects.setdefault(self.bucket, {})
+
+    def upload(self, path: str, data: bytes, file_options: dict | None = None):
+        self.client.count_call("storage.upload")
+        options = file_options or {}
+        with self.client.lock:
+            if path in self.objects and str(options.get("upsert", "false")).lower() != "true":
+                raise RuntimeError(f"The resource already exists: {path}")
+            self.objects[path] = {
+                "size": len(data),
+                "content_type": options.get("content-type"),
+                "created_at": now_iso_utc(),
+            }
+        return {"Key": f"{self.bucket}/{path}"}
+
+    def remove(self, paths: list[str]) -> list[dict]:
+        self.client.count_call("storage.remove")
+        with self.client.lock:
+            return [{"name": path} for path in paths if self.objects.pop(path, None) is not None]
+
+    def get_public_url(self, path: str) -> str:
+        return f"{self.client.url}/storage/v1/object/public/{self.bucket}/{path}"
+
+    # Defined last: the name shadows the builtin for the rest of the class body.
+    def list(self, folder: str = "", options: dict | None = None) -> list[dict]:
+        self.client.count_call("storage.list")
+        options = options or {}
+        prefix = f"{folder.rstrip('/')}/" if folder else ""
+        search = options.get("search") or ""
+        with self.client.lock:
+            names = sorted(
+                path[len(prefix):]
+                for path in self.objects
+                if path.startswith(prefix) and "/" not in path[len(prefix):]
+            )
+        names = [name for name in names if search in name]
+        return [{"name": name} for name in names[:options.get("limit", 100)]]
+
+
+class FakeStorage:
+    def __init__(self, client: "FakeSupabase"):
+        self.client = client
+
+    def from_(self, bucket: str) -> FakeBucket:
+        return FakeBucket(self.client, bucket)
+
+
+class FakeRpc:
+    def __init__(self, client: "FakeSupabase", name: str, params: dict):
+        self.client = client
+        self.name = name
+        self.params = params or {}
+
+    def execute(self) -> FakeResponse:
+        self.client.count_call(f"rpc.{self.name}")
+        handler = getattr(self.client, f"rpc_{self.name}", None)
+        if handler is None:
+            raise NotImplementedError(f"FakeSupabase has no RPC '{self.name}'")
+        with self.client.lock:
+            return FakeResponse(handler(**self.params))
+
+
+class FakeSupabase:
+    def __init__(self, url: str = "http://replay.local", tables: dict[str, list[dict]] | None = None):
+        self.url = url.rstrip("/")
+        self.lock = threading.RLock()
+        self.tables: dict[str, list[dict]] = {}
+        self.objects: dict[str, dict[str, dict]] = {}
+        self.next_ids: Counter = Counter()
+        self.calls: Counter = Counter()
+        self.storage = FakeStorage(self)
+        for table_name, rows in (tables or {}).items():
+            for row in rows:
+                self.insert_row(table_name, row)
+
+    def count_call(self, name: str) -> None:
+        with self.lock:
+            self.calls[name] += 1
+
+    def db_calls(self) -> int:
+        return sum(count for name, count in self.calls.items() if not name.startswith("storage."))
+
+    def storage_calls(self) -> int:
+        return sum(count for name, count in self.calls.items() if name.startswith("storage."))
+
+    def insert_row(self, table_name: str, payload: dict) -> dict:
+        rows = self.tables.setdefault(table_name, [])
+        row = copy.deepcopy(payload)
+        if row.get("id") is None:
+            self.next_ids[table_name] += 1
+            row["id"] = self.next_ids[table_name]
+        else:
+            self.next_ids[table_name] = max(self.next_ids[table_name], row["id"])
+        rows.append(row)
+        return row
+
+    def table(self, table_name: str) -> FakeQuery:
+        return FakeQuery(self, table_name)
+
+    def rpc(self, name: str, params: dict | None = None) -> FakeRpc:
+        return FakeRpc(self, name, params)
+
+    # ---- RPCs (sql/*.sql twins) ----
+
+    def rpc_reconcile_moraware_remnants(
+        self,
+        p_company_id: int,
+        p_run_started_at: str,
+        p_seen_remnant_ids: list[int],
+        p_soft_delete: bool,
+    ) -> list[dict]:
+        seen = set(p_seen_remnant_ids)
+        touched = deleted = 0
+        deleted_at = now_iso_utc()
+        for row in self.tables.get("remnants", []):
+            if row.get("company_id") != p_company_id or row.get("moraware_remnant_id") is None:
+                continue
+            if row["moraware_remnant_id"] in seen:
+                row["last_seen_at"] = p_run_started_at
+                touched += 1
+            elif p_soft_delete and row.get("deleted_at") is None and (row.get("last_seen_at") or "") < p_run_started_at:
+                row["deleted_at"] = deleted_at
+                deleted += 1
+        return [{"touched_count": touched, "deleted_count": deleted}]
+
+    def rpc_unreferenced_remnant_content_objects(self, p_bucket: str, p_min_age_hours: float = 1.0) -> list[dict]:
+        referenced = set()
+        for row in self.tables.get("remnants", []):
+            referenced.add(row.get("image_path"))
+            referenced.update((row.get("image_variant_paths") or {}).values())
+        return [
+            {"name": path}
+            for path in self.objects.get(p_bucket, {})
+            if is_content_path(path) and path not in referenced
+        ]
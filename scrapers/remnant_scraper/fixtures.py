@@ -0,0 +1,112 @@
+"""
+Recorded Moraware fixtures for offline sync runs.
+
+`python3 -m scrapers.remnant_scraper --record DIR` saves what the live sync
+reads from Moraware into DIR: the rows of every job list page, the HTML of
+every job page and the bytes of every photo. `replay.py` serves the same
+directory back to the sync without a browser, a login or the network.
+
+Layout:
+  DIR/job_list.json           [[job URL, row text], ...] per list page
+  DIR/jobs/<key>.html         job page HTML
+  DIR/images/<key>.bin        photo bytes
+  DIR/images/<key>.json       photo URL, status and response headers
+"""
+
+import json
+import threading
+from pathlib import Path
+
+from scrapers.remnant_scraper.utils import now_iso_utc, sha256_bytes
+
+RECORDED_HEADERS = ("Content-Type", "Content-Length", "ETag", "Last-Modified")
+
+
+def fixture_key(url: str) -> str:
+    return sha256_bytes(url.encode("utf-8"))[:32]
+
+
+class FixtureStore:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._list_pages: list[list[list[str]]] = []
+
+    def _path(self, folder: str, url: str, suffix: str) -> Path:
+        return self.root / folder / f"{fixture_key(url)}{suffix}"
+
+    def _write(self, path: Path, data: bytes | str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(data, bytes):
+            path.write_bytes(data)
+        else:
+            path.write_text(data, encoding="utf-8")
+
+    # ---- Job list ----
+
+    def save_job_list_page(self, page_num: int, rows: list[tuple[str, str]]) -> None:
+        with self._lock:
+            del self._list_pages[page_num - 1:]
+            self._list_pages.append([[href, text] for href, text in rows])
+            self._write(
+                self.root / "job_list.json",
+                json.dumps({"recorded_at": now_iso_utc(), "pages": self._list_pages}, indent=2),
+            )
+
+    def load_job_list_pages(self) -> list[list[tuple[str, str]]]:
+        path = self.root / "job_list.json"
+        if not path.exists():
+            raise RuntimeError(f"No recorded job list in {self.root}; record one with --record first")
+        pages = json.loads(path.read_text(encoding="utf-8"))["pages"]
+        return [[(href, text) for href, text in page] for page in pages]
+
+    # ---- Job pages ----
+
+    def save_job_page(self, job_url: str, html: str) -> None:
+        self._write(self._path("jobs", job_url, ".html"), html)
+
+    def load_job_page(self, job_url: str) -> str | None:
+        path = self._path("jobs", job_url, ".html")
+        return path.read_text(encoding="utf-8") if path.exists() else None
+
+    # ---- Photos ----
+
+    def save_image(self, url: str, status_code: int, headers, data: bytes) -> None:
+        meta = {
+            "url": url,
+            "status_code": status_code,
+            "headers": {name: headers[name] for name in RECORDED_HEADERS if headers.get(name)},
+        }
+        self._write(self._path("images", url, ".bin"), data)
+        self._write(self._path("images", url, ".json"), json.dumps(meta, indent=2))
+
+    def load_image(self, url: str) -> tuple[dict, bytes] | None:
+        meta_path = self._path("images", url, ".json")
+        if not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        return meta, self._path("images", url, ".bin").read_bytes()
+
+
+class RecordingTransport:
+    """
+    Wraps a `Transport` and saves every photo it downloads. Conditional
+    headers are dropped while recording so a 304 never leaves a photo out of
+    the fixture set.
+    """
+
+    def __init__(self, transport, fixtures: FixtureStore):
+        self.transport = transport
+        self.fixtures = fixtures
+
+    def update_cookies(self, cookies: list[dict]) -> bool:
+        return self.transport.update_cookies(cookies)
+
+    def get(self, url: str, **kwargs):
+        return self.transport.get(url, **kwargs)
+
+    def download(self, url: str, headers: dict | None = None):
+        response, data = self.transport.download(url)
+        if response.status_code == 200:
+            self.fixtures.save_image(url, response.status_code, response.headers, data)
+        return response, data
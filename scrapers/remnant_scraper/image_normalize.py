@@ -0,0 +1,112 @@
+"""
+Remnant photo normalization: one bounded decode, then WebP encodes.
+
+JPEGs are decoded with Pillow's `draft()` straight to the smallest DCT scale
+that still covers `max_dimension`, so a 12MP phone photo never lands in memory
+at full size when a smaller output is wanted. Responsive variants (thumb,
+medium) are cut from that same decoded frame, largest first, so one download
+costs one decode however many sizes are uploaded. Inputs that would still
+decode to more than `MAX_DECODE_PIXELS` (the `archive` profile keeps original
+sizes, and only JPEGs can be drafted) are rejected before any pixels load.
+"""
+
+from dataclasses import dataclass, field
+from io import BytesIO
+
+from PIL import Image
+
+
+@dataclass(frozen=True)
+class EncoderProfile:
+    quality: int
+    method: int
+    # Longest edge of the full-size output; 0 keeps the original dimensions.
+    max_dimension: int = 0
+
+
+ENCODER_PROFILES = {
+    # What the sync has always stored: original size, slowest/smallest WebP.
+    "archive": EncoderProfile(quality=86, method=6),
+    "balanced": EncoderProfile(quality=84, method=4, max_dimension=2560),
+    "fast": EncoderProfile(quality=80, method=2, max_dimension=1920),
+}
+DEFAULT_PROFILE = "archive"
+
+# About 190MB as RGB; comfortably above a 48MP phone photo.
+MAX_DECODE_PIXELS = 64_000_000
+
+# Longest edge per responsive variant, largest first.
+VARIANT_SIZES = (
+    ("medium", 1200),
+    ("thumb", 400),
+)
+
+
+class ImageTooLargeError(ValueError):
+    """The image would decode to more than `MAX_DECODE_PIXELS`."""
+
+
+@dataclass
+class NormalizedImage:
+    data: bytes
+    content_type: str
+    ext: str
+    variants: dict[str, bytes] = field(default_factory=dict)
+
+
+def _fits(size: tuple[int, int], max_dimension: int) -> bool:
+    return not max_dimension or max(size) <= max_dimension
+
+
+def decode_bounded(image: Image.Image, max_dimension: int) -> Image.Image:
+    """Decodes `image` as RGB no larger than `max_dimension` on its longest edge."""
+    if max_dimension and image.format == "JPEG":
+        # Picks the smallest 1/2, 1/4 or 1/8 DCT scale that still covers the box.
+        image.draft("RGB", (max_dimension, max_dimension))
+    width, height = image.size
+    if width * height > MAX_DECODE_PIXELS:
+        raise ImageTooLargeError(
+            f"{width}x{height} image exceeds the {MAX_DECODE_PIXELS} pixel decode limit"
+        )
+    if not _fits(image.size, max_dimension):
+        image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS, reducing_gap=3.0)
+    return image.convert("RGB")
+
+
+def encode_webp(image: Image.Image, profile: EncoderProfile) -> bytes:
+    output = BytesIO()
+    image.save(output, format="WEBP", quality=profile.quality, method=profile.method)
+    return output.getvalue()
+
+
+def normalize_image(
+    data: bytes,
+    content_type: str | None,
+    profile: EncoderProfile = ENCODER_PROFILES[DEFAULT_PROFILE],
+    variants: bool = False,
+) -> NormalizedImage:
+    """
+    Re-encodes most downloaded images into WebP. Animated GIFs are left alone
+    so they do not lose animation unexpectedly.
+    """
+    normalized_type = (content_type or "").lower()
+
+    try:
+        opened = Image.open(BytesIO(data))
+    except Image.DecompressionBombError as exc:
+        raise ImageTooLargeError(str(exc)) from exc
+    with opened as image:
+        is_animated = bool(getattr(image, "is_animated", False))
+        if is_animated and normalized_type == "image/gif":
+            return NormalizedImage(data, "image/gif", "gif")
+
+        frame = decode_bounded(image, profile.max_dimension)
+
+    result = NormalizedImage(encode_webp(frame, profile), "image/webp", "webp")
+    if variants:
+        for name, max_dimension in VARIANT_SIZES:
+            if not _fits(frame.size, max_dimension):
+                # In place: each larger size has already been encoded.
+                frame.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            result.variants[name] = encode_webp(frame, profile)
+    return result
@@ -0,0 +1,293 @@
+"""
+Remnant photo sync: download -> WebP encode -> storage upload.
+
+`sync_remnant_photo` runs the whole photo step for one remnant and returns the
+columns to write back, so the sync can either call it inline on the Selenium
+thread or hand jobs to `ImagePipeline`. The pipeline downloads and uploads on a
+thread pool and runs `normalize_image` on a process pool, since the WebP
+encoder is CPU-bound and holds the GIL. A bounded semaphore gives the crawl
+back-pressure once `max_pending` photos are in flight.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from scrapers.remnant_scraper.content_store import ContentStore
+from scrapers.remnant_scraper.image_normalize import ImageTooLargeError, NormalizedImage, normalize_image
+from scrapers.remnant_scraper.metrics import SyncMetrics
+from scrapers.remnant_scraper.transport import Transport
+from scrapers.remnant_scraper.utils import (
+    build_conditional_headers,
+    extract_source_validators,
+    infer_extension,
+    now_iso_utc,
+    sha256_bytes,
+)
+
+
+@dataclass
+class ImageJob:
+    remnant_id: int
+    full_url: str
+    existing_row: dict
+    job_url: str | None = None
+    cookies: list[dict] = field(default_factory=list)
+
+
+@dataclass
+class PhotoResult:
+    remnant_id: int
+    outcome: str
+    columns: dict | None = None
+    downloaded_bytes: int = 0
+
+
+def build_storage_path(kind: str, identifier: int, ext: str, variant: str | None = None) -> str:
+    safe_ext = (ext or "jpg").strip().lower().lstrip(".") or "jpg"
+    suffix = f"_{variant}" if variant else ""
+    return f"remnant_{identifier}{suffix}.{safe_ext}"
+
+
+def sync_remnant_photo(
+    job: ImageJob,
+    transport: Transport,
+    supabase,
+    bucket: str,
+    *,
+    encode=normalize_image,
+    stats: SyncMetrics | None = None,
+    variants: bool = False,
+    content_store: ContentStore | None = None,
+) -> PhotoResult:
+    """
+    Downloads, re-encodes and uploads one remnant photo. Returns the outcome
+    plus any remnant columns that need writing; the caller owns the DB write.
+    `encode(data, content_type)` returns a `NormalizedImage`; with `variants`
+    its thumb/medium renditions are uploaded next to the full image. With a
+    `content_store`, objects go to shared `by-hash/` paths instead.
+    """
+    remnant_id = job.remnant_id
+    full_url = job.full_url
+    existing_row = job.existing_row or {}
+    # Photos synced before variants were turned on still need them once. GIFs
+    # and failed encodes store `{}` so they are not retried on every run.
+    needs_variants = variants and existing_row.get("image_variants") is None
+
+    logging.info(f"Remnant #{remnant_id}: downloading image bytes")
+    started = time.monotonic()
+    # A 304 would skip the backfill, so rows still missing variants download unconditionally.
+    img_resp, img_bytes = transport.download(
+        full_url,
+        headers={} if needs_variants else build_conditional_headers(existing_row, full_url),
+    )
+    if stats:
+        stats.add(
+            "image_download",
+            time.monotonic() - started,
+            requests=1,
+            bytes_transferred=len(img_bytes),
+        )
+    if img_resp.status_code == 304:
+        logging.info(f"Remnant #{remnant_id}: photo not modified upstream, skipping download")
+        return PhotoResult(remnant_id, "not_modified")
+    img_resp.raise_for_status()
+    original_content_type = (img_resp.headers.get("Content-Type") or "").split(";")[0].strip()
+
+    downloaded_bytes = len(img_bytes)
+    source_validators = extract_source_validators(img_resp, img_bytes)
+    validators_changed = any(
+        existing_row.get(column) != value for column, value in source_validators.items()
+    )
+    if (
+        existing_row.get("photo_source_hash") == source_validators["photo_source_hash"]
+        and existing_row.get("photo_hash")
+        and existing_row.get("image")
+        and not needs_variants
+    ):
+        logging.info(f"Remnant #{remnant_id}: source bytes unchanged, skipping re-encode")
+        return PhotoResult(
+            remnant_id,
+            "same_source",
+            source_validators if validators_changed else None,
+            downloaded_bytes=downloaded_bytes,
+        )
+
+    started = time.monotonic()
+    try:
+        normalized = encode(img_bytes, original_content_type)
+        logging.info(
+            f"Remnant #{remnant_id}: normalized image to '{normalized.content_type or original_content_type or 'image/jpeg'}'"
+        )
+    except ImageTooLargeError:
+        # The original bytes are just as oversized, so nothing is uploaded.
+        raise
+    except Exception as normalize_exc:
+        logging.warning(
+            f"Remnant #{remnant_id}: image normalization failed, uploading original bytes instead ({normalize_exc})"
+        )
+        normalized = NormalizedImage(
+            img_bytes,
+            original_content_type,
+            infer_extension(full_url, original_content_type),
+        )
+    img_bytes, content_type, ext = normalized.data, normalized.content_type, normalized.ext
+    if stats:
+        stats.add("image_encode", time.monotonic() - started)
+
+    new_photo_hash = sha256_bytes(img_bytes)
+    logging.info(f"Remnant #{remnant_id}: photo_hash={new_photo_hash[:12]}...")
+
+    if existing_row.get("photo_hash") == new_photo_hash and existing_row.get("image") and not needs_variants:
+        logging.info(f"Remnant #{remnant_id}: photo unchanged, skipping upload")
+        return PhotoResult(
+            remnant_id,
+            "same_hash",
+            source_validators if validators_changed else None,
+            downloaded_bytes=downloaded_bytes,
+        )
+
+    def store(data: bytes, variant: str | None = None) -> tuple[str, int, int]:
+        if content_store:
+            return content_store.put(data, ext, content_type)
+        path = build_storage_path("remnant", remnant_id, ext, variant=variant)
+        supabase.storage.from_(bucket).upload(
+            path,
+            data,
+            {"content-type": content_type or "image/jpeg", "upsert": "true"},
+        )
+        return path, 1, len(data)
+
+    started = time.monotonic()
+    image_path, upload_requests, uploaded_bytes = store(img_bytes)
+    logging.info(
+        f"Remnant #{remnant_id}: stored in bucket='{bucket}' as '{image_path}' "
+        f"content_type='{content_type or 'image/jpeg'}'"
+        + ("" if uploaded_bytes else " (already stored)")
+    )
+    variant_urls = {}
+    variant_paths = {}
+    for variant_name, variant_bytes in normalized.variants.items():
+        variant_path, variant_requests, variant_uploaded = store(variant_bytes, variant_name)
+        upload_requests += variant_requests
+        uploaded_bytes += variant_uploaded
+        variant_paths[variant_name] = variant_path
+        variant_urls[variant_name] = supabase.storage.from_(bucket).get_public_url(variant_path)
+    if stats:
+        stats.add(
+            "image_upload",
+            time.monotonic() - started,
+            requests=upload_requests,
+            bytes_transferred=uploaded_bytes,
+        )
+
+    public_url = supabase.storage.from_(bucket).get_public_url(image_path)
+    columns = {
+        "photo_hash": new_photo_hash,
+        "image_path": image_path,
+        "image": public_url,
+        "photo_synced_at": now_iso_utc(),
+        "updated_at": now_iso_utc(),
+        **source_validators,
+    }
+    if variants:
+        columns["image_variants"] = variant_urls
+        if content_store:
+            # Storage GC matches by-hash objects on these paths, never on the URLs.
+            columns["image_variant_paths"] = variant_paths
+    return PhotoResult(remnant_id, "uploaded", columns, downloaded_bytes=downloaded_bytes)
+
+
+class ImagePipeline:
+    def __init__(
+        self,
+        supabase,
+        bucket: str,
+        *,
+        workers: int,
+        encode_processes: int,
+        max_pending: int,
+        stats: SyncMetrics | None = None,
+        encode=normalize_image,
+        variants: bool = False,
+        content_store: ContentStore | None = None,
+        transport: Transport | None = None,
+        on_result=None,
+        on_failure=None,
+    ):
+        """
+        With `on_result(job, result)` / `on_failure(job, error)`, each photo is
+        reported from its worker thread as it finishes instead of being kept
+        for `drain()`.
+        """
+        self.supabase = supabase
+        self.transport = transport or Transport(pool_size=max(1, workers))
+        self.bucket = bucket
+        # Runs in the process pool, so it must be picklable (a module-level
+        # function or a functools.partial of one).
+        self.encode = encode
+        self.variants = variants
+        self.content_store = content_store
+        self.stats = stats or SyncMetrics()
+        self.on_result = on_result
+        self.on_failure = on_failure
+        self.results: list[PhotoResult] = []
+        self.failures: list[tuple[ImageJob, Exception]] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._io_pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="remnant-photo")
+        self._encode_pool = ProcessPoolExecutor(max_workers=max(1, encode_processes))
+
+    def _encode(self, data: bytes, content_type: str | None):
+        return self._encode_pool.submit(self.encode, data, content_type).result()
+
+    def _run(self, job: ImageJob) -> None:
+        try:
+            self.transport.update_cookies(job.cookies)
+            result = sync_remnant_photo(
+                job,
+                self.transport,
+                self.supabase,
+                self.bucket,
+                encode=self._encode,
+                stats=self.stats,
+                variants=self.variants,
+                content_store=self.content_store,
+            )
+        except Exception as exc:
+            logging.error(f"Remnant #{job.remnant_id}: photo pipeline failed: {exc}", exc_info=True)
+            if self.on_failure:
+                self.on_failure(job, exc)
+            else:
+                with self._lock:
+                    self.failures.append((job, exc))
+        else:
+            if self.on_result:
+                self.on_result(job, result)
+            else:
+                with self._lock:
+                    self.results.append(result)
+        finally:
+            self._slots.release()
+
+    def submit(self, job: ImageJob) -> None:
+        """Blocks the caller while `max_pending` photos are already in flight."""
+        self._slots.acquire()
+        try:
+            self._io_pool.submit(self._run, job)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def drain(self) -> tuple[list[PhotoResult], list[tuple[ImageJob, Exception]]]:
+        """Waits for every queued photo and shuts both pools down."""
+        self._io_pool.shutdown(wait=True)
+        self._encode_pool.shutdown(wait=True)
+        logging.info(f"Image pipeline drained: {self.stats.summary() or 'no work'}")
+        return self.results, self.failures
+
+    def close(self) -> None:
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._encode_pool.shutdown(wait=False, cancel_futures=True)
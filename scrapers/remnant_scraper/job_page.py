@@ -0,0 +1,131 @@
+"""
+Moraware job page readers.
+
+`read_job_page` walks the files table through WebDriver, one round trip per
+row and cell. `parse_job_page_html` reads the same data from one HTML snapshot
+(`driver.page_source`, or the page fetched with the Selenium cookies), which
+keeps Selenium out of the per-row path entirely.
+"""
+
+import re
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Comment, NavigableString
+from selenium.webdriver.common.by import By
+
+REMNANT_ID_PATTERN = re.compile(r"#\d+")
+# Elements that start a new line in WebDriver's rendered `.text`.
+LINE_BREAK_TAGS = {"br", "div", "p", "li", "tr", "table"}
+
+
+@dataclass
+class FileRow:
+    index: int
+    description: str = ""
+    download_href: str | None = None
+    has_download_link: bool = False
+    error: str | None = None
+
+
+@dataclass
+class JobPage:
+    url: str
+    title: str = ""
+    has_files_table: bool = False
+    file_rows: list[FileRow] = field(default_factory=list)
+    # Job notes as rendered into the page, when the edit form ships with it.
+    job_desc: str | None = None
+
+
+def collapse_whitespace(value: str | None) -> str:
+    return " ".join((value or "").split())
+
+
+def cell_text(td) -> str:
+    """
+    A table cell's text as WebDriver's `.text` renders it: <br> and block
+    elements break lines, other whitespace collapses within each line.
+    """
+    pieces = []
+    for node in td.descendants:
+        if isinstance(node, Comment):
+            continue
+        if isinstance(node, NavigableString):
+            pieces.append(re.sub(r"\s+", " ", str(node)))
+        elif node.name in LINE_BREAK_TAGS:
+            pieces.append("\n")
+    lines = (" ".join(line.split()) for line in "".join(pieces).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def read_job_page(driver, job_url: str) -> JobPage:
+    """Reads the files table element by element from the live browser."""
+    page = JobPage(url=job_url, title=driver.title or "", has_files_table=True)
+    job_desc_fields = driver.find_elements(By.NAME, "jobDesc")
+    if job_desc_fields:
+        page.job_desc = job_desc_fields[0].get_attribute("value") or ""
+    for idx, row in enumerate(driver.find_elements(By.CSS_SELECTOR, "#FilesScroll1Body tr")):
+        file_row = FileRow(index=idx)
+        page.file_rows.append(file_row)
+        try:
+            tds = row.find_elements(By.TAG_NAME, "td")
+            if len(tds) < 2:
+                continue
+
+            for td in tds:
+                text = (td.text or "").strip()
+                if REMNANT_ID_PATTERN.search(text):
+                    file_row.description = text
+                    break
+            if not file_row.description:
+                continue
+
+            download_links = tds[1].find_elements(By.TAG_NAME, "a")
+            if download_links:
+                file_row.has_download_link = True
+                file_row.download_href = download_links[0].get_attribute("href")
+        except Exception as exc:
+            file_row.error = str(exc)
+    return page
+
+
+def parse_job_page_html(html: str, job_url: str) -> JobPage:
+    """Parses a job page HTML snapshot into the same shape as `read_job_page`."""
+    soup = BeautifulSoup(html or "", "html.parser")
+    title_node = soup.find("title")
+    page = JobPage(url=job_url, title=collapse_whitespace(title_node.get_text() if title_node else ""))
+    job_desc_field = soup.find("textarea", attrs={"name": "jobDesc"})
+    if job_desc_field is not None:
+        # Match the textarea's DOM value: CRLF folded, first newline dropped.
+        job_desc = job_desc_field.get_text().replace("\r\n", "\n")
+        page.job_desc = job_desc[1:] if job_desc.startswith("\n") else job_desc
+
+    files_table = soup.find(id="FilesScroll1Body")
+    if not files_table:
+        return page
+
+    page.has_files_table = True
+    for idx, row in enumerate(files_table.find_all("tr")):
+        file_row = FileRow(index=idx)
+        page.file_rows.append(file_row)
+
+        tds = row.find_all("td")
+        if len(tds) < 2:
+            continue
+
+        for td in tds:
+            text = cell_text(td)
+            if REMNANT_ID_PATTERN.search(text):
+                file_row.description = text
+                break
+        if not file_row.description:
+            continue
+
+        download_link = tds[1].find("a")
+        if download_link:
+            file_row.has_download_link = True
+            href = (download_link.get("href") or "").strip()
+            # Selenium's get_attribute("href") returns the resolved URL; match it.
+            file_row.download_href = urljoin(job_url, href) if href else None
+    return page
@@ -0,0 +1,250 @@
+"""
+In-memory lookup indexes for the Moraware remnant sync.
+
+The sync used to resolve materials, thicknesses, finishes, suppliers, brands,
+stone products and parent slabs with one PostgREST round trip per file row.
+`LookupCache` loads those tables once at startup, answers lookups from memory
+and only talks to Supabase on a cache miss. Writes that do not need an id back
+(supplier brands, stone product renames) are queued and flushed in batches.
+The cache is shared by the sync's workers; callers hold `lock` around lookups
+and flushes.
+"""
+
+import logging
+import threading
+
+LOOKUP_TABLES = ("materials", "thicknesses", "finishes", "suppliers")
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_FLUSH_SIZE = 200
+
+
+def normalize_lookup_name(value: str | None) -> str:
+    """Matches the case-insensitive `ilike` lookups the sync used before."""
+    return (value or "").strip().lower()
+
+
+def normalize_catalog_name(value: str | None) -> str:
+    """Python twin of `public.normalize_catalog_name` used by stone_products."""
+    return " ".join((value or "").strip().lower().split())
+
+
+def fetch_all_rows(supabase, table_name: str, columns: str, page_size: int = DEFAULT_PAGE_SIZE) -> list[dict]:
+    """Reads a whole table through PostgREST, paging past the max-rows cap."""
+    rows: list[dict] = []
+    start = 0
+    while True:
+        page = (
+            supabase.table(table_name)
+            .select(columns)
+            .order("id")
+            .range(start, start + page_size - 1)
+            .execute()
+        )
+        page_rows = page.data or []
+        rows.extend(page_rows)
+        if len(page_rows) < page_size:
+            return rows
+        start += page_size
+
+
+class LookupCache:
+    def __init__(self, supabase, flush_size: int = DEFAULT_FLUSH_SIZE):
+        self.supabase = supabase
+        self.flush_size = flush_size
+        self.lock = threading.RLock()
+        self.lookup_ids: dict[str, dict[str, int]] = {table: {} for table in LOOKUP_TABLES}
+        self.supplier_brands: set[tuple[int, str]] = set()
+        self.stone_products_by_name: dict[tuple[int, str], dict] = {}
+        self.stone_products_by_material: dict[int, list[dict]] = {}
+        self.slab_ids_by_product: dict[int, list[int]] = {}
+        self.pending_supplier_brands: dict[tuple[int, str], dict] = {}
+        self.pending_stone_product_updates: dict[int, dict] = {}
+        self.db_reads = 0
+        self.db_writes = 0
+
+    def preload(self) -> "LookupCache":
+        for table_name in LOOKUP_TABLES:
+            index = self.lookup_ids[table_name]
+            for row in fetch_all_rows(self.supabase, table_name, "id,name"):
+                # Keep the first (lowest id) row per name, like `.limit(1)` did.
+                index.setdefault(normalize_lookup_name(row.get("name")), row["id"])
+            self.db_reads += 1
+
+        for row in fetch_all_rows(self.supabase, "supplier_brands", "id,supplier_id,brand_name"):
+            self.supplier_brands.add((row["supplier_id"], normalize_lookup_name(row.get("brand_name"))))
+        self.db_reads += 1
+
+        for row in fetch_all_rows(
+            self.supabase,
+            "stone_products",
+            "id,material_id,brand_name,stone_name,display_name,normalized_name",
+        ):
+            self._index_stone_product(row)
+        self.db_reads += 1
+
+        for row in fetch_all_rows(self.supabase, "slabs", "id,stone_product_id"):
+            stone_product_id = row.get("stone_product_id")
+            if stone_product_id:
+                self.slab_ids_by_product.setdefault(stone_product_id, []).append(row["id"])
+        self.db_reads += 1
+
+        logging.info(
+            "Preloaded lookups: %s",
+            ", ".join(
+                [f"{table}={len(self.lookup_ids[table])}" for table in LOOKUP_TABLES]
+                + [
+                    f"supplier_brands={len(self.supplier_brands)}",
+                    f"stone_products={len(self.stone_products_by_name)}",
+                    f"slab_products={len(self.slab_ids_by_product)}",
+                ]
+            ),
+        )
+        return self
+
+    def _index_stone_product(self, row: dict) -> None:
+        normalized_name = row.get("normalized_name") or normalize_catalog_name(row.get("display_name"))
+        self.stone_products_by_name.setdefault((row["material_id"], normalized_name), row)
+        self.stone_products_by_material.setdefault(row["material_id"], []).append(row)
+
+    def get_or_create_lookup_id(self, table_name: str, name: str) -> int:
+        cleaned_name = (name or "").strip() or "Other"
+        index = self.lookup_ids[table_name]
+        key = normalize_lookup_name(cleaned_name)
+        if key in index:
+            return index[key]
+
+        inserted = (
+            self.supabase.table(table_name)
+            .insert({"name": cleaned_name, "active": True})
+            .execute()
+        )
+        self.db_writes += 1
+        inserted_row = inserted.data[0] if inserted.data else None
+        if not inserted_row:
+            raise RuntimeError(f"Failed to create {table_name} row for '{cleaned_name}'")
+        index[key] = inserted_row["id"]
+        return inserted_row["id"]
+
+    def get_or_create_supplier_id(self, name: str | None) -> int | None:
+        cleaned_name = (name or "").strip()
+        if not cleaned_name:
+            return None
+        return self.get_or_create_lookup_id("suppliers", cleaned_name)
+
+    def ensure_supplier_brand(self, supplier_id: int | None, brand_name: str | None, material_id: int) -> None:
+        cleaned_brand = (brand_name or "").strip()
+        if not supplier_id or not cleaned_brand:
+            return
+
+        key = (supplier_id, normalize_lookup_name(cleaned_brand))
+        if key in self.supplier_brands:
+            return
+
+        self.supplier_brands.add(key)
+        self.pending_supplier_brands[key] = {
+            "supplier_id": supplier_id,
+            "brand_name": cleaned_brand,
+            "material_id": material_id,
+        }
+        if len(self.pending_supplier_brands) >= self.flush_size:
+            self.flush()
+
+    def get_or_create_stone_product_id(
+        self,
+        *,
+        material_id: int,
+        display_name: str,
+        stone_name: str,
+        brand_name: str | None,
+    ) -> int:
+        normalized_name = normalize_catalog_name(display_name)
+        normalized_stone_name = normalize_catalog_name(stone_name)
+        normalized_brand_name = normalize_catalog_name(brand_name)
+
+        existing_row = self.stone_products_by_name.get((material_id, normalized_name))
+        if not existing_row and normalized_stone_name:
+            matching_rows = []
+            for row in self.stone_products_by_material.get(material_id, []):
+                if normalize_catalog_name(row.get("stone_name")) != normalized_stone_name:
+                    continue
+                row_brand_name = normalize_catalog_name(row.get("brand_name"))
+                if normalized_brand_name:
+                    if row_brand_name and row_brand_name != normalized_brand_name:
+                        continue
+                matching_rows.append(row)
+
+            if len(matching_rows) == 1:
+                existing_row = matching_rows[0]
+
+        if existing_row:
+            update_payload = {}
+            if brand_name and not existing_row.get("brand_name"):
+                update_payload["brand_name"] = brand_name
+            if stone_name and existing_row.get("stone_name") != stone_name:
+                update_payload["stone_name"] = stone_name
+            if display_name and existing_row.get("display_name") != display_name:
+                update_payload["display_name"] = display_name
+            if update_payload:
+                existing_row.update(update_payload)
+                self.pending_stone_product_updates.setdefault(existing_row["id"], {}).update(update_payload)
+                if len(self.pending_stone_product_updates) >= self.flush_size:
+                    self.flush()
+            return existing_row["id"]
+
+        inserted = (
+            self.supabase.table("stone_products")
+            .insert(
+                {
+                    "material_id": material_id,
+                    "display_name": display_name,
+                    "stone_name": stone_name,
+                    "brand_name": brand_name,
+                    "active": True,
+                }
+            )
+            .execute()
+        )
+        self.db_writes += 1
+        inserted_row = inserted.data[0] if inserted.data else None
+        if not inserted_row:
+            raise RuntimeError(f"Failed to create stone product for '{display_name}'")
+        self._index_stone_product(
+            {
+                "id": inserted_row["id"],
+                "material_id": material_id,
+                "brand_name": brand_name,
+                "stone_name": stone_name,
+                "display_name": display_name,
+                "normalized_name": inserted_row.get("normalized_name") or normalized_name,
+            }
+        )
+        return inserted_row["id"]
+
+    def find_parent_slab_id(self, stone_product_id: int | None) -> int | None:
+        if not stone_product_id:
+            return None
+        slab_ids = self.slab_ids_by_product.get(stone_product_id) or []
+        if len(slab_ids) == 1:
+            return slab_ids[0]
+        return None
+
+    def flush(self) -> None:
+        """Writes queued supplier brands and stone product renames."""
+        if self.pending_supplier_brands:
+            rows = list(self.pending_supplier_brands.values())
+            for start in range(0, len(rows), self.flush_size):
+                self.supabase.table("supplier_brands").upsert(
+                    rows[start:start + self.flush_size],
+                    on_conflict="supplier_id,brand_name",
+                    ignore_duplicates=True,
+                ).execute()
+                self.db_writes += 1
+            self.pending_supplier_brands.clear()
+
+        if self.pending_stone_product_updates:
+            # Renames touch different columns per row, so they cannot share
+            # one upsert without clobbering unrelated fields.
+            for stone_product_id, update_payload in self.pending_stone_product_updates.items():
+                self.supabase.table("stone_products").update(update_payload).eq("id", stone_product_id).execute()
+                self.db_writes += 1
+            self.pending_stone_product_updates.clear()
@@ -0,0 +1,75 @@
+"""
+Per-phase timing and counters for the Moraware remnant sync.
+
+Every phase (login, list collection, job page load, row parse, DB lookups,
+DB writes, image download/encode/upload, job-notes edit) records one sample
+per call with its duration, request count and bytes moved. `report()` turns
+those into p50/p95/max and totals for `last_sync_metrics.json`.
+"""
+
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class SyncMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations: dict[str, list[float]] = defaultdict(list)
+        self.requests: dict[str, int] = defaultdict(int)
+        self.bytes: dict[str, int] = defaultdict(int)
+
+    def add(self, phase: str, seconds: float, *, requests: int = 0, bytes_transferred: int = 0) -> None:
+        with self._lock:
+            self.durations[phase].append(seconds)
+            self.requests[phase] += requests
+            self.bytes[phase] += bytes_transferred
+
+    @contextmanager
+    def phase(self, name: str, *, requests: int = 0):
+        """Times a block; the yielded dict can raise `requests` / `bytes` before it exits."""
+        sample = {"requests": requests, "bytes": 0}
+        started = time.monotonic()
+        try:
+            yield sample
+        finally:
+            self.add(
+                name,
+                time.monotonic() - started,
+                requests=sample["requests"],
+                bytes_transferred=sample["bytes"],
+            )
+
+    def report(self) -> dict:
+        with self._lock:
+            phases = {}
+            for name, samples in sorted(self.durations.items()):
+                ordered = sorted(samples)
+                phases[name] = {
+                    "count": len(ordered),
+                    "total_sec": round(sum(ordered), 3),
+                    "p50_sec": round(percentile(ordered, 0.50), 4),
+                    "p95_sec": round(percentile(ordered, 0.95), 4),
+                    "max_sec": round(ordered[-1], 4) if ordered else 0.0,
+                    "requests": self.requests[name],
+                    "bytes": self.bytes[name],
+                }
+            return phases
+
+    def summary(self, names: tuple[str, ...] | None = None) -> str:
+        phases = self.report()
+        return ", ".join(
+            f"{name}={phase['count']} ({phase['total_sec']:.1f}s)"
+            for name, phase in phases.items()
+            if names is None or name in names
+        )
@@ -1,48 +1,8 @@
 import re
+from dataclasses import dataclass
 
+from scrapers.remnant_scraper.brand_index import BrandIndex, default_brand_index
 
-BRAND_PREFIX_RULES = [
-    {
-        "pattern": re.compile(r"^(quick)\s+(.+)$", re.IGNORECASE),
-        "brand_name": "Quick Color",
-        "supplier_name": "Quick Countertop",
-    },
-    {
-        "pattern": re.compile(r"^(one\s*quartz)\s+by\s+(daltile)\s+(.+)$", re.IGNORECASE),
-        "brand_name": "One Quartz",
-        "supplier_name": "Daltile",
-    },
-    {
-        "pattern": re.compile(r"^(msi)\s+(.+)$", re.IGNORECASE),
-        "brand_name": "MSI",
-        "supplier_name": "MSI Surfaces",
-    },
-    {
-        "pattern": re.compile(r"^(cambria)\s+(.+)$", re.IGNORECASE),
-        "brand_name": "Cambria",
-        "supplier_name": "Cambria",
-    },
-    {
-        "pattern": re.compile(r"^(caesar\s*stone|caesarstone)\s+(.+)$", re.IGNORECASE),
-        "brand_name": "Caesarstone",
-        "supplier_name": "Caesarstone",
-    },
-    {
-        "pattern": re.compile(r"^(x[\s-]?tone|xtone)\s+(.+)$", re.IGNORECASE),
-        "brand_name": "X-Tone",
-        "supplier_name": "X-Tone",
-    },
-    {
-        "pattern": re.compile(r"^(laminam)\s+(.+)$", re.IGNORECASE),
-        "brand_name": "Laminam",
-        "supplier_name": "Laminam",
-    },
-    {
-        "pattern": re.compile(r"^(cosmos)\s+(.+)$", re.IGNORECASE),
-        "brand_name": "Cosmos",
-        "supplier_name": "Cosmos",
-    },
-]
 
 FINISH_KEYWORDS = {
     "polished": "Polished",
@@ -52,53 +12,101 @@ FINISH_KEYWORDS = {
     "brushed": "Brushed",
 }
 
-
-def parse_line(description: str):
+# Compiled once at import; the sync parses every file row on every job page.
+# Moraware descriptions may use "|" or "/" as separators.
+SEPARATOR_PATTERN = re.compile(r"\s*[|/]\s*")
+REMNANT_ID_PATTERN = re.compile(r"#?\s*(\d+)")
+SIZE_PATTERN = re.compile(r"(\d+)x(\d+)")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+THICKNESS_CM_PATTERN = re.compile(r"(?:^|[^0-9])((?:2|3)cm)(?:$|[^a-z])")
+THICKNESS_INCH_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\"")
+_FINISH_ALTERNATION = "|".join(re.escape(keyword) for keyword in FINISH_KEYWORDS)
+# A whole word, or "<keyword> finish" anywhere; one scan for every keyword.
+FINISH_PATTERN = re.compile(rf"\b({_FINISH_ALTERNATION})\b|({_FINISH_ALTERNATION}) finish")
+# (substring in the lowercased status part, status), first match wins.
+STATUS_RULES = (
+    ("sold", "Sold"),
+    ("hold", "Hold"),
+)
+DEFAULT_STATUS = "Available"
+
+
+@dataclass(frozen=True)
+class RemnantDescription:
+    remnant_id: int
+    width: int
+    height: int
+    l_shape: bool = False
+    l_width: int | None = None
+    l_height: int | None = None
+    status: str = DEFAULT_STATUS
+    thickness: str = "unknown"
+    finish: str | None = None
+
+    def as_line(self):
+        """The tuple `parse_line` has always returned."""
+        return self.remnant_id, self.width, self.height, self.l_shape, self.l_width, self.l_height, self.status
+
+
+def parse_description(description: str, name: str = "") -> RemnantDescription | None:
     """
-    Example formats:
-      "#48 | 42x60 | Sold"
-      "#49 | 42x60+18x24 | On Hold"
-      "#50 | 42x60"
+    Parses a Moraware file description such as "#48 | 42x60+18x24 | On Hold | 3cm"
+    into one record. `name` is the stone name from the job title; it is only
+    used, together with the description, to find the finish.
     """
-    # Moraware descriptions may use "|" or "/" as separators.
-    parts = [p.strip() for p in re.split(r"\s*[|/]\s*", description) if p.strip()]
+    parts = [p.strip() for p in SEPARATOR_PATTERN.split(description or "") if p.strip()]
     if len(parts) < 2:
         return None
 
-    remnant_match = re.search(r"#?\s*(\d+)", parts[0])
+    remnant_match = REMNANT_ID_PATTERN.search(parts[0])
     if not remnant_match:
         return None
 
-    remnant_id = int(remnant_match.group(1))
     sizes = parts[1].replace(" ", "").lower().split("+")
-
-    m = re.search(r"(\d+)x(\d+)", sizes[0])
+    m = SIZE_PATTERN.search(sizes[0])
     if not m:
         return None
 
-    width = int(m.group(1))
-    height = int(m.group(2))
-
     l_shape = False
     l_width = None
     l_height = None
-
     if len(sizes) > 1:
-        m2 = re.search(r"(\d+)x(\d+)", sizes[1])
+        m2 = SIZE_PATTERN.search(sizes[1])
         if m2:
             l_shape = True
             l_width = int(m2.group(1))
             l_height = int(m2.group(2))
 
-    status = "Available"
+    status = DEFAULT_STATUS
     if len(parts) > 2:
         status_text = parts[2].lower()
-        if "sold" in status_text:
-            status = "Sold"
-        elif "hold" in status_text:
-            status = "Hold"
+        for needle, status_name in STATUS_RULES:
+            if needle in status_text:
+                status = status_name
+                break
+
+    return RemnantDescription(
+        remnant_id=int(remnant_match.group(1)),
+        width=int(m.group(1)),
+        height=int(m.group(2)),
+        l_shape=l_shape,
+        l_width=l_width,
+        l_height=l_height,
+        status=status,
+        thickness=parse_thickness(description),
+        finish=parse_finish(f"{name} {description}"),
+    )
 
-    return remnant_id, width, height, l_shape, l_width, l_height, status
+
+def parse_line(description: str):
+    """
+    Example formats:
+      "#48 | 42x60 | Sold"
+      "#49 | 42x60+18x24 | On Hold"
+      "#50 | 42x60"
+    """
+    parsed = parse_description(description)
+    return parsed.as_line() if parsed else None
 
 
 def parse_thickness(text: str) -> str:
@@ -108,11 +116,11 @@ def parse_thickness(text: str) -> str:
     """
     t = (text or "").lower().replace(" ", "")
 
-    m = re.search(r"(?:^|[^0-9])((?:2|3)cm)(?:$|[^a-z])", t)
+    m = THICKNESS_CM_PATTERN.search(t)
     if m:
         return m.group(1)
 
-    m = re.search(r"(\d+(?:\.\d+)?)\"", t)
+    m = THICKNESS_INCH_PATTERN.search(t)
     if m:
         return f'{m.group(1)}"'
 
@@ -120,12 +128,16 @@ def parse_thickness(text: str) -> str:
 
 
 def parse_finish(text: str) -> str | None:
-    cleaned = re.sub(r"\s+", " ", (text or "").strip()).lower()
+    cleaned = WHITESPACE_PATTERN.sub(" ", (text or "").strip()).lower()
     if not cleaned:
         return None
 
+    found = {word or phrase for word, phrase in FINISH_PATTERN.findall(cleaned)}
+    if not found:
+        return None
+    # FINISH_KEYWORDS order decides ties, so "polished" still wins over "honed".
     for keyword, finish_name in FINISH_KEYWORDS.items():
-        if f"{keyword} finish" in cleaned or re.search(rf"\\b{re.escape(keyword)}\\b", cleaned):
+        if keyword in found:
             return finish_name
 
     return None
@@ -151,8 +163,8 @@ def get_page_material_and_name(title: str):
     return material, name
 
 
-def parse_brand_and_stone_name(raw_name: str):
-    cleaned = re.sub(r"\s+", " ", (raw_name or "").strip())
+def parse_brand_and_stone_name(raw_name: str, index: BrandIndex | None = None):
+    cleaned = WHITESPACE_PATTERN.sub(" ", (raw_name or "").strip())
     if not cleaned:
         return {
             "display_name": "",
@@ -161,16 +173,13 @@ def parse_brand_and_stone_name(raw_name: str):
             "stone_name": "",
         }
 
-    for rule in BRAND_PREFIX_RULES:
-        match = rule["pattern"].match(cleaned)
-        if not match:
-            continue
-        groups = [group.strip() for group in match.groups() if group and group.strip()]
-        stone_name = groups[-1] if groups else cleaned
+    matched = (index or default_brand_index()).match(cleaned)
+    if matched:
+        rule, stone_name = matched
         return {
             "display_name": cleaned,
-            "brand_name": rule["brand_name"],
-            "supplier_name": rule["supplier_name"],
+            "brand_name": rule.brand_name,
+            "supplier_name": rule.supplier_name,
             "stone_name": stone_name,
         }
 
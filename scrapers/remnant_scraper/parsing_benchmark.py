@@ -0,0 +1,124 @@
+"""
+Golden-file check and throughput benchmark for the Moraware description parser.
+
+Usage:
+  python3 -m scrapers.remnant_scraper.parsing_benchmark
+  python3 -m scrapers.remnant_scraper.parsing_benchmark --iterations 20000
+  python3 -m scrapers.remnant_scraper.parsing_benchmark --update
+  python3 -m scrapers.remnant_scraper.parsing_benchmark --reparse descriptions.txt > parsed.jsonl
+
+The default run re-parses every case in `parsing_golden.jsonl`, fails on any
+difference, then reports parses per second. `--reparse` parses a file of
+historical descriptions (one per line, or JSONL with `description` / `name`)
+and prints one JSON record per line.
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+if __package__ is None or __package__ == "":
+    # Allow running as: python scrapers/remnant_scraper/parsing_benchmark.py
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from scrapers.remnant_scraper.parsing import parse_description
+
+GOLDEN_PATH = Path(__file__).resolve().parent / "parsing_golden.jsonl"
+
+
+def parse_record(description: str, name: str = "") -> dict | None:
+    parsed = parse_description(description, name)
+    return asdict(parsed) if parsed else None
+
+
+def load_cases(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+def write_cases(path: Path, cases: list[dict]) -> None:
+    lines = [
+        json.dumps(
+            {
+                "description": case["description"],
+                "name": case.get("name", ""),
+                "expected": parse_record(case["description"], case.get("name", "")),
+            }
+        )
+        for case in cases
+    ]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def check_cases(cases: list[dict]) -> list[str]:
+    failures = []
+    for case in cases:
+        actual = parse_record(case["description"], case.get("name", ""))
+        if actual != case["expected"]:
+            failures.append(
+                f"{case['description']!r} (name={case.get('name', '')!r}): "
+                f"expected {case['expected']}, got {actual}"
+            )
+    return failures
+
+
+def benchmark(cases: list[dict], iterations: int) -> float:
+    inputs = [(case["description"], case.get("name", "")) for case in cases]
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for description, name in inputs:
+            parse_description(description, name)
+    elapsed = time.perf_counter() - started
+    return (iterations * len(inputs)) / elapsed if elapsed else 0.0
+
+
+def read_descriptions(path: Path):
+    for line in path.read_text().splitlines():
+        if not line.strip():
+            continue
+        if line.lstrip().startswith("{"):
+            row = json.loads(line)
+            yield row.get("description", ""), row.get("name", "")
+        else:
+            yield line, ""
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check and benchmark the remnant description parser.")
+    parser.add_argument("--golden", type=Path, default=GOLDEN_PATH, help="Golden corpus (JSONL).")
+    parser.add_argument("--iterations", type=int, default=5000, help="Passes over the corpus to time.")
+    parser.add_argument("--update", action="store_true", help="Rewrite the golden corpus from the current parser.")
+    parser.add_argument("--reparse", type=Path, help="Parse a file of descriptions and print JSONL records.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    if args.reparse:
+        for description, name in read_descriptions(args.reparse):
+            print(json.dumps({"description": description, "name": name, "parsed": parse_record(description, name)}))
+        return 0
+
+    cases = load_cases(args.golden)
+    if args.update:
+        write_cases(args.golden, cases)
+        print(f"Rewrote {len(cases)} golden cases in {args.golden}")
+        return 0
+
+    failures = check_cases(cases)
+    for failure in failures:
+        print(f"MISMATCH {failure}")
+    print(f"Golden cases: {len(cases) - len(failures)}/{len(cases)} match")
+    if failures:
+        return 1
+
+    rate = benchmark(cases, max(1, args.iterations))
+    print(f"Parses per second: {rate:,.0f} ({args.iterations} x {len(cases)} descriptions)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
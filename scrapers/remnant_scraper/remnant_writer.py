@@ -0,0 +1,168 @@
+"""
+Batched remnant writes for the Moraware sync.
+
+Instead of a select + insert/update (+ re-select) per remnant, the sync stages
+each `base_payload` here and flushes them in chunks with one upsert keyed on
+`moraware_remnant_id`. Existing rows for the company are prefetched once, and
+rows whose stored `hash` already matches are only touched for `last_seen_at`.
+A chunk the database rejects is retried row by row, and the rows that still
+fail are kept in `failures` instead of ending the run.
+"""
+
+import logging
+
+from scrapers.remnant_scraper.async_writer import WriteFailure
+from scrapers.remnant_scraper.lookup_cache import DEFAULT_PAGE_SIZE
+
+DEFAULT_CHUNK_SIZE = 200
+PREFETCH_COLUMNS = (
+    "id,moraware_remnant_id,hash,deleted_at,photo_hash,image,image_path,image_variants,source_image_url,"
+    "photo_source_etag,photo_source_last_modified,photo_source_length,photo_source_hash"
+)
+
+
+def touch_last_seen(supabase, remnant_ids: list[int], run_started_at: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Bumps `last_seen_at` for many Moraware remnants with one update per chunk."""
+    remnant_ids = sorted(set(remnant_ids))
+    requests_made = 0
+    for start in range(0, len(remnant_ids), chunk_size):
+        (
+            supabase.table("remnants")
+            .update({"last_seen_at": run_started_at})
+            .in_("moraware_remnant_id", remnant_ids[start:start + chunk_size])
+            .execute()
+        )
+        requests_made += 1
+    return requests_made
+
+
+class RemnantBatchWriter:
+    def __init__(self, supabase, company_id: int, run_started_at: str, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.supabase = supabase
+        self.company_id = company_id
+        self.run_started_at = run_started_at
+        self.chunk_size = max(1, chunk_size)
+        self.existing_rows: dict[int, dict] = {}
+        self.pending_upserts: dict[int, dict] = {}
+        self.pending_seen: set[int] = set()
+        self.pending_photo_updates: dict[int, dict] = {}
+        # Job page each staged remnant came from, for failure reports.
+        self.job_urls: dict[int, str | None] = {}
+        self.failures: list[WriteFailure] = []
+        self.db_requests = 0
+
+    def prefetch(self) -> "RemnantBatchWriter":
+        start = 0
+        while True:
+            page = (
+                self.supabase.table("remnants")
+                .select(PREFETCH_COLUMNS)
+                .eq("company_id", self.company_id)
+                .filter("moraware_remnant_id", "not.is", "null")
+                .order("id")
+                .range(start, start + DEFAULT_PAGE_SIZE - 1)
+                .execute()
+            )
+            self.db_requests += 1
+            rows = page.data or []
+            for row in rows:
+                self.existing_rows[row["moraware_remnant_id"]] = row
+            if len(rows) < DEFAULT_PAGE_SIZE:
+                break
+            start += DEFAULT_PAGE_SIZE
+
+        logging.info(f"Prefetched {len(self.existing_rows)} existing Moraware remnants")
+        return self
+
+    def get(self, remnant_id: int) -> dict | None:
+        return self.existing_rows.get(remnant_id)
+
+    def stage(self, payload: dict, job_url: str | None = None) -> bool:
+        """
+        Queues a remnant payload. Returns True when the row is new or changed
+        and will be upserted, False when only `last_seen_at` needs a touch.
+        """
+        remnant_id = payload["moraware_remnant_id"]
+        self.job_urls[remnant_id] = job_url
+        existing_row = self.existing_rows.get(remnant_id)
+        if (
+            existing_row
+            and existing_row.get("hash") == payload["hash"]
+            and existing_row.get("deleted_at") is None
+        ):
+            if remnant_id not in self.pending_upserts:
+                self.pending_seen.add(remnant_id)
+            return False
+
+        self.pending_seen.discard(remnant_id)
+        self.pending_upserts[remnant_id] = payload
+        if len(self.pending_upserts) >= self.chunk_size:
+            self.flush_upserts()
+        return True
+
+    def stage_photo_update(self, remnant_id: int, payload: dict, job_url: str | None = None) -> None:
+        """Photo columns are written after the row itself has been flushed."""
+        self.pending_photo_updates.setdefault(remnant_id, {}).update(payload)
+        if job_url:
+            self.job_urls[remnant_id] = job_url
+
+    def pop_failures(self) -> list[WriteFailure]:
+        failures, self.failures = self.failures, []
+        return failures
+
+    def record_failure(self, remnant_id: int, description: str, exc: Exception) -> None:
+        logging.error(f"Remnant #{remnant_id}: {description} failed: {exc}")
+        self.failures.append(WriteFailure(remnant_id, description, self.job_urls.get(remnant_id), exc))
+
+    def flush_upserts(self) -> None:
+        rows = list(self.pending_upserts.values())
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = rows[start:start + self.chunk_size]
+            try:
+                self.db_requests += 1
+                self.supabase.table("remnants").upsert(chunk, on_conflict="moraware_remnant_id").execute()
+            except Exception as exc:
+                logging.warning(f"Upsert of {len(chunk)} remnants failed ({exc}); retrying them one by one")
+                chunk = self.upsert_rows(chunk)
+            for row in chunk:
+                cached = self.existing_rows.setdefault(row["moraware_remnant_id"], {})
+                cached.update({"hash": row["hash"], "deleted_at": None, "source_image_url": row["source_image_url"]})
+        self.pending_upserts.clear()
+
+    def upsert_rows(self, rows: list[dict]) -> list[dict]:
+        """Upserts a rejected chunk one row at a time. Returns the rows that were written."""
+        written = []
+        for row in rows:
+            try:
+                self.db_requests += 1
+                self.supabase.table("remnants").upsert(row, on_conflict="moraware_remnant_id").execute()
+            except Exception as exc:
+                self.record_failure(row["moraware_remnant_id"], "upsert", exc)
+            else:
+                written.append(row)
+        return written
+
+    def flush_seen(self) -> None:
+        self.db_requests += touch_last_seen(
+            self.supabase,
+            list(self.pending_seen),
+            self.run_started_at,
+            self.chunk_size,
+        )
+        self.pending_seen.clear()
+
+    def flush(self, touch_seen: bool = True) -> None:
+        """`touch_seen=False` leaves `pending_seen` for the end-of-run reconciliation."""
+        self.flush_upserts()
+        if touch_seen:
+            self.flush_seen()
+
+        for remnant_id, payload in self.pending_photo_updates.items():
+            try:
+                self.db_requests += 1
+                self.supabase.table("remnants").update(payload).eq("moraware_remnant_id", remnant_id).execute()
+            except Exception as exc:
+                self.record_failure(remnant_id, "photo columns", exc)
+                continue
+            self.existing_rows.setdefault(remnant_id, {}).update(payload)
+        self.pending_photo_updates.clear()
@@ -0,0 +1,331 @@
+"""
+Offline replay benchmark for the Moraware remnant sync.
+
+Usage:
+  python3 -m scrapers.remnant_scraper --record fixtures/   # live run that saves fixtures
+  python3 -m scrapers.remnant_scraper.replay fixtures/
+  python3 -m scrapers.remnant_scraper.replay fixtures/ --passes 2 --seed lookups.json
+  python3 -m scrapers.remnant_scraper.replay fixtures/ --passes 2 --variants-from-pass 2
+
+Feeds a directory recorded with `--record` (see `fixtures.py`) through the
+real list collection, page parsing, lookup, remnant write and photo code.
+`ReplayDriver` stands in for Chrome, `ReplayTransport` for the HTTP session and
+`FakeSupabase` for Supabase REST and storage, so no login, browser or network
+is needed. Every pass reuses the same in-memory database: the first measures a
+cold sync, later ones the steady state. Each pass reports jobs/min, rows/sec
+and DB calls per row; the full report goes to DIR/replay_report.json.
+
+Job notes are never edited during a replay; the report counts the edits a
+live run would have made instead. MORAWARE_* tuning variables apply as usual.
+`--variants-from-pass N` turns image variants on from pass N, which replays
+the backfill of variants onto photos synced without them. Any pass with
+variants on counts the photographed rows still missing `image_variants` and
+exits non-zero if there are any.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from collections import Counter
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+import requests
+from bs4 import BeautifulSoup
+from requests.structures import CaseInsensitiveDict
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+if __package__ is None or __package__ == "":
+    # Allow running as: python scrapers/remnant_scraper/replay.py
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from scrapers.remnant_scraper.config import load_settings
+from scrapers.remnant_scraper.content_store import collect_garbage
+from scrapers.remnant_scraper.fake_supabase import FakeSupabase
+from scrapers.remnant_scraper.fixtures import FixtureStore
+from scrapers.remnant_scraper.sync_remnants import (
+    JOB_LIST_CHANGED_SCRIPT,
+    JOB_LIST_NEXT_SCRIPT,
+    JOB_LIST_ROWS_SCRIPT,
+    JOB_TABLE_SELECTORS,
+    RemnantSync,
+    collect_job_urls,
+    crawl_job_pages,
+    resolve_company_id,
+)
+
+
+class ReplayElement:
+    """Returned by `ReplayDriver.find_element`; only its presence matters."""
+
+    def __init__(self, by: str, value: str):
+        self.by = by
+        self.value = value
+
+
+class ReplayDriver:
+    """
+    The slice of the WebDriver API the sync uses, served from fixtures. A
+    URL with a recorded job page opens that page; any other URL opens the
+    job list, whose "next" link steps through the recorded list pages.
+    """
+
+    def __init__(self, fixtures: FixtureStore):
+        self.fixtures = fixtures
+        self.list_pages = fixtures.load_job_list_pages()
+        self.list_page_index = 0
+        self.current_url = ""
+        self.page_source = ""
+        self._soup: BeautifulSoup | None = None
+
+    def get(self, url: str) -> None:
+        self.current_url = url
+        html = self.fixtures.load_job_page(url)
+        if html is None:
+            self.page_source, self._soup = "", None
+            self.list_page_index = 0
+        else:
+            self.page_source, self._soup = html, BeautifulSoup(html, "html.parser")
+
+    @property
+    def title(self) -> str:
+        if self._soup is None:
+            return "Jobs"
+        title_node = self._soup.find("title")
+        return title_node.get_text().strip() if title_node else ""
+
+    def find_element(self, by: str, value: str) -> ReplayElement:
+        if self._soup is None:
+            if (by, value) in JOB_TABLE_SELECTORS and self.list_pages:
+                return ReplayElement(by, value)
+        elif by == By.ID and self._soup.find(id=value) is not None:
+            return ReplayElement(by, value)
+        elif by == By.NAME and self._soup.find(attrs={"name": value}) is not None:
+            return ReplayElement(by, value)
+        raise NoSuchElementException(f"{by}={value} is not in the recorded page {self.current_url}")
+
+    def find_elements(self, by: str, value: str) -> list[ReplayElement]:
+        try:
+            return [self.find_element(by, value)]
+        except NoSuchElementException:
+            return []
+
+    def execute_script(self, script: str, *args):
+        if self._soup is not None or not self.list_pages:
+            return None
+        if script == JOB_LIST_ROWS_SCRIPT:
+            return [list(row) for row in self.list_pages[self.list_page_index]]
+        if script == JOB_LIST_NEXT_SCRIPT:
+            if self.list_page_index + 1 >= len(self.list_pages):
+                return False
+            self.list_page_index += 1
+            return True
+        if script == JOB_LIST_CHANGED_SCRIPT:
+            return True
+        return None
+
+    def get_cookies(self) -> list[dict]:
+        return []
+
+    def quit(self) -> None:
+        pass
+
+
+class ReplayResponse:
+    def __init__(self, url: str, status_code: int, headers: dict | None = None, content: bytes = b""):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for replayed {self.url}", response=self)
+
+
+class ReplayTransport:
+    """Serves recorded job pages and photos, answering conditional requests with 304."""
+
+    def __init__(self, fixtures: FixtureStore):
+        self.fixtures = fixtures
+
+    def update_cookies(self, cookies: list[dict]) -> bool:
+        return False
+
+    def get(self, url: str, **kwargs) -> ReplayResponse:
+        html = self.fixtures.load_job_page(url)
+        if html is None:
+            return ReplayResponse(url, 404)
+        return ReplayResponse(url, 200, {"Content-Type": "text/html"}, html.encode("utf-8"))
+
+    def download(self, url: str, headers: dict | None = None) -> tuple[ReplayResponse, bytes]:
+        recorded = self.fixtures.load_image(url)
+        if recorded is None:
+            return ReplayResponse(url, 404), b""
+        meta, data = recorded
+        recorded_headers = CaseInsensitiveDict(meta["headers"])
+        headers = headers or {}
+        etag = recorded_headers.get("ETag")
+        last_modified = recorded_headers.get("Last-Modified")
+        if (etag and headers.get("If-None-Match") == etag) or (
+            last_modified and headers.get("If-Modified-Since") == last_modified
+        ):
+            return ReplayResponse(url, 304, meta["headers"]), b""
+        return ReplayResponse(url, meta["status_code"], meta["headers"], data), data
+
+
+def replay_settings(settings):
+    """Pins the settings a replay cannot honor; everything else comes from the env."""
+    job_page_mode = settings.job_page_mode
+    if job_page_mode == "selenium":
+        logging.warning("MORAWARE_JOB_PAGE_MODE=selenium needs a live browser; replaying with page_source")
+        job_page_mode = "page_source"
+    return replace(
+        settings,
+        job_list_page_url="",
+        job_page_mode=job_page_mode,
+        page_delay_sec=0,
+        brand_source="bundled",
+        push_metrics=False,
+    )
+
+
+def replay_pass(settings, supabase: FakeSupabase, fixtures: FixtureStore, pass_num: int) -> dict:
+    calls_before = Counter(supabase.calls)
+    run_started_at = datetime.now(timezone.utc).isoformat()
+    started = time.monotonic()
+
+    company_id = resolve_company_id(supabase, settings)
+    sync = RemnantSync(
+        settings,
+        supabase,
+        company_id,
+        run_started_at,
+        transport=ReplayTransport(fixtures),
+        edit_job_notes=False,
+    )
+    drivers = [ReplayDriver(fixtures) for _ in range(max(1, settings.workers))]
+    try:
+        drivers[0].get(settings.moraware_url)
+        with sync.metrics.phase("list_collection"):
+            job_fingerprints = collect_job_urls(drivers[0], settings)
+        job_urls = list(job_fingerprints)
+        crawl_job_pages(sync, drivers[:max(1, min(len(drivers), len(job_urls)))], job_urls, job_fingerprints)
+        sync.drain_photos()
+    finally:
+        sync.close()
+    reconciliation_safe = sync.totals["errors"] == 0 and not sync.issues
+    reconciliation = sync.reconcile(soft_delete=reconciliation_safe)
+    if reconciliation_safe and sync.content_store:
+        with sync.metrics.phase("storage_gc"):
+            reconciliation["gc_removed"] = collect_garbage(supabase, settings.supabase_bucket)
+    elapsed = time.monotonic() - started
+
+    calls = Counter(supabase.calls)
+    calls.subtract(calls_before)
+    calls = +calls
+    db_calls = sum(count for name, count in calls.items() if not name.startswith("storage."))
+    storage_calls = sum(calls.values()) - db_calls
+    rows = sync.totals["with_id"]
+    missing_variants = None
+    if settings.image_variants:
+        missing_variants = sum(
+            1
+            for row in supabase.tables.get("remnants", [])
+            if row.get("image") and row.get("image_variants") is None and row.get("deleted_at") is None
+        )
+    return {
+        "pass": pass_num,
+        "seconds": round(elapsed, 3),
+        "jobs": len(job_urls),
+        "rows": rows,
+        "jobs_per_min": round(len(job_urls) / elapsed * 60, 1) if elapsed else 0.0,
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed else 0.0,
+        "db_calls": db_calls,
+        "db_calls_per_row": round(db_calls / rows, 2) if rows else 0.0,
+        "storage_calls": storage_calls,
+        "calls": dict(sorted(calls.items())),
+        "totals": dict(sync.totals),
+        "photo_counts": dict(sync.photo_counts),
+        "issue_count": len(sync.issues),
+        "image_variants": settings.image_variants,
+        "rows_missing_variants": missing_variants,
+        "reconciliation": reconciliation,
+        "phases": sync.metrics.report(),
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay a recorded Moraware sync offline and benchmark it.")
+    parser.add_argument("fixtures", type=Path, help="Directory written by `--record`.")
+    parser.add_argument("--passes", type=int, default=1, help="Syncs to run against the same in-memory database.")
+    parser.add_argument(
+        "--variants-from-pass",
+        type=int,
+        help="Turn MORAWARE_IMAGE_VARIANTS on from this pass (earlier passes run with it off).",
+    )
+    parser.add_argument("--seed", type=Path, help="JSON object of table name -> rows to preload into the fake database.")
+    parser.add_argument("--report", type=Path, help="Where to write the JSON report (default: FIXTURES/replay_report.json).")
+    parser.add_argument("--verbose", action="store_true", help="Keep the sync's per-row INFO logging.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.WARNING)
+
+    settings = replay_settings(load_settings(require_credentials=False))
+    fixtures = FixtureStore(args.fixtures)
+    seed = json.loads(args.seed.read_text()) if args.seed else None
+    supabase = FakeSupabase(settings.supabase_url or "http://replay.local", tables=seed)
+
+    passes = []
+    for pass_num in range(1, max(1, args.passes) + 1):
+        pass_settings = settings
+        if args.variants_from_pass:
+            pass_settings = replace(settings, image_variants=pass_num >= args.variants_from_pass)
+        result = replay_pass(pass_settings, supabase, fixtures, pass_num)
+        passes.append(result)
+        print(
+            f"Pass {pass_num}: {result['jobs']} jobs, {result['rows']} rows in {result['seconds']:.2f}s | "
+            f"{result['jobs_per_min']:,.1f} jobs/min | {result['rows_per_sec']:,.1f} rows/sec | "
+            f"{result['db_calls_per_row']:.2f} DB calls/row ({result['db_calls']} DB, "
+            f"{result['storage_calls']} storage) | {result['issue_count']} issues"
+        )
+        if result["rows_missing_variants"]:
+            print(f"Pass {pass_num}: {result['rows_missing_variants']} photographed rows still have no image_variants")
+
+    report_path = args.report or args.fixtures / "replay_report.json"
+    report_path.write_text(
+        json.dumps(
+            {
+                "fixtures": str(args.fixtures),
+                "settings": {
+                    "workers": settings.workers,
+                    "job_page_mode": settings.job_page_mode,
+                    "batch_upsert": settings.batch_upsert,
+                    "image_workers": settings.image_workers,
+                    "image_profile": settings.image_profile,
+                    "image_variants": settings.image_variants,
+                    "content_addressed_storage": settings.content_addressed_storage,
+                },
+                "passes": passes,
+            },
+            indent=2,
+        )
+    )
+    print(f"Wrote replay report: {report_path}")
+    return 1 if any(result["rows_missing_variants"] for result in passes) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
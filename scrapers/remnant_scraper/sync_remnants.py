@@ -1,16 +1,28 @@
+import argparse
 import logging
 import json
 import re
 import os
 import shutil
 import sys
+import threading
 import time
+import queue
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 
+import requests
 from selenium import webdriver
-from selenium.common.exceptions import SessionNotCreatedException
+from selenium.common.exceptions import (
+    JavascriptException,
+    SessionNotCreatedException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -22,19 +34,36 @@ if __package__ is None or __package__ == "":
     # Allow running as: python scrapers/remnant_scraper/sync_remnants.py
     sys.path.append(str(Path(__file__).resolve().parents[2]))
 
+from scrapers.remnant_scraper.async_writer import AsyncWriter, WriteFailure, connect_async_client
+from scrapers.remnant_scraper.brand_index import load_brand_index
 from scrapers.remnant_scraper.config import load_settings
+from scrapers.remnant_scraper.content_store import ContentStore, collect_garbage
+from scrapers.remnant_scraper.fixtures import FixtureStore, RecordingTransport
+from scrapers.remnant_scraper.image_normalize import ENCODER_PROFILES, ImageTooLargeError, normalize_image
+from scrapers.remnant_scraper.image_pipeline import (
+    ImageJob,
+    ImagePipeline,
+    PhotoResult,
+    sync_remnant_photo,
+)
+from scrapers.remnant_scraper.job_page import (
+    FileRow,
+    JobPage,
+    parse_job_page_html,
+    read_job_page,
+)
+from scrapers.remnant_scraper.lookup_cache import LookupCache
+from scrapers.remnant_scraper.metrics import SyncMetrics
 from scrapers.remnant_scraper.parsing import (
     get_page_material_and_name,
     parse_brand_and_stone_name,
-    parse_finish,
-    parse_line,
-    parse_thickness,
+    parse_description,
 )
+from scrapers.remnant_scraper.remnant_writer import RemnantBatchWriter, touch_last_seen
+from scrapers.remnant_scraper.sync_state import RunCheckpoint, SyncStateStore
+from scrapers.remnant_scraper.transport import Transport
 from scrapers.remnant_scraper.utils import (
-    infer_extension,
-    normalize_image_bytes,
     now_iso_utc,
-    requests_session_from_selenium,
     sha256_bytes,
 )
 
@@ -46,6 +75,8 @@ logging.basicConfig(
 
 
 VALID_STATUSES = {"available", "hold", "sold"}
+# Browser restarts allowed per worker before a run gives up.
+MAX_DRIVER_RESTARTS = 5
 JOB_TABLE_SELECTORS = (
     (By.ID, "Jobs_1Body"),
     (By.CSS_SELECTOR, "table[id^='Jobs_'][id$='Body']"),
@@ -130,155 +161,6 @@ def get_or_create_lookup_id(supabase, table_name: str, name: str) -> int:
     return inserted_row["id"]
 
 
-def get_or_create_supplier_id(supabase, name: str | None) -> int | None:
-    cleaned_name = (name or "").strip()
-    if not cleaned_name:
-        return None
-
-    existing = (
-        supabase.table("suppliers")
-        .select("id,name")
-        .ilike("name", cleaned_name)
-        .limit(1)
-        .execute()
-    )
-    existing_row = get_first_row(existing.data)
-    if existing_row:
-        return existing_row["id"]
-
-    inserted = (
-        supabase.table("suppliers")
-        .insert({"name": cleaned_name, "active": True})
-        .execute()
-    )
-    inserted_row = get_first_row(inserted.data)
-    if not inserted_row:
-        raise RuntimeError(f"Failed to create supplier row for '{cleaned_name}'")
-    return inserted_row["id"]
-
-
-def ensure_supplier_brand(supabase, supplier_id: int | None, brand_name: str | None, material_id: int) -> None:
-    cleaned_brand = (brand_name or "").strip()
-    if not supplier_id or not cleaned_brand:
-        return
-
-    existing = (
-        supabase.table("supplier_brands")
-        .select("id")
-        .eq("supplier_id", supplier_id)
-        .ilike("brand_name", cleaned_brand)
-        .limit(1)
-        .execute()
-    )
-    if get_first_row(existing.data):
-        return
-
-    supabase.table("supplier_brands").insert(
-        {
-            "supplier_id": supplier_id,
-            "brand_name": cleaned_brand,
-            "material_id": material_id,
-        }
-    ).execute()
-
-
-def get_or_create_stone_product_id(
-    supabase,
-    *,
-    material_id: int,
-    display_name: str,
-    stone_name: str,
-    brand_name: str | None,
-) -> int:
-    normalized_name = " ".join((display_name or "").strip().lower().split())
-    normalized_stone_name = " ".join((stone_name or "").strip().lower().split())
-    normalized_brand_name = " ".join((brand_name or "").strip().lower().split())
-    existing = (
-        supabase.table("stone_products")
-        .select("id,brand_name,stone_name,display_name")
-        .eq("material_id", material_id)
-        .eq("normalized_name", normalized_name)
-        .limit(1)
-        .execute()
-    )
-    existing_row = get_first_row(existing.data)
-    if not existing_row and normalized_stone_name:
-        fallback = (
-            supabase.table("stone_products")
-            .select("id,brand_name,stone_name,display_name")
-            .eq("material_id", material_id)
-            .limit(500)
-            .execute()
-        )
-        fallback_rows = fallback.data or []
-        matching_rows = []
-        for row in fallback_rows:
-            row_stone_name = " ".join((row.get("stone_name") or "").strip().lower().split())
-            if row_stone_name != normalized_stone_name:
-                continue
-
-            row_brand_name = " ".join((row.get("brand_name") or "").strip().lower().split())
-            if normalized_brand_name:
-                if row_brand_name and row_brand_name != normalized_brand_name:
-                    continue
-            matching_rows.append(row)
-
-        if len(matching_rows) == 1:
-            existing_row = matching_rows[0]
-
-    if existing_row:
-        update_payload = {}
-        if brand_name and not existing_row.get("brand_name"):
-            update_payload["brand_name"] = brand_name
-        if stone_name and existing_row.get("stone_name") != stone_name:
-            update_payload["stone_name"] = stone_name
-        if display_name and existing_row.get("display_name") != display_name:
-            update_payload["display_name"] = display_name
-        if update_payload:
-            supabase.table("stone_products").update(update_payload).eq("id", existing_row["id"]).execute()
-        return existing_row["id"]
-
-    inserted = (
-        supabase.table("stone_products")
-        .insert(
-            {
-                "material_id": material_id,
-                "display_name": display_name,
-                "stone_name": stone_name,
-                "brand_name": brand_name,
-                "active": True,
-            }
-        )
-        .execute()
-    )
-    inserted_row = get_first_row(inserted.data)
-    if not inserted_row:
-        raise RuntimeError(f"Failed to create stone product for '{display_name}'")
-    return inserted_row["id"]
-
-
-def find_parent_slab_id(supabase, stone_product_id: int | None) -> int | None:
-    if not stone_product_id:
-        return None
-
-    slabs = (
-        supabase.table("slabs")
-        .select("id")
-        .eq("stone_product_id", stone_product_id)
-        .limit(2)
-        .execute()
-    )
-    rows = slabs.data or []
-    if len(rows) == 1:
-        return rows[0]["id"]
-    return None
-
-
-def build_storage_path(kind: str, identifier: int, ext: str) -> str:
-    safe_ext = (ext or "jpg").strip().lower().lstrip(".") or "jpg"
-    return f"remnant_{identifier}.{safe_ext}"
-
-
 def resolve_company_id(supabase, settings) -> int:
     company_id_raw = os.getenv("MORAWARE_COMPANY_ID", "").strip()
     if company_id_raw:
@@ -304,34 +186,107 @@ def resolve_company_id(supabase, settings) -> int:
     return get_or_create_lookup_id(supabase, "companies", company_name)
 
 
+JOB_DESC_ID_LINE = re.compile(r"^\s*ID\s*#\d+\s*$")
+JOB_DESC_SAVE_TIMEOUT_SEC = 10
+
+# One round trip instead of is_displayed()/get_attribute() per page control.
+FIND_SAVE_CONTROL_SCRIPT = """
+const selectors = [
+    '#btnSaveJobHeader',
+    "button[onclick*='SaveEditJobHeader']",
+    "button[onclick*='SaveJobHeader']",
+    "input[onclick*='SaveEditJobHeader']",
+    "input[onclick*='SaveJobHeader']",
+    'button',
+    "input[type='submit']",
+    "input[type='button']",
+];
+const isVisible = (el) => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+for (const selector of selectors) {
+    for (const control of document.querySelectorAll(selector)) {
+        if (!isVisible(control) || control.disabled) {
+            continue;
+        }
+        const label = (
+            (control.innerText || '').trim()
+            || (control.value || '').trim()
+            || (control.title || '').trim()
+            || (control.getAttribute('aria-label') || '').trim()
+        );
+        if (!label) {
+            const onclick = (control.getAttribute('onclick') || '').toLowerCase();
+            if (!onclick.includes('save') && !onclick.includes('ok') && !onclick.includes('update')) {
+                continue;
+            }
+        } else if (!/(save|ok|update|done)/i.test(label)) {
+            continue;
+        }
+        control.click();
+        return true;
+    }
+}
+return false;
+"""
+
+# Dialog gone (or detached) and no jQuery save request still in flight.
+JOB_DESC_SAVED_SCRIPT = """
+const el = arguments[0];
+let closed = true;
+try {
+    closed = !el.isConnected || !(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+} catch (e) {
+    closed = true;
+}
+const idle = !window.jQuery || window.jQuery.active === 0;
+return closed && idle;
+"""
+
+
+def build_job_desc(current_desc: str, remnant_ids: list[int]) -> str:
+    """Replaces the `ID #<n>` lines in a job description with the current ids."""
+    id_lines = [f"ID #{remnant_id}" for remnant_id in dict.fromkeys(remnant_ids)]
+
+    kept_lines = [line for line in current_desc.splitlines() if not JOB_DESC_ID_LINE.match(line)]
+    while kept_lines and not kept_lines[-1].strip():
+        kept_lines.pop()
+
+    if kept_lines:
+        return "\n".join(kept_lines + [""] + id_lines)
+    return "\n".join(id_lines)
+
+
+def wait_for_job_desc_saved(driver, job_desc, timeout_sec: float = JOB_DESC_SAVE_TIMEOUT_SEC) -> bool:
+    def saved(_driver):
+        try:
+            return driver.execute_script(JOB_DESC_SAVED_SCRIPT, job_desc)
+        except StaleElementReferenceException:
+            return True
+
+    try:
+        WebDriverWait(
+            driver,
+            timeout_sec,
+            poll_frequency=0.1,
+            ignored_exceptions=(JavascriptException,),
+        ).until(saved)
+        return True
+    except TimeoutException:
+        return False
+
+
 def update_job_desc_with_remnant_ids(driver, wait, remnant_ids: list[int]) -> bool:
     """Update Moraware job notes with one `ID #<n>` line per remnant in this job."""
     if not remnant_ids:
         return False
 
+    unique_ids = list(dict.fromkeys(remnant_ids))
     try:
-        unique_ids = list(dict.fromkeys(remnant_ids))
-        id_lines = [f"ID #{remnant_id}" for remnant_id in unique_ids]
-
         edit_btn = wait.until(EC.element_to_be_clickable((By.ID, "btnEditJobHeader")))
         driver.execute_script("arguments[0].click();", edit_btn)
 
         job_desc = wait.until(EC.visibility_of_element_located((By.NAME, "jobDesc")))
         current_desc = job_desc.get_attribute("value") or ""
-
-        kept_lines = []
-        for line in current_desc.splitlines():
-            if re.match(r"^\s*ID\s*#\d+\s*$", line):
-                continue
-            kept_lines.append(line)
-
-        while kept_lines and not kept_lines[-1].strip():
-            kept_lines.pop()
-
-        if kept_lines:
-            new_desc = "\n".join(kept_lines + [""] + id_lines)
-        else:
-            new_desc = "\n".join(id_lines)
+        new_desc = build_job_desc(current_desc, unique_ids)
 
         if new_desc == current_desc:
             logging.info("Job notes already contain current remnant ID list")
@@ -399,46 +354,14 @@ def update_job_desc_with_remnant_ids(driver, wait, remnant_ids: list[int]) -> bo
             saved = bool(submitted_form)
 
         if not saved:
-            # Second fallback: click visible Save/OK/Update controls.
-            fallback_selectors = [
-                "#btnSaveJobHeader",
-                "button[onclick*='SaveEditJobHeader']",
-                "button[onclick*='SaveJobHeader']",
-                "input[onclick*='SaveEditJobHeader']",
-                "input[onclick*='SaveJobHeader']",
-                "button",
-                "input[type='submit']",
-                "input[type='button']",
-            ]
-            for selector in fallback_selectors:
-                controls = driver.find_elements(By.CSS_SELECTOR, selector)
-                if not controls:
-                    continue
-                for control in controls:
-                    if not (control.is_displayed() and control.is_enabled()):
-                        continue
-                    label = (
-                        (control.text or "").strip()
-                        or (control.get_attribute("value") or "").strip()
-                        or (control.get_attribute("title") or "").strip()
-                        or (control.get_attribute("aria-label") or "").strip()
-                    )
-                    if not label:
-                        onclick = (control.get_attribute("onclick") or "").lower()
-                        if "save" not in onclick and "ok" not in onclick and "update" not in onclick:
-                            continue
-                    elif not re.search(r"(save|ok|update|done)", label, re.IGNORECASE):
-                        continue
-                    driver.execute_script("arguments[0].click();", control)
-                    saved = True
-                    break
-                if saved:
-                    break
+            # Second fallback: click a visible Save/OK/Update control.
+            saved = bool(driver.execute_script(FIND_SAVE_CONTROL_SCRIPT))
 
         if not saved:
-            logging.warning("Updated jobDesc in dialog, but could not confirm save action.")
+            logging.warning("Updated jobDesc in dialog, but could not find a save action.")
+        elif not wait_for_job_desc_saved(driver, job_desc):
+            logging.warning("Updated jobDesc in dialog, but could not confirm the save finished.")
 
-        time.sleep(0.5)
         logging.info(f"Updated job notes with remnant IDs: {', '.join(map(str, unique_ids))}")
         return True
 
@@ -447,453 +370,1209 @@ def update_job_desc_with_remnant_ids(driver, wait, remnant_ids: list[int]) -> bo
         return False
 
 
-def main():
-    settings = load_settings()
-    supabase = create_client(settings.supabase_url, settings.supabase_key)
-    company_id = resolve_company_id(supabase, settings)
-    material_ids: dict[str, int] = {}
-    thickness_ids: dict[str, int] = {}
+def build_chrome_options(headless_arg: str | None, running_in_ci: bool, worker_index: int = 0) -> Options:
+    opts = Options()
+    if headless_arg:
+        opts.add_argument(headless_arg)
+    if running_in_ci:
+        opts.add_argument("--no-sandbox")
+        opts.add_argument("--disable-dev-shm-usage")
+        opts.add_argument("--disable-gpu")
+        opts.add_argument("--disable-software-rasterizer")
+        # Each worker browser needs its own debugging port and profile dir.
+        opts.add_argument(f"--remote-debugging-port={9222 + worker_index}")
+        opts.add_argument("--window-size=1920,1080")
+        suffix = f"-{worker_index}" if worker_index else ""
+        opts.add_argument(f"--user-data-dir=/tmp/chrome-user-data{suffix}")
+
+        chrome_path = (
+            os.getenv("CHROME_PATH")
+            or os.getenv("CHROME_BIN")
+            or shutil.which("google-chrome")
+            or shutil.which("chrome")
+            or shutil.which("chromium-browser")
+        )
+        if chrome_path:
+            opts.binary_location = chrome_path
+    return opts
 
+
+def create_driver(worker_index: int = 0):
     headless_enabled = os.getenv("MORAWARE_HEADLESS", "true").lower() in {"1", "true", "yes"}
     running_in_ci = os.getenv("CI", "").lower() == "true" or os.getenv("GITHUB_ACTIONS") == "true"
 
-    def build_options(headless_arg: str | None) -> Options:
-        opts = Options()
-        if headless_arg:
-            opts.add_argument(headless_arg)
-        if running_in_ci:
-            opts.add_argument("--no-sandbox")
-            opts.add_argument("--disable-dev-shm-usage")
-            opts.add_argument("--disable-gpu")
-            opts.add_argument("--disable-software-rasterizer")
-            opts.add_argument("--remote-debugging-port=9222")
-            opts.add_argument("--window-size=1920,1080")
-            opts.add_argument("--user-data-dir=/tmp/chrome-user-data")
-
-            chrome_path = (
-                os.getenv("CHROME_PATH")
-                or os.getenv("CHROME_BIN")
-                or shutil.which("google-chrome")
-                or shutil.which("chrome")
-                or shutil.which("chromium-browser")
-            )
-            if chrome_path:
-                opts.binary_location = chrome_path
-        return opts
-
     if headless_enabled:
         try:
-            driver = webdriver.Chrome(options=build_options("--headless=new"))
+            return webdriver.Chrome(options=build_chrome_options("--headless=new", running_in_ci, worker_index))
         except SessionNotCreatedException:
             logging.warning("Chrome failed with --headless=new. Retrying with --headless fallback.")
-            driver = webdriver.Chrome(options=build_options("--headless"))
-    else:
-        driver = webdriver.Chrome(options=build_options(None))
-
-    total_rows_seen = 0
-    total_with_id = 0
-    total_changed = 0
-    total_no_change = 0
-    total_photo_downloaded = 0
-    total_photo_skipped_same_hash = 0
-    total_photo_uploaded = 0
-    total_errors = 0
-    issues = []
-
-    run_started_at = datetime.now(timezone.utc).isoformat()
-    crawl_completed_successfully = False
-    reconciliation_safe = False
-    def record_issue(kind: str, job_url: str | None = None, remnant_id: int | None = None, details: str = ""):
-        issues.append(
-            {
-                "kind": kind,
-                "job_url": job_url,
-                "remnant_id": remnant_id,
-                "details": details,
-            }
-        )
-
-    try:
-        logging.info("Starting Moraware -> Supabase sync")
+            return webdriver.Chrome(options=build_chrome_options("--headless", running_in_ci, worker_index))
+    return webdriver.Chrome(options=build_chrome_options(None, running_in_ci, worker_index))
 
-        # ---- Login ----
-        driver.get(settings.moraware_url)
-        wait = WebDriverWait(driver, 15)
 
-        wait.until(EC.visibility_of_element_located((By.ID, "loginform")))
-        driver.find_element(By.ID, "user").send_keys(settings.moraware_user)
-        driver.find_element(By.ID, "pwd").send_keys(settings.moraware_pass)
-        driver.find_element(By.ID, "LOGIN").click()
+def login(driver, settings) -> None:
+    driver.get(settings.moraware_url)
+    wait = WebDriverWait(driver, 15)
 
-        wait.until(EC.url_contains("/sys/"))
-        logging.info("Logged into Moraware successfully")
+    wait.until(EC.visibility_of_element_located((By.ID, "loginform")))
+    driver.find_element(By.ID, "user").send_keys(settings.moraware_user)
+    driver.find_element(By.ID, "pwd").send_keys(settings.moraware_pass)
+    driver.find_element(By.ID, "LOGIN").click()
 
-        # Go back to the job list URL (handles redirects)
-        driver.get(settings.moraware_url)
-        wait_for_job_list(driver, settings.moraware_url)
+    wait.until(EC.url_contains("/sys/"))
+    logging.info("Logged into Moraware successfully")
 
-        # ---- Collect job URLs ----
-        job_urls = []
-        page_num = 1
-        collect_started = time.monotonic()
 
-        while True:
+def clone_driver_session(source_driver, settings, worker_index: int):
+    """Starts another browser that reuses the logged-in Moraware session cookies."""
+    driver = create_driver(worker_index)
+    driver.get(settings.moraware_url)
+    for cookie in source_driver.get_cookies():
+        cookie = {
+            key: cookie[key]
+            for key in ("name", "value", "path", "domain", "secure", "httpOnly", "expiry")
+            if key in cookie
+        }
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            # Host-only cookies are rejected when the domain is spelled out.
+            cookie.pop("domain", None)
+            driver.add_cookie(cookie)
+    driver.get(settings.moraware_url)
+    wait_for_job_list(driver, settings.moraware_url)
+    logging.info(f"Worker {worker_index}: cloned Moraware session")
+    return driver
+
+
+JOB_LIST_ROWS_SCRIPT = """
+const body = document.getElementById('Jobs_1Body')
+    || document.querySelector("table[id^='Jobs_'][id$='Body']");
+if (!body) {
+    return [];
+}
+return Array.from(body.querySelectorAll('tr')).slice(1).map((row) => {
+    const firstCell = row.querySelector('td');
+    const anchor = firstCell ? firstCell.querySelector('a') : null;
+    return anchor && anchor.href ? [anchor.href, row.innerText || ''] : null;
+}).filter(Boolean);
+"""
+
+# Stamps the current job table with a marker and clicks "next". A fresh page
+# either replaces the table (marker gone) or swaps its first job link.
+JOB_LIST_NEXT_SCRIPT = """
+const link = document.querySelector('span.pageNavEnabled.navPadLeft a');
+const body = document.getElementById('Jobs_1Body');
+if (!link) {
+    return false;
+}
+if (body) {
+    body.dataset.syncPageMarker = arguments[0];
+}
+link.click();
+return true;
+"""
+
+JOB_LIST_CHANGED_SCRIPT = """
+const body = document.getElementById('Jobs_1Body');
+const first = body ? body.querySelector('tr a') : null;
+if (!first) {
+    return false;
+}
+return body.dataset.syncPageMarker !== arguments[0] || first.href !== arguments[1];
+"""
+
+
+def read_job_list_rows(driver) -> list[tuple[str, str]]:
+    """Returns (job URL, row text) for every row on the current job list page in one call."""
+    return [(href, text) for href, text in driver.execute_script(JOB_LIST_ROWS_SCRIPT) or []]
+
+
+def collect_job_urls(driver, settings, on_page=None) -> dict[str, str]:
+    """
+    Walks every job list page. Returns job URLs in list order, each mapped to a
+    fingerprint of its list row so unchanged jobs can be skipped. `on_page`,
+    when given, is called with each page number and its rows.
+    """
+    job_urls: dict[str, str] = {}
+    page_num = 1
+    collect_started = time.monotonic()
+
+    while True:
+        if settings.job_list_page_url and page_num > 1:
+            page_url = settings.job_list_page_url.format(page=page_num)
+            driver.get(page_url)
+            wait_for_job_list(driver, page_url)
+        else:
             wait_for_job_list(driver, driver.current_url)
-            rows = driver.find_elements(By.CSS_SELECTOR, "#Jobs_1Body tr")
-            if not rows:
-                rows = driver.find_elements(By.CSS_SELECTOR, "table[id^='Jobs_'][id$='Body'] tr")
-
-            added_this_page = 0
-            for i, row in enumerate(rows):
-                if i == 0:
-                    continue
-                tds = row.find_elements(By.TAG_NAME, "td")
-                if not tds:
-                    continue
-                anchors = tds[0].find_elements(By.TAG_NAME, "a")
-                if anchors:
-                    href = anchors[0].get_attribute("href")
-                    if href:
-                        job_urls.append(href)
-                        added_this_page += 1
-
-            logging.info(f"Job list page {page_num}: collected {added_this_page} job links")
-
-            try:
-                anchors = driver.find_elements(By.CSS_SELECTOR, "#Jobs_1Body tr a")
-                first_href = anchors[0].get_attribute("href") if anchors else None
-
-                next_btn = driver.find_element(By.CSS_SELECTOR, "span.pageNavEnabled.navPadLeft a")
-                driver.execute_script("arguments[0].click();", next_btn)
-
-                WebDriverWait(driver, 10).until(
-                    lambda d: (
-                        d.find_elements(By.CSS_SELECTOR, "#Jobs_1Body tr a")
-                        and d.find_elements(By.CSS_SELECTOR, "#Jobs_1Body tr a")[0].get_attribute("href")
-                        != first_href
-                    )
-                )
-                page_num += 1
-                if settings.page_delay_sec > 0:
-                    time.sleep(settings.page_delay_sec)
-            except Exception:
-                break
-
-        # De-dupe while preserving order
-        seen = set()
-        job_urls = [url for url in job_urls if not (url in seen or seen.add(url))]
-
-        logging.info(f"Collected {len(job_urls)} total job pages")
-        logging.info(f"Job URL collection took {time.monotonic() - collect_started:.1f}s")
-
-        # ---- Process each job page ----
-        for job_i, job_url in enumerate(job_urls, start=1):
-            logging.info(f"[{job_i}/{len(job_urls)}] Processing job page: {job_url}")
-
-            driver.get(job_url)
-            remnant_ids_for_job = []
+        rows = read_job_list_rows(driver)
+        if on_page:
+            on_page(page_num, rows)
 
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "FilesScroll1Body"))
-                )
-            except Exception:
-                logging.warning("No files table found (FilesScroll1Body). Skipping job page.")
-                record_issue("missing_files_table", job_url=job_url)
+        added_this_page = 0
+        for href, text in rows:
+            if href in job_urls:
                 continue
+            # De-dupe while preserving order
+            job_urls[href] = sha256_bytes(text.encode("utf-8"))
+            added_this_page += 1
 
-            sess = requests_session_from_selenium(driver)
-            material_from_title, name_from_title = get_page_material_and_name(driver.title or "")
-            raw_name = name_from_title or "unknown"
-            material = material_from_title or "Other"
+        logging.info(f"Job list page {page_num}: collected {added_this_page} job links")
 
-            file_rows = driver.find_elements(By.CSS_SELECTOR, "#FilesScroll1Body tr")
-            logging.info(f"Found {max(0, len(file_rows) - 1)} file rows on page")
+        if settings.job_list_page_url:
+            # Past the last page Moraware either repeats the final page or shows none.
+            if not added_this_page:
+                break
+            page_num += 1
+            continue
 
-            for idx, row in enumerate(file_rows):
-                total_rows_seen += 1
+        try:
+            first_href = rows[0][0] if rows else None
+            marker = f"page-{page_num}"
+            if not driver.execute_script(JOB_LIST_NEXT_SCRIPT, marker):
+                break
 
-                try:
-                    tds = row.find_elements(By.TAG_NAME, "td")
-                    if len(tds) < 2:
-                        continue
+            WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                lambda d: d.execute_script(JOB_LIST_CHANGED_SCRIPT, marker, first_href)
+            )
+            page_num += 1
+            if settings.page_delay_sec > 0:
+                time.sleep(settings.page_delay_sec)
+        except Exception:
+            break
+
+    logging.info(f"Collected {len(job_urls)} total job pages")
+    logging.info(f"Job URL collection took {time.monotonic() - collect_started:.1f}s")
+    return job_urls
+
+
+@dataclass
+class OpenJob:
+    """A processed job page whose photos or writes may still be in flight."""
+
+    job_url: str
+    remnant_ids: list[int]
+    fingerprint: str | None = None
+    file_hrefs: list[str] = field(default_factory=list)
+    # The job's row writes, plus one per photo still in the image pipeline.
+    outstanding: int = 1
+    failed: bool = False
+
+
+class RemnantSync:
+    """
+    Per-run sync state shared by every job-page worker. Row writes, lookups and
+    counters go through `lock`, so several browsers can crawl concurrently while
+    the Supabase side stays serialized.
+    """
+
+    def __init__(
+        self,
+        settings,
+        supabase,
+        company_id: int,
+        run_started_at: str,
+        state_store: SyncStateStore | None = None,
+        *,
+        transport=None,
+        fixtures: FixtureStore | None = None,
+        edit_job_notes: bool = True,
+        write_client=None,
+    ):
+        self.settings = settings
+        self.state_store = state_store
+        self.supabase = supabase
+        self.company_id = company_id
+        self.run_started_at = run_started_at
+        # Set by `--record`: job pages and photos are saved as they are read.
+        self.fixtures = fixtures
+        self.edit_job_notes = edit_job_notes
+        # Guards the counters, issues and seen ids only; row lookups and writes
+        # run outside it so DB round trips from different jobs overlap.
+        self.lock = threading.RLock()
+        self.totals = Counter()
+        self.photo_counts = Counter()
+        self.issues = []
+        self.metrics = SyncMetrics()
+        # Touched in one go by `reconcile` at the end of the run.
+        self.seen_remnant_ids: set[int] = set()
+        # Set by `start_checkpoint` / `resume_checkpoint`: job positions in the run.
+        self.checkpointing = False
+        self.job_positions: dict[str, int] = {}
+        # Jobs waiting on photos or writes; settled from worker and writer threads.
+        self.open_jobs: dict[str, OpenJob] = {}
+        self.issue_job_urls: set[str] = set()
+        self.jobs_lock = threading.Lock()
+        # Batch mode: `after_writes` callbacks for the next `flush_writes`.
+        self.flush_callbacks = []
+        # Batch mode: the single writer lock around the batch writer and `flush_callbacks`.
+        self.write_lock = threading.Lock()
+
+        self.lookups = LookupCache(supabase).preload()
+        self.brand_index = load_brand_index(
+            supabase,
+            settings.brand_source,
+            cache_ttl_hours=settings.brand_cache_ttl_hours,
+        )
+        self.batch_writer = None
+        if settings.batch_upsert:
+            self.batch_writer = RemnantBatchWriter(
+                supabase,
+                company_id,
+                run_started_at,
+                chunk_size=settings.upsert_chunk_size,
+            ).prefetch()
+        # Batch mode already amortizes its writes; the async path is for per-row writes.
+        self.async_writer = None
+        if settings.async_writes and not settings.batch_upsert:
+            self.async_writer = AsyncWriter(
+                write_client or supabase,
+                max_in_flight=settings.async_max_in_flight,
+                metrics=self.metrics,
+            )
+        profile = ENCODER_PROFILES[settings.image_profile]
+        if settings.image_max_dimension:
+            profile = replace(profile, max_dimension=settings.image_max_dimension)
+        self.encode = partial(normalize_image, profile=profile, variants=settings.image_variants)
+        self.transport = transport or Transport.from_settings(settings)
+        if fixtures:
+            self.transport = RecordingTransport(self.transport, fixtures)
+        self.content_store = None
+        if settings.content_addressed_storage:
+            self.content_store = ContentStore(supabase, settings.supabase_bucket)
+        self.image_pipeline = None
+        if settings.image_workers > 0:
+            self.image_pipeline = ImagePipeline(
+                supabase,
+                settings.supabase_bucket,
+                workers=settings.image_workers,
+                encode_processes=settings.image_encode_processes,
+                max_pending=settings.image_queue_size,
+                stats=self.metrics,
+                encode=self.encode,
+                variants=settings.image_variants,
+                content_store=self.content_store,
+                transport=self.transport,
+                on_result=self.on_photo_result,
+                on_failure=self.on_photo_failure,
+            )
 
-                    description = ""
-                    for td in tds:
-                        text = (td.text or "").strip()
-                        if re.search(r"#\d+", text):
-                            description = text
-                            break
-                    if not description:
-                        continue
+    def count(self, key: str, amount: int = 1) -> None:
+        with self.lock:
+            self.totals[key] += amount
 
-                    m_id = re.search(r"#(\d+)", description)
-                    if not m_id:
-                        continue
+    def record_issue(self, kind: str, job_url: str | None = None, remnant_id: int | None = None, details: str = ""):
+        issue = {
+            "kind": kind,
+            "job_url": job_url,
+            "remnant_id": remnant_id,
+            "details": details,
+        }
+        with self.lock:
+            self.issues.append(issue)
+        if job_url:
+            with self.jobs_lock:
+                self.issue_job_urls.add(job_url)
+        if self.checkpointing:
+            self.state_store.journal(self.run_started_at, [("issue", job_url, remnant_id, json.dumps(issue))])
+
+    def start_checkpoint(self, job_urls: list[str], fingerprints: dict[str, str], skipped_remnant_ids: list[int]):
+        """Records the job list of a new run so a crash can be resumed from here."""
+        if not self.state_store:
+            return
+        self.state_store.start_run(
+            self.run_started_at,
+            job_urls,
+            {job_url: fingerprints[job_url] for job_url in job_urls if job_url in fingerprints},
+            skipped_remnant_ids,
+        )
+        self.job_positions = {job_url: index for index, job_url in enumerate(job_urls)}
+        self.checkpointing = True
+
+    def resume_checkpoint(self, checkpoint: RunCheckpoint) -> None:
+        """Restores the issues and seen remnants of the jobs an earlier attempt finished."""
+        self.issues.extend(checkpoint.issues)
+        self.seen_remnant_ids.update(checkpoint.skipped_remnant_ids)
+        for remnant_ids in checkpoint.completed.values():
+            self.seen_remnant_ids.update(remnant_ids)
+        # Otherwise an unfinished job's old issues would come back once its retry completes.
+        self.state_store.drop_journal(self.run_started_at, checkpoint.remaining_job_urls)
+        self.state_store.start_run(self.run_started_at, checkpoint.job_urls, checkpoint.fingerprints, [])
+        self.job_positions = {job_url: index for index, job_url in enumerate(checkpoint.job_urls)}
+        self.checkpointing = True
+
+    def open_job(
+        self,
+        job_url: str,
+        remnant_ids: list[int],
+        photos: int = 0,
+        fingerprint: str | None = None,
+        file_rows: list[FileRow] = (),
+    ) -> None:
+        """Tracks a job until its row writes and `photos` pipeline photos have landed."""
+        job = OpenJob(
+            job_url,
+            remnant_ids,
+            fingerprint=fingerprint,
+            file_hrefs=[row.download_href for row in file_rows if row.download_href],
+            outstanding=photos + 1,
+        )
+        with self.jobs_lock:
+            previous = self.open_jobs.get(job_url)
+            if previous:
+                # A retried attempt: its photos still settle here, its row writes never will.
+                job.outstanding += previous.outstanding - 1
+                job.failed = previous.failed
+            self.open_jobs[job_url] = job
+
+    def checkpoint_job(self, job_url: str, journal: list[tuple]) -> None:
+        """Journals a job's row outcomes; the job settles once its row writes have landed."""
+        if self.checkpointing:
+            self.state_store.journal(self.run_started_at, journal)
+        self.after_writes(job_url, partial(self.settle_job, job_url))
+
+    def after_writes(self, job_url: str | None, callback) -> None:
+        """Calls `callback(ok)` once the writes queued so far for `job_url` have landed."""
+        if self.async_writer:
+            self.async_writer.after_pending(callback, job_url=job_url)
+        elif self.batch_writer:
+            with self.write_lock:
+                self.flush_callbacks.append((job_url, callback))
+        else:
+            callback(True)
+
+    def settle_job(self, job_url: str, ok: bool = True) -> None:
+        """
+        Counts down a job's outstanding work. The last piece remembers its
+        fingerprint and marks it done in the checkpoint, or reopens it when
+        any photo or write failed.
+        """
+        with self.jobs_lock:
+            job = self.open_jobs.get(job_url)
+            if job is None:
+                return
+            job.failed = job.failed or not ok
+            job.outstanding -= 1
+            if job.outstanding > 0:
+                return
+            del self.open_jobs[job_url]
+        if job.failed:
+            self.reopen_job(job_url)
+            return
+        self.remember_job(job_url, job.fingerprint, job.remnant_ids, job.file_hrefs)
+        if self.checkpointing:
+            self.state_store.complete_run_job(
+                self.run_started_at, self.job_positions.get(job_url, -1), job_url, job.remnant_ids
+            )
 
-                    remnant_id_from_desc = int(m_id.group(1))
-                    remnant_ids_for_job.append(remnant_id_from_desc)
-                    total_with_id += 1
+    def fail_job(self, job_url: str) -> None:
+        """Reopens a job now, and keeps it from completing if it is still in flight."""
+        with self.jobs_lock:
+            job = self.open_jobs.get(job_url)
+            if job:
+                job.failed = True
+        self.reopen_job(job_url)
+
+    def reopen_job(self, job_url: str) -> None:
+        """Forgets a job so the next incremental run and `--resume` both process it again."""
+        if not self.state_store:
+            return
+        self.state_store.forget_job(job_url)
+        if self.checkpointing:
+            self.state_store.reopen_run_job(self.run_started_at, job_url)
+
+    def save_photo_columns(self, remnant_id: int, payload: dict, job_url: str | None = None):
+        if self.batch_writer:
+            with self.write_lock:
+                self.batch_writer.stage_photo_update(remnant_id, payload, job_url)
+        elif self.async_writer:
+            self.async_writer.submit(
+                remnant_id,
+                lambda client: client.table("remnants").update(payload).eq("moraware_remnant_id", remnant_id),
+                description="photo columns",
+                job_url=job_url,
+            )
+        else:
+            self.supabase.table("remnants").update(payload).eq("moraware_remnant_id", remnant_id).execute()
+
+    def record_photo_result(self, result: PhotoResult, job_url: str | None = None):
+        with self.lock:
+            self.photo_counts[result.outcome] += 1
+            if result.outcome != "not_modified":
+                self.photo_counts["downloaded"] += 1
+        if result.columns:
+            self.save_photo_columns(result.remnant_id, result.columns, job_url)
+        if result.outcome == "uploaded":
+            logging.info(f"Remnant #{result.remnant_id}: photo uploaded + DB updated")
+
+    def on_photo_result(self, photo_job: ImageJob, result: PhotoResult) -> None:
+        """Image pipeline callback; the job settles once the photo columns are written."""
+        self.record_photo_result(result, photo_job.job_url)
+        self.after_writes(photo_job.job_url, partial(self.settle_job, photo_job.job_url))
+
+    def on_photo_failure(self, photo_job: ImageJob, exc: Exception) -> None:
+        self.count("errors")
+        self.record_issue(
+            "photo_too_large" if isinstance(exc, ImageTooLargeError) else "photo_exception",
+            job_url=photo_job.job_url,
+            remnant_id=photo_job.remnant_id,
+            details=str(exc),
+        )
+        self.settle_job(photo_job.job_url, ok=False)
+
+    def sync_row(
+        self,
+        job_url: str,
+        raw_name: str,
+        material: str,
+        row: FileRow,
+        cookies: list[dict],
+    ) -> tuple[int | None, ImageJob | None, str]:
+        """
+        Writes one file row to `remnants`. Returns the remnant id found in the
+        description, the photo job to run for it, if any, and the row outcome
+        (`changed`, `no_change` or `skipped`) for the checkpoint journal.
+        """
+        supabase = self.supabase
+        lookups = self.lookups
+        batch_writer = self.batch_writer
+        company_id = self.company_id
+        run_started_at = self.run_started_at
+
+        description = row.description
+        m_id = re.search(r"#(\d+)", description)
+        if not m_id:
+            return None, None, "skipped"
+
+        remnant_id_from_desc = int(m_id.group(1))
+        self.count("with_id")
+
+        parse_started = time.monotonic()
+        parsed = parse_description(description, raw_name)
+        if not parsed:
+            self.metrics.add("row_parse", time.monotonic() - parse_started)
+            logging.warning(
+                f"Remnant #{m_id.group(1)}: could not parse size from '{description}'"
+            )
+            self.record_issue(
+                "parse_size_failed",
+                job_url=job_url,
+                remnant_id=remnant_id_from_desc,
+                details=description,
+            )
+            return remnant_id_from_desc, None, "skipped"
+
+        remnant_id, width, height, l_shape, l_width, l_height, remnant_status = parsed.as_line()
+        normalized_status = normalize_status(remnant_status)
+        thickness = parsed.thickness
+        finish_name = parsed.finish
+        stone_identity = parse_brand_and_stone_name(raw_name, self.brand_index)
+        display_name = stone_identity["display_name"] or raw_name
+        stone_name = stone_identity["stone_name"] or display_name
+        brand_name = stone_identity["brand_name"]
+        supplier_name = stone_identity["supplier_name"]
+        if thickness == "unknown" and brand_name == "Quick Color":
+            thickness = "3cm"
+        if not finish_name and brand_name == "Quick Color":
+            finish_name = "Polished"
+        self.metrics.add("row_parse", time.monotonic() - parse_started)
+
+        if not row.has_download_link:
+            logging.warning(f"Remnant #{remnant_id}: no download link found")
+            self.record_issue("missing_download_link", job_url=job_url, remnant_id=remnant_id)
+            return remnant_id_from_desc, None, "skipped"
+
+        download_href = row.download_href
+        if not download_href:
+            logging.warning(f"Remnant #{remnant_id}: download href was empty")
+            self.record_issue("empty_download_href", job_url=job_url, remnant_id=remnant_id)
+            return remnant_id_from_desc, None, "skipped"
+
+        full_url = (
+            "https://quickcountertop.moraware.net" + download_href
+            if download_href.startswith("/")
+            else download_href
+        )
 
-                    size_parsed = parse_line(description)
-                    if not size_parsed:
-                        logging.warning(
-                            f"Remnant #{m_id.group(1)}: could not parse size from '{description}'"
-                        )
-                        record_issue(
-                            "parse_size_failed",
-                            job_url=job_url,
-                            remnant_id=remnant_id_from_desc,
-                            details=description,
-                        )
-                        continue
+        # Lookups are answered from memory; a miss holds the cache lock for its insert.
+        with lookups.lock, self.metrics.phase("db_lookup") as sample:
+            lookup_requests_before = lookups.db_reads + lookups.db_writes
+            material_key = material.strip() or "Other"
+            thickness_key = thickness.strip() or "Other"
+            material_id = lookups.get_or_create_lookup_id("materials", material_key)
+            thickness_id = lookups.get_or_create_lookup_id("thicknesses", thickness_key)
+            finish_id = lookups.get_or_create_lookup_id("finishes", finish_name) if finish_name else None
+            supplier_id = lookups.get_or_create_supplier_id(supplier_name)
+            lookups.ensure_supplier_brand(supplier_id, brand_name, material_id)
+            stone_product_id = lookups.get_or_create_stone_product_id(
+                material_id=material_id,
+                display_name=display_name,
+                stone_name=stone_name,
+                brand_name=brand_name,
+            )
+            parent_slab_id = lookups.find_parent_slab_id(stone_product_id)
+            sample["requests"] = lookups.db_reads + lookups.db_writes - lookup_requests_before
 
-                    remnant_id, width, height, l_shape, l_width, l_height, remnant_status = size_parsed
-                    normalized_status = normalize_status(remnant_status)
-                    thickness = parse_thickness(description)
-                    finish_name = parse_finish(f"{raw_name} {description}")
-                    material_key = material.strip() or "Other"
-                    thickness_key = thickness.strip() or "Other"
-                    material_id = material_ids.get(material_key)
-                    if material_id is None:
-                        material_id = get_or_create_lookup_id(supabase, "materials", material_key)
-                        material_ids[material_key] = material_id
-                    thickness_id = thickness_ids.get(thickness_key)
-                    if thickness_id is None:
-                        thickness_id = get_or_create_lookup_id(supabase, "thicknesses", thickness_key)
-                        thickness_ids[thickness_key] = thickness_id
-                    finish_id = get_or_create_lookup_id(supabase, "finishes", finish_name) if finish_name else None
-
-                    download_links = tds[1].find_elements(By.TAG_NAME, "a")
-                    if not download_links:
-                        logging.warning(f"Remnant #{remnant_id}: no download link found")
-                        record_issue("missing_download_link", job_url=job_url, remnant_id=remnant_id)
-                        continue
+        logging.info(
+            f"Remnant #{remnant_id} | {material} | {display_name} | "
+            f"Stone='{stone_name}' | Brand='{brand_name or ''}' | "
+            f"Size {width}x{height} | L-shape={bool(l_shape)} | Status={normalized_status}"
+        )
 
-                    download_href = download_links[0].get_attribute("href")
-                    if not download_href:
-                        logging.warning(f"Remnant #{remnant_id}: download href was empty")
-                        record_issue("empty_download_href", job_url=job_url, remnant_id=remnant_id)
-                        continue
+        base_payload = {
+            "moraware_remnant_id": remnant_id,
+            "company_id": company_id,
+            "material_id": material_id,
+            "thickness_id": thickness_id,
+            "finish_id": finish_id,
+            "name": stone_name,
+            "width": width,
+            "height": height,
+            "l_shape": bool(l_shape),
+            "l_width": l_width,
+            "l_height": l_height,
+            "stone_product_id": stone_product_id,
+            "parent_slab_id": parent_slab_id,
+            "status": normalized_status,
+            "hash": sha256_bytes(
+                "|".join(
+                    [
+                        str(remnant_id),
+                        str(company_id),
+                        str(material_id),
+                        str(thickness_id),
+                        str(finish_id or ""),
+                        display_name,
+                        stone_name,
+                        str(stone_product_id or ""),
+                        str(parent_slab_id or ""),
+                        str(width),
+                        str(height),
+                        str(bool(l_shape)),
+                        str(l_width),
+                        str(l_height),
+                        normalized_status,
+                        full_url,
+                    ]
+                ).encode("utf-8")
+            ),
+            "source_image_url": full_url,
+            "last_seen_at": run_started_at,
+            "deleted_at": None,
+        }
 
-                    full_url = (
-                        "https://quickcountertop.moraware.net" + download_href
-                        if download_href.startswith("/")
-                        else download_href
+        with self.lock:
+            self.seen_remnant_ids.add(remnant_id)
+        with self.metrics.phase("db_write") as sample:
+            if batch_writer:
+                with self.write_lock:
+                    requests_before = batch_writer.db_requests
+                    existing_row = batch_writer.get(remnant_id) or {}
+                    staged = batch_writer.stage(base_payload, job_url=job_url)
+                    sample["requests"] = batch_writer.db_requests - requests_before
+                if staged:
+                    outcome = "changed"
+                    logging.info(f"Remnant #{remnant_id}: staged for upsert")
+                else:
+                    outcome = "no_change"
+                    logging.info(
+                        f"Remnant #{remnant_id}: hash unchanged, checking photo hash anyway"
                     )
-
-                    stone_identity = parse_brand_and_stone_name(raw_name)
-                    display_name = stone_identity["display_name"] or raw_name
-                    stone_name = stone_identity["stone_name"] or display_name
-                    brand_name = stone_identity["brand_name"]
-                    supplier_name = stone_identity["supplier_name"]
-                    if thickness == "unknown" and brand_name == "Quick Color":
-                        thickness = "3cm"
-                        thickness_key = thickness
-                        thickness_id = thickness_ids.get(thickness_key)
-                        if thickness_id is None:
-                            thickness_id = get_or_create_lookup_id(supabase, "thicknesses", thickness_key)
-                            thickness_ids[thickness_key] = thickness_id
-                    if not finish_name and brand_name == "Quick Color":
-                        finish_name = "Polished"
-                        finish_id = get_or_create_lookup_id(supabase, "finishes", finish_name)
-                    supplier_id = get_or_create_supplier_id(supabase, supplier_name)
-                    ensure_supplier_brand(supabase, supplier_id, brand_name, material_id)
-                    stone_product_id = get_or_create_stone_product_id(
-                        supabase,
-                        material_id=material_id,
-                        display_name=display_name,
-                        stone_name=stone_name,
-                        brand_name=brand_name,
+            else:
+                if self.async_writer:
+                    # Read after any queued write for this remnant has landed.
+                    self.async_writer.wait_for(remnant_id)
+                existing = (
+                    supabase.table("remnants")
+                    .select(
+                        "id,company_id,material_id,thickness_id,finish_id,name,width,height,l_shape,l_width,l_height,status,"
+                        "source_image_url,deleted_at,last_seen_at,hash,photo_hash,image,image_path,image_variants,"
+                        "stone_product_id,parent_slab_id,photo_source_etag,photo_source_last_modified,"
+                        "photo_source_length,photo_source_hash"
                     )
-                    parent_slab_id = find_parent_slab_id(supabase, stone_product_id)
-
-                    logging.info(
-                        f"Remnant #{remnant_id} | {material} | {display_name} | "
-                        f"Stone='{stone_name}' | Brand='{brand_name or ''}' | "
-                        f"Size {width}x{height} | L-shape={bool(l_shape)} | Status={normalized_status}"
+                    .eq("moraware_remnant_id", remnant_id)
+                    .limit(1)
+                    .execute()
+                )
+                sample["requests"] += 1
+                existing_row = get_first_row(existing.data)
+
+                if not existing_row and self.async_writer:
+                    self.async_writer.submit(
+                        remnant_id,
+                        lambda client: client.table("remnants").insert(base_payload),
+                        description="insert",
+                        job_url=job_url,
                     )
-
-                    existing = (
+                    outcome = "changed"
+                    logging.info(f"Remnant #{remnant_id}: insert queued")
+                    # A new row has no photo columns to read back.
+                    existing_row = {}
+                elif not existing_row:
+                    inserted = supabase.table("remnants").insert(base_payload).execute()
+                    sample["requests"] += 2
+                    if not get_first_row(inserted.data):
+                        raise RuntimeError(f"Insert failed for Moraware remnant #{remnant_id}")
+                    outcome = "changed"
+                    logging.info(f"Remnant #{remnant_id}: inserted")
+                    existing_row = (
                         supabase.table("remnants")
                         .select(
-                            "id,company_id,material_id,thickness_id,finish_id,name,width,height,l_shape,l_width,l_height,status,"
-                            "source_image_url,deleted_at,last_seen_at,photo_hash,image,image_path,"
-                            "stone_product_id,parent_slab_id"
+                            "id,photo_hash,image,image_path,image_variants,photo_source_etag,"
+                            "photo_source_last_modified,photo_source_length,photo_source_hash"
                         )
                         .eq("moraware_remnant_id", remnant_id)
                         .limit(1)
                         .execute()
                     )
-                    existing_row = get_first_row(existing.data)
-
-                    base_payload = {
-                        "moraware_remnant_id": remnant_id,
-                        "company_id": company_id,
-                        "material_id": material_id,
-                        "thickness_id": thickness_id,
-                        "finish_id": finish_id,
-                        "name": stone_name,
-                        "width": width,
-                        "height": height,
-                        "l_shape": bool(l_shape),
-                        "l_width": l_width,
-                        "l_height": l_height,
-                        "stone_product_id": stone_product_id,
-                        "parent_slab_id": parent_slab_id,
-                        "status": normalized_status,
-                        "hash": sha256_bytes(
-                            "|".join(
-                                [
-                                    str(remnant_id),
-                                    str(company_id),
-                                    str(material_id),
-                                    str(thickness_id),
-                                    str(finish_id or ""),
-                                    display_name,
-                                    stone_name,
-                                    str(stone_product_id or ""),
-                                    str(parent_slab_id or ""),
-                                    str(width),
-                                    str(height),
-                                    str(bool(l_shape)),
-                                    str(l_width),
-                                    str(l_height),
-                                    normalized_status,
-                                    full_url,
-                                ]
-                            ).encode("utf-8")
-                        ),
-                        "source_image_url": full_url,
-                        "last_seen_at": run_started_at,
-                        "deleted_at": None,
-                    }
-
-                    if not existing_row:
-                        inserted = supabase.table("remnants").insert(base_payload).execute()
-                        if not get_first_row(inserted.data):
-                            raise RuntimeError(f"Insert failed for Moraware remnant #{remnant_id}")
-                        total_changed += 1
-                        logging.info(f"Remnant #{remnant_id}: inserted")
-                        existing_row = (
-                            supabase.table("remnants")
-                            .select("id,photo_hash,image,image_path")
-                            .eq("moraware_remnant_id", remnant_id)
-                            .limit(1)
-                            .execute()
+                    existing_row = get_first_row(existing_row.data) or {}
+                elif (
+                    existing_row.get("hash") == base_payload["hash"]
+                    and existing_row.get("deleted_at") is None
+                ):
+                    # Only last_seen_at would change; `reconcile` bumps it for every seen id in one call.
+                    outcome = "no_change"
+                    logging.info(
+                        f"Remnant #{remnant_id}: hash unchanged, checking photo hash anyway"
+                    )
+                else:
+                    metadata_changed = any(
+                        [
+                            existing_row.get("company_id") != company_id,
+                            existing_row.get("material_id") != material_id,
+                            existing_row.get("thickness_id") != thickness_id,
+                            existing_row.get("finish_id") != finish_id,
+                            existing_row.get("name") != stone_name,
+                            existing_row.get("stone_product_id") != stone_product_id,
+                            existing_row.get("parent_slab_id") != parent_slab_id,
+                            existing_row.get("width") != width,
+                            existing_row.get("height") != height,
+                            bool(existing_row.get("l_shape")) != bool(l_shape),
+                            existing_row.get("l_width") != l_width,
+                            existing_row.get("l_height") != l_height,
+                            normalize_status(existing_row.get("status")) != normalized_status,
+                            existing_row.get("source_image_url") != full_url,
+                            existing_row.get("deleted_at") is not None,
+                        ]
+                    )
+                    if self.async_writer:
+                        self.async_writer.submit(
+                            remnant_id,
+                            lambda client: client.table("remnants")
+                            .update(base_payload)
+                            .eq("moraware_remnant_id", remnant_id),
+                            description="update",
+                            job_url=job_url,
                         )
-                        existing_row = get_first_row(existing_row.data) or {}
                     else:
-                        metadata_changed = any(
-                            [
-                                existing_row.get("company_id") != company_id,
-                                existing_row.get("material_id") != material_id,
-                                existing_row.get("thickness_id") != thickness_id,
-                                existing_row.get("finish_id") != finish_id,
-                                existing_row.get("name") != stone_name,
-                                existing_row.get("stone_product_id") != stone_product_id,
-                                existing_row.get("parent_slab_id") != parent_slab_id,
-                                existing_row.get("width") != width,
-                                existing_row.get("height") != height,
-                                bool(existing_row.get("l_shape")) != bool(l_shape),
-                                existing_row.get("l_width") != l_width,
-                                existing_row.get("l_height") != l_height,
-                                normalize_status(existing_row.get("status")) != normalized_status,
-                                existing_row.get("source_image_url") != full_url,
-                                existing_row.get("deleted_at") is not None,
-                            ]
-                        )
                         supabase.table("remnants").update(base_payload).eq(
                             "moraware_remnant_id", remnant_id
                         ).execute()
-                        if metadata_changed:
-                            total_changed += 1
-                            logging.info(f"Remnant #{remnant_id}: metadata updated")
-                        else:
-                            total_no_change += 1
-                            logging.info(
-                                f"Remnant #{remnant_id}: metadata unchanged, checking photo hash anyway"
-                            )
-
-                    logging.info(f"Remnant #{remnant_id}: downloading image bytes")
-                    img_resp = sess.get(full_url, timeout=30)
-                    img_resp.raise_for_status()
-                    img_bytes = img_resp.content
-                    original_content_type = (img_resp.headers.get("Content-Type") or "").split(";")[0].strip()
-                    total_photo_downloaded += 1
-
-                    try:
-                        img_bytes, content_type, ext = normalize_image_bytes(img_bytes, original_content_type)
+                        sample["requests"] += 1
+                    if metadata_changed:
+                        outcome = "changed"
+                        logging.info(f"Remnant #{remnant_id}: metadata updated")
+                    else:
+                        outcome = "no_change"
                         logging.info(
-                            f"Remnant #{remnant_id}: normalized image to '{content_type or original_content_type or 'image/jpeg'}'"
+                            f"Remnant #{remnant_id}: metadata unchanged, checking photo hash anyway"
                         )
-                    except Exception as normalize_exc:
-                        logging.warning(
-                            f"Remnant #{remnant_id}: image normalization failed, uploading original bytes instead ({normalize_exc})"
-                        )
-                        content_type = original_content_type
-                        ext = infer_extension(full_url, content_type)
+        self.count(outcome)
+
+        photo_job = ImageJob(
+            remnant_id=remnant_id,
+            full_url=full_url,
+            existing_row=dict(existing_row or {}),
+            job_url=job_url,
+            cookies=cookies,
+        )
+        return remnant_id_from_desc, photo_job, outcome
 
-                    new_photo_hash = sha256_bytes(img_bytes)
-                    logging.info(f"Remnant #{remnant_id}: photo_hash={new_photo_hash[:12]}...")
+    def sync_photo_inline(self, photo_job: ImageJob) -> None:
+        try:
+            self.record_photo_result(
+                sync_remnant_photo(
+                    photo_job,
+                    self.transport,
+                    self.supabase,
+                    self.settings.supabase_bucket,
+                    encode=self.encode,
+                    stats=self.metrics,
+                    variants=self.settings.image_variants,
+                    content_store=self.content_store,
+                ),
+                photo_job.job_url,
+            )
+        except Exception as exc:
+            self.count("errors")
+            logging.error(f"Remnant #{photo_job.remnant_id}: photo sync failed: {exc}", exc_info=True)
+            self.record_issue(
+                "photo_too_large" if isinstance(exc, ImageTooLargeError) else "row_exception",
+                job_url=photo_job.job_url,
+                remnant_id=photo_job.remnant_id,
+                details=f"photo error={exc}",
+            )
 
-                    existing_hash = existing_row.get("photo_hash")
-                    existing_image = existing_row.get("image")
-                    existing_image_path = existing_row.get("image_path")
+    def load_job_page(self, driver, job_url: str, cookies: list[dict]) -> JobPage | None:
+        """Returns None when an http-mode GET fails with an HTTP error; the issue is already recorded."""
+        mode = self.settings.job_page_mode
+        with self.metrics.phase("job_page_load", requests=1) as sample:
+            if mode == "http":
+                self.transport.update_cookies(cookies)
+                response = self.transport.get(job_url)
+                try:
+                    response.raise_for_status()
+                except requests.HTTPError as exc:
+                    logging.warning(f"Job page request failed: {exc}. Skipping job page.")
+                    self.record_issue("job_page_http_error", job_url=job_url, details=str(exc))
+                    return None
+                sample["bytes"] = len(response.content or b"")
+                self.record_job_page(job_url, response.text)
+                return parse_job_page_html(response.text, job_url)
 
-                    if existing_hash == new_photo_hash and existing_image:
-                        total_photo_skipped_same_hash += 1
-                        logging.info(f"Remnant #{remnant_id}: photo unchanged, skipping upload")
+            driver.get(job_url)
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.ID, "FilesScroll1Body"))
+                )
+            except Exception:
+                self.record_job_page(job_url, driver.page_source)
+                return JobPage(url=job_url, title=driver.title or "")
+
+            if mode == "selenium":
+                self.record_job_page(job_url, driver.page_source)
+                return read_job_page(driver, job_url)
+            html = driver.page_source
+            sample["bytes"] = len(html.encode("utf-8"))
+            self.record_job_page(job_url, html)
+            return parse_job_page_html(html, job_url)
+
+    def record_job_page(self, job_url: str, html: str) -> None:
+        if self.fixtures:
+            self.fixtures.save_job_page(job_url, html)
+
+    def touch_unchanged_remnants(self, remnant_ids: list[int]) -> None:
+        """Marks remnants on skipped (unchanged) jobs as seen in this run."""
+        if not remnant_ids:
+            return
+        with self.lock:
+            self.seen_remnant_ids.update(remnant_ids)
+        logging.info(f"Marked {len(remnant_ids)} remnants on unchanged jobs as seen")
+
+    def reconcile(self, soft_delete: bool) -> dict[str, int]:
+        """
+        Touches `last_seen_at` for every remnant seen this run and, when
+        `soft_delete` is set, soft-deletes the company's Moraware rows that
+        were not seen. Returns the touched/deleted counts.
+        """
+        seen_ids = sorted(self.seen_remnant_ids)
+        with self.metrics.phase("db_write", requests=1):
+            try:
+                response = self.supabase.rpc(
+                    "reconcile_moraware_remnants",
+                    {
+                        "p_company_id": self.company_id,
+                        "p_run_started_at": self.run_started_at,
+                        "p_seen_remnant_ids": seen_ids,
+                        "p_soft_delete": soft_delete,
+                    },
+                ).execute()
+                row = get_first_row(response.data) or {}
+                return {
+                    "touched": int(row.get("touched_count") or 0),
+                    "deleted": int(row.get("deleted_count") or 0),
+                }
+            except Exception as exc:
+                logging.warning(
+                    f"reconcile_moraware_remnants RPC failed ({exc}); "
+                    "falling back to PostgREST updates"
+                )
+
+        with self.metrics.phase("db_write") as sample:
+            sample["requests"] = touch_last_seen(
+                self.supabase, seen_ids, self.run_started_at, self.settings.upsert_chunk_size
+            )
+            deleted = 0
+            if soft_delete:
+                reconciliation = (
+                    self.supabase.table("remnants")
+                    .update({"deleted_at": now_iso_utc()})
+                    .eq("company_id", self.company_id)
+                    .filter("moraware_remnant_id", "not.is", "null")
+                    .lt("last_seen_at", self.run_started_at)
+                    .filter("deleted_at", "is", "null")
+                    .execute()
+                )
+                sample["requests"] += 1
+                deleted = len(reconciliation.data or []) if isinstance(reconciliation.data, list) else 0
+        return {"touched": len(seen_ids), "deleted": deleted}
+
+    def remember_job(self, job_url: str, fingerprint: str | None, remnant_ids: list[int], file_hrefs: list[str]):
+        """Records a cleanly processed job so the next incremental run can skip it."""
+        if not self.state_store or not fingerprint:
+            return
+        with self.jobs_lock:
+            if job_url in self.issue_job_urls:
+                return
+        self.state_store.save_job(job_url, fingerprint, remnant_ids, file_hrefs, self.run_started_at)
+
+    def process_job(self, driver, wait, job_url: str, fingerprint: str | None = None) -> None:
+        cookies = driver.get_cookies()
+        page = self.load_job_page(driver, job_url, cookies)
+        if page is None:
+            self.open_job(job_url, [])
+            self.checkpoint_job(job_url, [])
+            return
+        if not page.has_files_table:
+            logging.warning("No files table found (FilesScroll1Body). Skipping job page.")
+            self.record_issue("missing_files_table", job_url=job_url)
+            self.open_job(job_url, [])
+            self.checkpoint_job(job_url, [])
+            return
+
+        material_from_title, name_from_title = get_page_material_and_name(page.title)
+        raw_name = name_from_title or "unknown"
+        material = material_from_title or "Other"
+        file_rows = page.file_rows
+        logging.info(f"Found {max(0, len(file_rows) - 1)} file rows on page")
+
+        remnant_ids_for_job = []
+        photo_jobs = []
+        journal = []
+        self.count("rows_seen", len(file_rows))
+        for row in file_rows:
+            try:
+                if row.error:
+                    raise RuntimeError(row.error)
+                if not row.description:
+                    continue
+                remnant_id_from_desc, photo_job, outcome = self.sync_row(job_url, raw_name, material, row, cookies)
+                if remnant_id_from_desc is not None:
+                    remnant_ids_for_job.append(remnant_id_from_desc)
+                    journal.append((outcome, job_url, remnant_id_from_desc, f"row={row.index}"))
+                if photo_job:
+                    photo_jobs.append(photo_job)
+            except Exception as exc:
+                journal.append(("error", job_url, None, f"row={row.index} error={exc}"))
+                self.count("errors")
+                logging.error(f"Error processing row {row.index} on job page: {exc}", exc_info=True)
+                self.record_issue(
+                    "row_exception",
+                    job_url=job_url,
+                    details=f"row={row.index} error={exc}",
+                )
+
+        self.open_job(
+            job_url,
+            remnant_ids_for_job,
+            photos=len(photo_jobs) if self.image_pipeline else 0,
+            fingerprint=fingerprint,
+            file_rows=file_rows,
+        )
+        if self.image_pipeline:
+            for photo_job in photo_jobs:
+                self.image_pipeline.submit(photo_job)
+        elif photo_jobs:
+            self.transport.update_cookies(cookies)
+            for photo_job in photo_jobs:
+                self.sync_photo_inline(photo_job)
+
+        self.flush_writes()
+        if remnant_ids_for_job and self.job_desc_is_current(page, remnant_ids_for_job):
+            logging.info("Job notes already contain current remnant ID list")
+        elif remnant_ids_for_job and not self.edit_job_notes:
+            self.count("job_notes_edits_skipped")
+        elif remnant_ids_for_job:
+            with self.metrics.phase("job_notes_edit", requests=1):
+                if self.settings.job_page_mode == "http":
+                    # The notes edit still needs the page open in the browser.
+                    driver.get(job_url)
+                update_job_desc_with_remnant_ids(driver, wait, remnant_ids_for_job)
+        self.checkpoint_job(job_url, journal)
+
+    def job_desc_is_current(self, page: JobPage, remnant_ids: list[int]) -> bool:
+        """Dry compare against the notes in the parsed page, so the edit dialog stays shut."""
+        if not self.settings.notes_dry_compare or page.job_desc is None:
+            return False
+        return build_job_desc(page.job_desc, remnant_ids) == page.job_desc
+
+    def flush_writes(self) -> None:
+        """Flushes queued lookup and remnant writes, then runs the `after_writes` callbacks they cover."""
+        with self.metrics.phase("db_write") as sample:
+            with self.lookups.lock:
+                writes_before = self.lookups.db_writes
+                self.lookups.flush()
+                sample["requests"] = self.lookups.db_writes - writes_before
+            if not self.batch_writer:
+                return
+            with self.write_lock:
+                requests_before = self.batch_writer.db_requests
+                callbacks, self.flush_callbacks = self.flush_callbacks, []
+                self.batch_writer.flush(touch_seen=False)
+                sample["requests"] += self.batch_writer.db_requests - requests_before
+                failures = self.batch_writer.pop_failures()
+        # Rows the database rejected become row errors; the rest of the run carries on.
+        self.record_write_failures(failures)
+        failed_job_urls = {failure.job_url for failure in failures}
+        for job_url, callback in callbacks:
+            callback(job_url not in failed_job_urls)
+
+    def drain_photos(self) -> None:
+        if self.image_pipeline:
+            logging.info("Draining image pipeline")
+            # Photos report through `on_photo_result` / `on_photo_failure` as they finish.
+            self.image_pipeline.drain()
+        if self.batch_writer:
+            # Also settles the jobs still waiting on a flush.
+            self.flush_writes()
+        self.drain_writes()
+
+    def drain_writes(self) -> None:
+        """Waits for queued async writes and records the ones that failed."""
+        if self.async_writer:
+            self.record_write_failures(self.async_writer.drain())
+
+    def record_write_failures(self, failures: list[WriteFailure]) -> None:
+        for failure in failures:
+            self.count("errors")
+            if failure.job_url:
+                self.fail_job(failure.job_url)
+            self.record_issue(
+                "write_exception",
+                job_url=failure.job_url,
+                remnant_id=failure.key,
+                details=f"{failure.description}: {failure.error}",
+            )
+
+    def close(self) -> None:
+        if self.image_pipeline:
+            self.image_pipeline.close()
+        if self.async_writer:
+            # Also runs the last `after_writes` callbacks, so no job settles after this.
+            self.record_write_failures(self.async_writer.close())
+        # After a failed run: queued photos were dropped, so these jobs must not be skipped next time.
+        with self.jobs_lock:
+            abandoned, self.open_jobs = list(self.open_jobs), {}
+        for job_url in abandoned:
+            self.reopen_job(job_url)
+
+
+def crawl_job_pages(
+    sync: RemnantSync,
+    drivers: list,
+    job_urls: list[str],
+    fingerprints: dict[str, str] | None = None,
+    restart_driver=None,
+    restart_after: int = 0,
+) -> None:
+    """
+    Hands job URLs to one worker per browser until the queue is empty. With
+    `restart_driver(worker_index, driver)`, a worker whose browser fails
+    `restart_after` times in a row gets a new one and retries the job.
+    """
+    pending = queue.Queue()
+    for job_i, job_url in enumerate(job_urls, start=1):
+        pending.put((job_i, job_url))
+    stop = threading.Event()
+
+    def run_worker(worker_index: int):
+        driver = drivers[worker_index]
+        wait = WebDriverWait(driver, 15)
+        failures = 0
+        restarts = 0
+        while not stop.is_set():
+            try:
+                job_i, job_url = pending.get_nowait()
+            except queue.Empty:
+                return
+            while True:
+                logging.info(f"[{job_i}/{len(job_urls)}] Processing job page: {job_url}")
+                try:
+                    sync.process_job(driver, wait, job_url, (fingerprints or {}).get(job_url))
+                    failures = 0
+                    break
+                except WebDriverException as exc:
+                    failures += 1
+                    if not restart_driver or restart_after <= 0:
+                        stop.set()
+                        raise
+                    logging.warning(f"Browser failure {failures}/{restart_after} on {job_url}: {exc}")
+                    if failures < restart_after:
                         continue
+                    if restarts >= MAX_DRIVER_RESTARTS:
+                        stop.set()
+                        raise
+                    restarts += 1
+                    failures = 0
+                    logging.warning(f"Worker {worker_index}: restarting browser ({restarts}/{MAX_DRIVER_RESTARTS})")
+                    try:
+                        driver = drivers[worker_index] = restart_driver(worker_index, driver)
+                    except Exception:
+                        stop.set()
+                        raise
+                    wait = WebDriverWait(driver, 15)
+                except Exception:
+                    stop.set()
+                    raise
+
+    if len(drivers) == 1:
+        run_worker(0)
+        return
 
-                    image_path = build_storage_path("remnant", remnant_id, ext)
+    with ThreadPoolExecutor(max_workers=len(drivers), thread_name_prefix="moraware-job") as executor:
+        futures = [executor.submit(run_worker, worker_index) for worker_index in range(len(drivers))]
+    for future in futures:
+        future.result()
 
-                    logging.info(
-                        f"Remnant #{remnant_id}: uploading to bucket='{settings.supabase_bucket}' "
-                        f"as '{image_path}' content_type='{content_type or 'image/jpeg'}'"
-                    )
 
-                    supabase.storage.from_(settings.supabase_bucket).upload(
-                        image_path,
-                        img_bytes,
-                        {"content-type": content_type or "image/jpeg", "upsert": "true"},
-                    )
-                    total_photo_uploaded += 1
-
-                    public_url = supabase.storage.from_(settings.supabase_bucket).get_public_url(image_path)
-                    supabase.table("remnants").update(
-                        {
-                            "photo_hash": new_photo_hash,
-                            "image_path": image_path,
-                            "image": public_url,
-                            "photo_synced_at": now_iso_utc(),
-                            "updated_at": now_iso_utc(),
-                        }
-                    ).eq("moraware_remnant_id", remnant_id).execute()
-
-                    logging.info(f"Remnant #{remnant_id}: photo uploaded + DB updated")
-
-                except Exception as exc:
-                    total_errors += 1
-                    logging.error(f"Error processing row {idx} on job page: {exc}", exc_info=True)
-                    record_issue(
-                        "row_exception",
-                        job_url=job_url,
-                        details=f"row={idx} error={exc}",
-                    )
-                    continue
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Sync Moraware remnants into Supabase.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Open every job page instead of only jobs whose job list row changed since the last run.",
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        metavar="DIR",
+        help="Save job list rows, job page HTML and photo bytes to DIR for offline replay (implies --full).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the last unfinished run from its checkpoint, keeping its run_started_at.",
+    )
+    return parser.parse_args(argv)
 
-            update_job_desc_with_remnant_ids(driver, wait, remnant_ids_for_job)
 
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    settings = load_settings()
+    supabase = create_client(settings.supabase_url, settings.supabase_key)
+    company_id = resolve_company_id(supabase, settings)
+    state_store = SyncStateStore()
+    checkpoint = state_store.unfinished_run() if args.resume else None
+    if args.resume and checkpoint is None:
+        logging.warning("--resume: no unfinished run to continue; starting a new run")
+    # A resumed run keeps its start time, so reconciliation still covers the whole crawl.
+    run_started_at = checkpoint.run_started_at if checkpoint else datetime.now(timezone.utc).isoformat()
+    fixtures = None
+    if args.record:
+        # Unchanged jobs are never opened, so a recording always crawls everything.
+        args.full = True
+        fixtures = FixtureStore(args.record)
+        logging.info(f"Recording Moraware fixtures to {args.record}")
+    sync = RemnantSync(
+        settings,
+        supabase,
+        company_id,
+        run_started_at,
+        state_store=state_store,
+        fixtures=fixtures,
+        write_client=partial(
+            connect_async_client, settings.supabase_url, settings.supabase_key, settings.async_max_in_flight
+        ),
+    )
+
+    driver = create_driver()
+    drivers = [driver]
+
+    def restart_driver(worker_index: int, old_driver):
+        try:
+            old_driver.quit()
+        except Exception:
+            pass
+        new_driver = create_driver(worker_index)
+        login(new_driver, settings)
+        return new_driver
+
+    crawl_completed_successfully = False
+    reconciliation_safe = False
+    totals = sync.totals
+    issues = sync.issues
+
+    try:
+        logging.info("Starting Moraware -> Supabase sync")
+
+        # ---- Login ----
+        with sync.metrics.phase("login", requests=2):
+            login(driver, settings)
+
+            # Go back to the job list URL (handles redirects)
+            driver.get(settings.moraware_url)
+            wait_for_job_list(driver, settings.moraware_url)
+
+        if checkpoint:
+            sync.resume_checkpoint(checkpoint)
+            job_fingerprints = checkpoint.fingerprints
+            job_urls = checkpoint.remaining_job_urls
+            logging.info(
+                f"Resuming run {run_started_at}: {len(checkpoint.completed)}/{len(checkpoint.job_urls)} "
+                f"job pages already done, {len(job_urls)} left"
+            )
+        else:
+            # ---- Collect job URLs ----
+            with sync.metrics.phase("list_collection"):
+                job_fingerprints = collect_job_urls(
+                    driver, settings, on_page=fixtures.save_job_list_page if fixtures else None
+                )
+            job_urls = list(job_fingerprints)
+            pruned = state_store.prune(job_urls)
+            if pruned:
+                logging.info(f"Dropped {pruned} jobs no longer on the job list from sync state")
+            skipped_remnant_ids = []
+            if not args.full:
+                previous_fingerprints = state_store.fingerprints()
+                unchanged_job_urls = [
+                    url for url in job_urls if previous_fingerprints.get(url) == job_fingerprints[url]
+                ]
+                unchanged = set(unchanged_job_urls)
+                job_urls = [url for url in job_urls if url not in unchanged]
+                logging.info(
+                    f"Incremental sync: {len(job_urls)} changed job pages, {len(unchanged_job_urls)} unchanged"
+                )
+                skipped_remnant_ids = state_store.remnant_ids_for(unchanged_job_urls)
+                sync.touch_unchanged_remnants(skipped_remnant_ids)
+            sync.start_checkpoint(job_urls, job_fingerprints, skipped_remnant_ids)
+
+        # ---- Process each job page ----
+        worker_count = max(1, min(settings.workers, len(job_urls)))
+        for worker_index in range(1, worker_count):
+            drivers.append(clone_driver_session(driver, settings, worker_index))
+        if worker_count > 1:
+            logging.info(f"Crawling job pages with {worker_count} browser workers")
+        crawl_job_pages(
+            sync,
+            drivers,
+            job_urls,
+            job_fingerprints,
+            restart_driver=restart_driver,
+            restart_after=settings.driver_restart_after,
+        )
+        sync.drain_photos()
+
+        photo_counts = sync.photo_counts
         logging.info("Sync complete")
-        logging.info(f"Total file rows seen: {total_rows_seen}")
-        logging.info(f"Rows with remnant id: {total_with_id}")
-        logging.info(f"Metadata changed: {total_changed}")
-        logging.info(f"Metadata no_change: {total_no_change}")
-        logging.info(f"Photos downloaded: {total_photo_downloaded}")
-        logging.info(f"Photos skipped (same hash): {total_photo_skipped_same_hash}")
-        logging.info(f"Photos uploaded: {total_photo_uploaded}")
-        logging.info(f"Errors: {total_errors}")
+        logging.info(f"Total file rows seen: {totals['rows_seen']}")
+        logging.info(f"Rows with remnant id: {totals['with_id']}")
+        logging.info(f"Metadata changed: {totals['changed']}")
+        logging.info(f"Metadata no_change: {totals['no_change']}")
+        logging.info(f"Photos downloaded: {photo_counts['downloaded']}")
+        logging.info(f"Photos not modified upstream (304): {photo_counts['not_modified']}")
+        logging.info(f"Photos skipped (same source bytes): {photo_counts['same_source']}")
+        logging.info(f"Photos skipped (same hash): {photo_counts['same_hash']}")
+        logging.info(f"Photos uploaded: {photo_counts['uploaded']}")
+        if sync.content_store:
+            logging.info(
+                f"Content-addressed objects uploaded/deduplicated: "
+                f"{sync.content_store.uploaded}/{sync.content_store.deduplicated}"
+            )
+        logging.info(f"Phase timings: {sync.metrics.summary() or 'no work'}")
+        logging.info(f"Errors: {totals['errors']}")
+        logging.info(f"Lookup DB reads/writes: {sync.lookups.db_reads}/{sync.lookups.db_writes}")
+        if sync.batch_writer:
+            logging.info(f"Batched remnant DB requests: {sync.batch_writer.db_requests}")
         if issues:
             kind_counts = Counter(i["kind"] for i in issues)
             logging.info("Issue summary by type:")
@@ -902,14 +1581,19 @@ def main():
         else:
             logging.info("Issue summary: no issues recorded.")
         crawl_completed_successfully = True
-        reconciliation_safe = total_errors == 0 and len(issues) == 0
+        reconciliation_safe = totals["errors"] == 0 and len(issues) == 0
 
     except Exception:
-        total_errors += 1
+        totals["errors"] += 1
         logging.exception("Fatal sync failure; skipping deletion reconciliation for safety.")
 
     finally:
-        driver.quit()
+        sync.close()
+        for worker_driver in drivers:
+            try:
+                worker_driver.quit()
+            except Exception as exc:
+                logging.warning(f"Could not close browser: {exc}")
         logging.info("Browser closed")
 
     report_path = Path(__file__).resolve().parent / "last_sync_issues.json"
@@ -919,7 +1603,7 @@ def main():
                 {
                     "run_started_at": run_started_at,
                     "crawl_completed_successfully": crawl_completed_successfully,
-                    "total_errors": total_errors,
+                    "total_errors": totals["errors"],
                     "issue_count": len(issues),
                     "issues": issues,
                 },
@@ -930,26 +1614,67 @@ def main():
     except Exception as exc:
         logging.warning(f"Could not write issue report: {exc}")
 
+    reconciliation = {}
     if crawl_completed_successfully and reconciliation_safe:
-        reconciliation = (
-            supabase.table("remnants")
-            .update({"deleted_at": now_iso_utc()})
-            .eq("company_id", company_id)
-            .filter("moraware_remnant_id", "not.is", "null")
-            .lt("last_seen_at", run_started_at)
-            .filter("deleted_at", "is", "null")
-            .execute()
-        )
-        logging.info(
-            "Soft-deleted stale Moraware remnants: %s",
-            len(reconciliation.data or []) if isinstance(reconciliation.data, list) else 0,
-        )
-    elif crawl_completed_successfully:
-        logging.warning(
-            "Skipped deletion reconciliation because the crawl had row-level issues or errors."
-        )
+        reconciliation = sync.reconcile(soft_delete=True)
+        logging.info(f"Touched last_seen_at for seen Moraware remnants: {reconciliation['touched']}")
+        logging.info(f"Soft-deleted stale Moraware remnants: {reconciliation['deleted']}")
+        if sync.content_store:
+            try:
+                with sync.metrics.phase("storage_gc"):
+                    reconciliation["gc_removed"] = collect_garbage(supabase, settings.supabase_bucket)
+            except Exception as exc:
+                logging.warning(f"Could not garbage collect content-addressed photos: {exc}")
     else:
-        logging.warning("Skipped reconcile_deletions because crawl did not complete successfully.")
+        if crawl_completed_successfully:
+            logging.warning(
+                "Skipped deletion reconciliation because the crawl had row-level issues or errors."
+            )
+        else:
+            logging.warning("Skipped reconcile_deletions because crawl did not complete successfully.")
+        try:
+            reconciliation = sync.reconcile(soft_delete=False)
+            logging.info(f"Touched last_seen_at for seen Moraware remnants: {reconciliation['touched']}")
+        except Exception as exc:
+            logging.warning(f"Could not touch last_seen_at for seen remnants: {exc}")
+
+    # Failed crawls stay resumable with --resume.
+    state_store.finish_run(run_started_at, "completed" if crawl_completed_successfully else "failed")
+    state_store.close()
+
+    metrics_report = {
+        "run_started_at": run_started_at,
+        "completed_at": now_iso_utc(),
+        "crawl_completed_successfully": crawl_completed_successfully,
+        "totals": dict(totals),
+        "photo_counts": dict(sync.photo_counts),
+        "lookup_db_reads": sync.lookups.db_reads,
+        "lookup_db_writes": sync.lookups.db_writes,
+        "reconciliation": reconciliation,
+        "phases": sync.metrics.report(),
+    }
+    metrics_path = Path(__file__).resolve().parent / "last_sync_metrics.json"
+    try:
+        metrics_path.write_text(json.dumps(metrics_report, indent=2))
+        logging.info(f"Wrote metrics report: {metrics_path}")
+    except Exception as exc:
+        logging.warning(f"Could not write metrics report: {exc}")
+
+    if settings.push_metrics:
+        try:
+            supabase.table("remnant_sync_runs").insert(
+                {
+                    "company_id": company_id,
+                    "status": "completed" if crawl_completed_successfully else "failed",
+                    "started_at": run_started_at,
+                    "completed_at": metrics_report["completed_at"],
+                    "error_count": totals["errors"],
+                    "issue_count": len(issues),
+                    "metrics": metrics_report,
+                }
+            ).execute()
+        except Exception as exc:
+            logging.warning(f"Could not push sync metrics to remnant_sync_runs: {exc}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,275 @@
+"""
+Local state for incremental Moraware syncs.
+
+Stores, per job URL, the fingerprint of its row on the job list page plus the
+remnant ids and file hrefs found the last time the job page was processed
+cleanly. Jobs whose fingerprint is unchanged can then be skipped, and their
+remnants touched in bulk so soft-delete reconciliation still sees them.
+
+Each run also leaves a checkpoint: the job URLs it set out to process, every
+job it finished and a journal of row outcomes and issues. `--resume` picks up
+the last unfinished run from there, under the same `run_started_at`.
+"""
+
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from scrapers.remnant_scraper.utils import now_iso_utc
+
+DEFAULT_STATE_PATH = Path(__file__).resolve().parent / "last_sync_state.sqlite3"
+# Checkpoints and journals older than this many runs are dropped.
+KEEP_RUNS = 10
+
+
+@dataclass
+class RunCheckpoint:
+    run_started_at: str
+    job_urls: list[str]
+    fingerprints: dict[str, str]
+    skipped_remnant_ids: list[int]
+    completed: dict[str, list[int]] = field(default_factory=dict)
+    issues: list[dict] = field(default_factory=list)
+
+    @property
+    def remaining_job_urls(self) -> list[str]:
+        return [job_url for job_url in self.job_urls if job_url not in self.completed]
+
+
+class SyncStateStore:
+    def __init__(self, path: Path = DEFAULT_STATE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        # Job workers record state from their own threads.
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            """
+            create table if not exists jobs (
+                job_url text primary key,
+                fingerprint text not null,
+                remnant_ids text not null default '[]',
+                file_hrefs text not null default '[]',
+                synced_at text not null
+            )
+            """
+        )
+        self._conn.executescript(
+            """
+            create table if not exists runs (
+                run_started_at text primary key,
+                status text not null,
+                job_urls text not null,
+                fingerprints text not null,
+                skipped_remnant_ids text not null default '[]',
+                updated_at text not null
+            );
+            create table if not exists run_jobs (
+                run_started_at text not null,
+                job_index integer not null,
+                job_url text not null,
+                remnant_ids text not null default '[]',
+                completed_at text not null,
+                primary key (run_started_at, job_url)
+            );
+            create table if not exists run_journal (
+                id integer primary key autoincrement,
+                run_started_at text not null,
+                kind text not null,
+                job_url text,
+                remnant_id integer,
+                details text not null default '',
+                recorded_at text not null
+            );
+            create index if not exists run_journal_run_idx on run_journal (run_started_at);
+            """
+        )
+        self._conn.commit()
+
+    def fingerprints(self) -> dict[str, str]:
+        with self._lock:
+            rows = self._conn.execute("select job_url, fingerprint from jobs").fetchall()
+        return dict(rows)
+
+    def remnant_ids_for(self, job_urls: list[str]) -> list[int]:
+        wanted = set(job_urls)
+        remnant_ids: list[int] = []
+        with self._lock:
+            rows = self._conn.execute("select job_url, remnant_ids from jobs").fetchall()
+        for job_url, remnant_ids_json in rows:
+            if job_url in wanted:
+                remnant_ids.extend(json.loads(remnant_ids_json))
+        return list(dict.fromkeys(remnant_ids))
+
+    def save_job(
+        self,
+        job_url: str,
+        fingerprint: str,
+        remnant_ids: list[int],
+        file_hrefs: list[str],
+        synced_at: str,
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                insert into jobs (job_url, fingerprint, remnant_ids, file_hrefs, synced_at)
+                values (?, ?, ?, ?, ?)
+                on conflict (job_url) do update set
+                    fingerprint = excluded.fingerprint,
+                    remnant_ids = excluded.remnant_ids,
+                    file_hrefs = excluded.file_hrefs,
+                    synced_at = excluded.synced_at
+                """,
+                (
+                    job_url,
+                    fingerprint,
+                    json.dumps(list(dict.fromkeys(remnant_ids))),
+                    json.dumps(file_hrefs),
+                    synced_at,
+                ),
+            )
+            self._conn.commit()
+
+    def forget_job(self, job_url: str) -> None:
+        """Drops a job so the next incremental run opens its page again."""
+        with self._lock:
+            self._conn.execute("delete from jobs where job_url = ?", (job_url,))
+            self._conn.commit()
+
+    def prune(self, job_urls: list[str]) -> int:
+        """Removes jobs that are no longer on the Moraware job list."""
+        keep = set(job_urls)
+        with self._lock:
+            stale = [
+                (job_url,)
+                for (job_url,) in self._conn.execute("select job_url from jobs").fetchall()
+                if job_url not in keep
+            ]
+            self._conn.executemany("delete from jobs where job_url = ?", stale)
+            self._conn.commit()
+        return len(stale)
+
+    # ---- Run checkpoints ----
+
+    def start_run(
+        self,
+        run_started_at: str,
+        job_urls: list[str],
+        fingerprints: dict[str, str],
+        skipped_remnant_ids: list[int],
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                insert into runs (run_started_at, status, job_urls, fingerprints, skipped_remnant_ids, updated_at)
+                values (?, 'running', ?, ?, ?, ?)
+                on conflict (run_started_at) do update set status = 'running', updated_at = excluded.updated_at
+                """,
+                (
+                    run_started_at,
+                    json.dumps(job_urls),
+                    json.dumps(fingerprints),
+                    json.dumps(skipped_remnant_ids),
+                    now_iso_utc(),
+                ),
+            )
+            stale = [
+                (row[0],)
+                for row in self._conn.execute(
+                    "select run_started_at from runs order by run_started_at desc limit -1 offset ?",
+                    (KEEP_RUNS,),
+                ).fetchall()
+            ]
+            for table in ("runs", "run_jobs", "run_journal"):
+                self._conn.executemany(f"delete from {table} where run_started_at = ?", stale)
+            self._conn.commit()
+
+    def finish_run(self, run_started_at: str, status: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "update runs set status = ?, updated_at = ? where run_started_at = ?",
+                (status, now_iso_utc(), run_started_at),
+            )
+            self._conn.commit()
+
+    def complete_run_job(self, run_started_at: str, job_index: int, job_url: str, remnant_ids: list[int]) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                insert or replace into run_jobs (run_started_at, job_index, job_url, remnant_ids, completed_at)
+                values (?, ?, ?, ?, ?)
+                """,
+                (run_started_at, job_index, job_url, json.dumps(list(dict.fromkeys(remnant_ids))), now_iso_utc()),
+            )
+            self._conn.commit()
+
+    def reopen_run_job(self, run_started_at: str, job_url: str) -> None:
+        """Drops a job's completion so `--resume` processes it again."""
+        with self._lock:
+            self._conn.execute(
+                "delete from run_jobs where run_started_at = ? and job_url = ?", (run_started_at, job_url)
+            )
+            self._conn.commit()
+
+    def drop_journal(self, run_started_at: str, job_urls: list[str]) -> None:
+        """Deletes the journal entries of jobs that are about to be processed again."""
+        with self._lock:
+            self._conn.executemany(
+                "delete from run_journal where run_started_at = ? and job_url = ?",
+                [(run_started_at, job_url) for job_url in job_urls],
+            )
+            self._conn.commit()
+
+    def journal(self, run_started_at: str, entries: list[tuple[str, str | None, int | None, str]]) -> None:
+        """Appends (kind, job URL, remnant id, details) entries to the run journal."""
+        if not entries:
+            return
+        recorded_at = now_iso_utc()
+        with self._lock:
+            self._conn.executemany(
+                """
+                insert into run_journal (run_started_at, kind, job_url, remnant_id, details, recorded_at)
+                values (?, ?, ?, ?, ?, ?)
+                """,
+                [(run_started_at, *entry, recorded_at) for entry in entries],
+            )
+            self._conn.commit()
+
+    def unfinished_run(self) -> RunCheckpoint | None:
+        """The most recent run, unless it completed."""
+        with self._lock:
+            run = self._conn.execute(
+                """
+                select run_started_at, status, job_urls, fingerprints, skipped_remnant_ids
+                from runs order by run_started_at desc limit 1
+                """
+            ).fetchone()
+            if not run or run[1] == "completed":
+                return None
+            run_started_at = run[0]
+            completed = self._conn.execute(
+                "select job_url, remnant_ids from run_jobs where run_started_at = ?", (run_started_at,)
+            ).fetchall()
+            # Jobs that did not complete are processed again and record their issues anew.
+            issues = self._conn.execute(
+                """
+                select details from run_journal
+                where run_started_at = ? and kind = 'issue'
+                  and (job_url is null or job_url in (select job_url from run_jobs where run_started_at = ?))
+                order by id
+                """,
+                (run_started_at, run_started_at),
+            ).fetchall()
+        return RunCheckpoint(
+            run_started_at=run_started_at,
+            job_urls=json.loads(run[2]),
+            fingerprints=json.loads(run[3]),
+            skipped_remnant_ids=json.loads(run[4]),
+            completed={job_url: json.loads(remnant_ids) for job_url, remnant_ids in completed},
+            issues=[json.loads(details) for (details,) in issues],
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,132 @@
+"""
+Shared HTTP transport for the remnant scraper.
+
+One long-lived `requests.Session` serves every Moraware fetch made outside the
+browser (job pages in http mode, photo downloads on any path). Its adapter
+keeps a connection pool sized for the image workers, retries 429/5xx with
+exponential backoff (honoring Retry-After), and each host gets a bounded
+number of in-flight requests. Browser cookies are copied in only when they
+change, and downloads are streamed with a hard size cap.
+"""
+
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_SEC = 0.5
+DEFAULT_PER_HOST_LIMIT = 8
+DEFAULT_CONNECT_TIMEOUT_SEC = 10
+DEFAULT_READ_TIMEOUT_SEC = 30
+DEFAULT_MAX_DOWNLOAD_BYTES = 40 * 1024 * 1024
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class DownloadTooLarge(RuntimeError):
+    pass
+
+
+def cookie_fingerprint(cookies: list[dict]) -> tuple:
+    return tuple(sorted((c["name"], c["value"], c.get("domain") or "", c.get("path") or "/") for c in cookies))
+
+
+class Transport:
+    def __init__(
+        self,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        retries: int = DEFAULT_RETRIES,
+        backoff_sec: float = DEFAULT_BACKOFF_SEC,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        max_download_bytes: int = DEFAULT_MAX_DOWNLOAD_BYTES,
+        timeout: tuple[float, float] = (DEFAULT_CONNECT_TIMEOUT_SEC, DEFAULT_READ_TIMEOUT_SEC),
+    ):
+        self.timeout = timeout
+        self.max_download_bytes = max_download_bytes
+        self.per_host_limit = max(1, per_host_limit)
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_sec,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._lock = threading.Lock()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._cookie_fingerprint: tuple | None = None
+
+    @classmethod
+    def from_settings(cls, settings) -> "Transport":
+        return cls(
+            pool_size=settings.http_pool_size,
+            retries=settings.http_retries,
+            per_host_limit=settings.http_per_host_limit,
+            max_download_bytes=settings.max_download_mb * 1024 * 1024,
+        )
+
+    def update_cookies(self, cookies: list[dict]) -> bool:
+        """Copies browser cookies into the session; a no-op when they have not changed."""
+        fingerprint = cookie_fingerprint(cookies)
+        with self._lock:
+            if fingerprint == self._cookie_fingerprint:
+                return False
+            for cookie in cookies:
+                self.session.cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain"),
+                    path=cookie.get("path") or "/",
+                )
+            self._cookie_fingerprint = fingerprint
+        return True
+
+    @contextmanager
+    def _host_slot(self, url: str):
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+        with slot:
+            yield
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        with self._host_slot(url):
+            return self.session.get(url, **kwargs)
+
+    def download(self, url: str, headers: dict | None = None) -> tuple[requests.Response, bytes]:
+        """
+        Streams `url` into memory. Raises DownloadTooLarge once the body (or its
+        declared Content-Length) passes `max_download_bytes`.
+        """
+        with self._host_slot(url):
+            response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+            try:
+                declared = int(response.headers.get("Content-Length") or 0)
+                if declared > self.max_download_bytes:
+                    raise DownloadTooLarge(f"{url} declares {declared} bytes (limit {self.max_download_bytes})")
+                chunks = []
+                received = 0
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    received += len(chunk)
+                    if received > self.max_download_bytes:
+                        raise DownloadTooLarge(f"{url} exceeded {self.max_download_bytes} bytes")
+                    chunks.append(chunk)
+                return response, b"".join(chunks)
+            finally:
+                response.close()
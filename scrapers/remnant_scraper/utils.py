@@ -1,11 +1,11 @@
 import hashlib
 import os
-from io import BytesIO
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
 import requests
-from PIL import Image
+
+from scrapers.remnant_scraper.image_normalize import normalize_image
 
 
 def sha256_bytes(data: bytes) -> str:
@@ -38,15 +38,31 @@ def infer_extension(url: str, content_type: str | None) -> str:
     return "jpg"
 
 
-def requests_session_from_selenium(driver) -> requests.Session:
+def build_conditional_headers(existing_row: dict | None, source_url: str) -> dict[str, str]:
     """
-    Builds a requests session using Selenium cookies so we can download
-    Moraware-protected images without opening new tabs.
+    Returns If-None-Match / If-Modified-Since headers for a photo we already
+    synced from the same source URL, or an empty dict when a full fetch is needed.
     """
-    sess = requests.Session()
-    for cookie in driver.get_cookies():
-        sess.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"))
-    return sess
+    row = existing_row or {}
+    if not row.get("image") or row.get("source_image_url") != source_url:
+        return {}
+
+    headers = {}
+    if row.get("photo_source_etag"):
+        headers["If-None-Match"] = row["photo_source_etag"]
+    if row.get("photo_source_last_modified"):
+        headers["If-Modified-Since"] = row["photo_source_last_modified"]
+    return headers
+
+
+def extract_source_validators(response: requests.Response, raw_bytes: bytes) -> dict:
+    """Collects the upstream validators stored alongside `photo_hash`."""
+    return {
+        "photo_source_etag": response.headers.get("ETag"),
+        "photo_source_last_modified": response.headers.get("Last-Modified"),
+        "photo_source_length": len(raw_bytes),
+        "photo_source_hash": sha256_bytes(raw_bytes),
+    }
 
 
 def normalize_image_bytes(data: bytes, content_type: str | None) -> tuple[bytes, str, str]:
@@ -55,14 +71,5 @@ def normalize_image_bytes(data: bytes, content_type: str | None) -> tuple[bytes,
     size without changing the image dimensions. Animated GIFs are left alone so
     they do not lose animation unexpectedly.
     """
-    normalized_type = (content_type or "").lower()
-
-    with Image.open(BytesIO(data)) as image:
-        is_animated = bool(getattr(image, "is_animated", False))
-        if is_animated and normalized_type == "image/gif":
-            return data, "image/gif", "gif"
-
-        converted = image.convert("RGB")
-        output = BytesIO()
-        converted.save(output, format="WEBP", quality=86, method=6)
-        return output.getvalue(), "image/webp", "webp"
+    normalized = normalize_image(data, content_type)
+    return normalized.data, normalized.content_type, normalized.ext
@@ -34,6 +34,15 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
+
 
 logging.basicConfig(
     level=logging.INFO,
@@ -144,18 +153,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2400")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless)
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -164,7 +166,7 @@ def safe_text(element) -> str:
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait, listing_url: str, delay_sec: float) -> None:
     logging.info("Opening Blue Planet listing page: %s", listing_url)
-    driver.get(listing_url)
+    load_page(driver, listing_url)
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
     time.sleep(delay_sec)
 
@@ -294,7 +296,7 @@ def collect_detail_record_once(
     delay_sec: float,
 ) -> BluePlanetSlabRecord:
     logging.info("Opening Blue Planet detail page: %s", detail_url)
-    driver.get(detail_url)
+    load_page(driver, detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_NAME_SELECTOR)))
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, DETAIL_IMAGE_LINK_SELECTOR)))
     time.sleep(delay_sec)
@@ -356,6 +358,7 @@ def collect_detail_record(
 def scrape_catalog(
     driver: webdriver.Chrome,
     wait: WebDriverWait,
+    pool: BrowserPool,
     delay_sec: float,
     retries: int,
     output_dir: Path,
@@ -387,6 +390,7 @@ def scrape_catalog(
                 len(set(failed_urls)),
             )
 
+    pending: list[tuple[str, str, str]] = []
     for index, (listing_name, detail_url, forced_material) in enumerate(product_links, start=1):
         if detail_url in scraped_urls:
             logging.info(
@@ -396,41 +400,38 @@ def scrape_catalog(
                 detail_url,
             )
             continue
-
-        logging.info(
-            "Scraping Blue Planet detail %s/%s: %s",
-            index,
-            len(product_links),
-            detail_url,
-        )
-        try:
-            records.append(
-                BluePlanetSlabRecord(
-                    **{
-                        **record_to_dict(
-                            collect_detail_record(
-                                driver,
-                                wait,
-                                listing_name,
-                                detail_url,
-                                delay_sec,
-                                retries,
-                            )
-                        ),
-                        "material": forced_material,
-                    }
-                )
-            )
-            scraped_urls.add(detail_url)
-            failed_urls = [url for url in failed_urls if url != detail_url]
-            write_checkpoint(records, failed_urls, output_dir)
-        except Exception as error:
-            logging.warning("Skipping Blue Planet detail after retries: %s (%s)", detail_url, type(error).__name__)
-            if detail_url not in failed_urls:
-                failed_urls.append(detail_url)
-            write_checkpoint(records, failed_urls, output_dir)
-
-    return records
+        pending.append((listing_name, detail_url, forced_material))
+
+    def collect(driver: webdriver.Chrome, wait: WebDriverWait, product: tuple[str, str, str]) -> BluePlanetSlabRecord:
+        listing_name, detail_url, forced_material = product
+        record = collect_detail_record(driver, wait, listing_name, detail_url, delay_sec, retries)
+        return BluePlanetSlabRecord(**{**record_to_dict(record), "material": forced_material})
+
+    # Checkpoints follow completion order; the export below keeps catalog order.
+    checkpointed = list(records)
+
+    def save(product: tuple[str, str, str], record: BluePlanetSlabRecord) -> None:
+        nonlocal failed_urls
+        checkpointed.append(record)
+        failed_urls = [url for url in failed_urls if url != product[1]]
+        write_checkpoint(checkpointed, failed_urls, output_dir)
+
+    def skip(product: tuple[str, str, str], error: BaseException) -> None:
+        if product[1] not in failed_urls:
+            failed_urls.append(product[1])
+        write_checkpoint(checkpointed, failed_urls, output_dir)
+
+    # collect_detail_record already retries slow pages, so anything it raises skips the page.
+    scraped = pool.map(
+        collect,
+        pending,
+        label="Blue Planet detail",
+        describe=lambda product: product[1],
+        skip_errors=(Exception,),
+        on_result=save,
+        on_failure=skip,
+    )
+    return records + scraped
 
 
 def export_records(records: list[BluePlanetSlabRecord], output_dir: Path) -> tuple[Path, Path]:
@@ -468,7 +469,10 @@ def parse_args() -> argparse.Namespace:
         "--page-delay-sec",
         type=float,
         default=DEFAULT_PAGE_DELAY_SEC,
-        help="Extra delay after listing/detail loads for this slower supplier site.",
+        help=(
+            "Extra delay after listing/detail loads for this slower supplier site; "
+            "also the minimum spacing between detail pages across all workers."
+        ),
     )
     parser.add_argument(
         "--detail-retries",
@@ -481,6 +485,7 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Ignore any existing Blue Planet checkpoint files and start from scratch.",
     )
+    add_pool_arguments(parser)
     return parser.parse_args()
 
 
@@ -496,6 +501,14 @@ def main() -> None:
         records = scrape_catalog(
             driver,
             wait,
+            # Detail pages start no closer than the page delay, however many workers run.
+            pool_from_args(
+                args,
+                build_options,
+                "blue_planet",
+                min_interval_sec=args.page_delay_sec,
+                listing_driver=driver,
+            ),
             args.page_delay_sec,
             max(0, args.detail_retries),
             output_dir,
@@ -509,7 +522,8 @@ def main() -> None:
     except TimeoutException as error:
         raise RuntimeError("Timed out while loading Blue Planet listing or detail pages") from error
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("blue_planet")
 
 
 if __name__ == "__main__":
@@ -31,6 +31,7 @@ from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -43,6 +44,7 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -117,18 +119,11 @@ def material_label_from_category(category_slug: str) -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2400")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless)
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -197,7 +192,7 @@ def normalize_name(raw_name: str, category_slug: str) -> tuple[str, str | None,
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait, url: str) -> None:
     logging.info("Opening Bramati listing page: %s", url)
-    driver.get(url)
+    load_page(driver, url)
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
 
 
@@ -227,7 +222,7 @@ def try_switch_to_per_page_60(driver: webdriver.Chrome, wait: WebDriverWait) ->
             return
 
         logging.info("Switching Bramati listing to 60-per-page view")
-        driver.get(target_url)
+        load_page(driver, target_url)
         wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
     except Exception as error:
         logging.info("Unable to switch Bramati to 60-per-page view: %s", type(error).__name__)
@@ -551,7 +546,8 @@ def main() -> None:
     except TimeoutException as error:
         raise RuntimeError("Timed out while loading Bramati listing pages") from error
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("bramati")
 
 
 if __name__ == "__main__":
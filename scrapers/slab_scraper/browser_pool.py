@@ -0,0 +1,267 @@
+"""
+Browser pool for the Selenium slab scrapers.
+
+`BrowserPool.map` spreads detail URLs over N Chrome workers pulling from one
+queue. The supplier's `collect_detail_record(driver, wait, ...)` is called
+unchanged on whichever worker picks the item up.
+
+- Each worker keeps a persistent profile under `profile_dir/worker-N`, so
+  its HTTP cache and cookies stay warm across restarts and runs.
+- A browser that dies mid-page is restarted and the page retried once, up
+  to five restarts per worker.
+- After `page_budget` pages a worker swaps its Chrome for a fresh one to cap
+  memory growth.
+- Errors listed in `skip_errors` (e.g. a detail page that times out) are
+  reported to `on_failure` and the worker moves on. Any other error stops
+  the pool and is raised to the caller.
+- `min_interval_sec` spaces page starts across all workers, so a supplier's
+  crawl delay holds for the site however many workers run.
+- A `listing_driver` the caller is done with becomes worker 0's first
+  Chrome, so a run holds N browsers rather than N plus an idle listing one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+
+try:
+    from .driver_factory import ResourceProfile, drain_network_log, quit_chrome, start_chrome
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from driver_factory import ResourceProfile, drain_network_log, quit_chrome, start_chrome  # type: ignore
+
+
+DEFAULT_WORKERS = 3
+DEFAULT_PAGE_BUDGET = 50
+DEFAULT_PROFILE_ROOT = Path("scrapers/slab_scraper/.browser_profiles")
+MAX_RESTARTS_PER_WORKER = 5
+MAX_ATTEMPTS_PER_ITEM = 2
+
+
+def browser_alive(driver: webdriver.Chrome) -> bool:
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+class BrowserPool:
+    def __init__(
+        self,
+        build_options: Callable[[bool], Options],
+        *,
+        workers: int = DEFAULT_WORKERS,
+        headless: bool = True,
+        timeout_sec: float = 20,
+        page_budget: int = DEFAULT_PAGE_BUDGET,
+        profile_dir: Path | None = None,
+        resources: ResourceProfile | None = None,
+        min_interval_sec: float = 0.0,
+        listing_driver: webdriver.Chrome | None = None,
+    ):
+        """
+        `build_options(headless)` is the supplier's own Chrome options builder;
+        the pool only adds the worker's profile directory to it. `resources`
+        is the supplier's resource-blocking profile, if it has its own.
+        `listing_driver` is handed to the first `map` and quit by the pool;
+        quitting it again afterwards is harmless.
+        """
+        self.build_options = build_options
+        self.workers = max(1, workers)
+        self.headless = headless
+        self.timeout_sec = timeout_sec
+        self.page_budget = max(0, page_budget)
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.resources = resources
+        self.min_interval_sec = max(0.0, min_interval_sec)
+        self.listing_driver = listing_driver
+        self._lock = threading.Lock()
+        self._turn_lock = threading.Lock()
+        self._next_start = 0.0
+
+    def start_driver(self, worker_index: int) -> webdriver.Chrome:
+        options = self.build_options(self.headless)
+        if self.profile_dir:
+            profile = self.profile_dir / f"worker-{worker_index}"
+            profile.mkdir(parents=True, exist_ok=True)
+            # A crashed Chrome leaves its singleton lock behind and would refuse the profile.
+            for lock in profile.glob("Singleton*"):
+                lock.unlink(missing_ok=True)
+            options.add_argument(f"--user-data-dir={profile.resolve()}")
+        return start_chrome(options, self.resources)
+
+    def take_listing_driver(self) -> webdriver.Chrome | None:
+        with self._lock:
+            driver, self.listing_driver = self.listing_driver, None
+        return driver
+
+    def wait_turn(self) -> None:
+        """Blocks until `min_interval_sec` has passed since any worker's previous page start."""
+        if not self.min_interval_sec:
+            return
+        with self._turn_lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval_sec
+        if start > now:
+            time.sleep(start - now)
+
+    def map(
+        self,
+        collect: Callable[[webdriver.Chrome, WebDriverWait, Any], Any],
+        items: list[Any],
+        *,
+        label: str = "detail",
+        describe: Callable[[Any], str] = str,
+        skip_errors: tuple[type[BaseException], ...] = (),
+        on_result: Callable[[Any, Any], None] | None = None,
+        on_failure: Callable[[Any, BaseException], None] | None = None,
+    ) -> list[Any]:
+        """
+        Runs `collect(driver, wait, item)` for every item and returns the
+        results in item order, leaving out skipped items. `on_result(item,
+        result)` and `on_failure(item, error)` are called one at a time.
+        """
+        pending: queue.Queue = queue.Queue()
+        for position, item in enumerate(items):
+            pending.put((position, item))
+        results: dict[int, Any] = {}
+        stop = threading.Event()
+        total = len(items)
+
+        def finish(position: int, item, result=None, error: BaseException | None = None) -> None:
+            with self._lock:
+                if error is None:
+                    results[position] = result
+                    if on_result:
+                        on_result(item, result)
+                elif on_failure:
+                    on_failure(item, error)
+
+        def run_worker(worker_index: int) -> None:
+            driver = self.take_listing_driver() if worker_index == 0 else None
+            wait = WebDriverWait(driver, self.timeout_sec) if driver else None
+            pages = 0
+            restarts = 0
+            try:
+                while not stop.is_set():
+                    try:
+                        position, item = pending.get_nowait()
+                    except queue.Empty:
+                        return
+
+                    for attempt in range(1, MAX_ATTEMPTS_PER_ITEM + 1):
+                        if driver is None:
+                            driver = self.start_driver(worker_index)
+                            wait = WebDriverWait(driver, self.timeout_sec)
+                            pages = 0
+                        logging.info(
+                            "Scraping %s %s/%s (worker %s): %s",
+                            label,
+                            position + 1,
+                            total,
+                            worker_index,
+                            describe(item),
+                        )
+                        pages += 1
+                        self.wait_turn()
+                        try:
+                            result = collect(driver, wait, item)
+                            drain_network_log(driver)
+                        except Exception as exc:
+                            if not browser_alive(driver):
+                                quit_chrome(driver)
+                                driver = None
+                                if restarts >= MAX_RESTARTS_PER_WORKER:
+                                    raise
+                                restarts += 1
+                                logging.warning(
+                                    "Worker %s: Chrome died on %s (%s); restarting (%s/%s)",
+                                    worker_index,
+                                    describe(item),
+                                    type(exc).__name__,
+                                    restarts,
+                                    MAX_RESTARTS_PER_WORKER,
+                                )
+                                if attempt < MAX_ATTEMPTS_PER_ITEM:
+                                    continue
+                            if not isinstance(exc, skip_errors):
+                                raise
+                            logging.warning("Skipping %s after %s: %s", label, type(exc).__name__, describe(item))
+                            finish(position, item, error=exc)
+                        else:
+                            finish(position, item, result=result)
+                        break
+
+                    if driver is not None and self.page_budget and pages >= self.page_budget:
+                        logging.info("Worker %s: recycling Chrome after %s pages", worker_index, pages)
+                        quit_chrome(driver)
+                        driver = None
+            except BaseException:
+                stop.set()
+                raise
+            finally:
+                if driver is not None:
+                    quit_chrome(driver)
+
+        worker_count = min(self.workers, total)
+        if worker_count <= 1:
+            if total:
+                run_worker(0)
+        else:
+            with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="slab-browser") as executor:
+                futures = [executor.submit(run_worker, worker_index) for worker_index in range(worker_count)]
+            for future in futures:
+                future.result()
+
+        return [results[position] for position in sorted(results)]
+
+
+def add_pool_arguments(parser: argparse.ArgumentParser, *, workers: int = DEFAULT_WORKERS) -> None:
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=workers,
+        help="Chrome instances scraping detail pages in parallel.",
+    )
+    parser.add_argument(
+        "--page-budget",
+        type=int,
+        default=DEFAULT_PAGE_BUDGET,
+        help="Pages a Chrome instance loads before it is replaced with a fresh one. Use 0 to never recycle.",
+    )
+
+
+def pool_from_args(
+    args: argparse.Namespace,
+    build_options: Callable[[bool], Options],
+    supplier: str,
+    resources: ResourceProfile | None = None,
+    *,
+    min_interval_sec: float = 0.0,
+    listing_driver: webdriver.Chrome | None = None,
+) -> BrowserPool:
+    return BrowserPool(
+        build_options,
+        workers=args.workers,
+        headless=not args.headed,
+        timeout_sec=args.timeout_sec,
+        page_budget=args.page_budget,
+        profile_dir=DEFAULT_PROFILE_ROOT / supplier,
+        resources=resources,
+        min_interval_sec=min_interval_sec,
+        listing_driver=listing_driver,
+    )
@@ -30,6 +30,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -43,6 +45,8 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -105,18 +109,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2400")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless)
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -133,7 +130,7 @@ def material_label_from_slug(material_slug: str) -> str:
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait, url: str) -> None:
     logging.info("Opening Caesarstone listing page: %s", url)
-    driver.get(url)
+    load_page(driver, url)
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
 
 
@@ -271,7 +268,7 @@ def collect_detail_record(
     product_code: str | None,
     material_slug: str,
 ) -> CaesarstoneSlabRecord:
-    driver.get(detail_url)
+    load_page(driver, detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_TITLE_SELECTOR)))
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, DETAIL_SPECS_ROW_SELECTOR)))
 
@@ -349,18 +346,16 @@ def collect_detail_record(
 
 
 def scrape_detail_pages(
-    driver: webdriver.Chrome,
-    wait: WebDriverWait,
+    pool: BrowserPool,
     products: list[tuple[str, str, str | None]],
     material_slug: str,
 ) -> list[CaesarstoneSlabRecord]:
-    records: list[CaesarstoneSlabRecord] = []
-
-    for index, (listing_name, detail_url, product_code) in enumerate(products, start=1):
-        logging.info("Scraping Caesarstone detail %s/%s: %s", index, len(products), detail_url)
-        records.append(collect_detail_record(driver, wait, listing_name, detail_url, product_code, material_slug))
-
-    return records
+    return pool.map(
+        lambda driver, wait, product: collect_detail_record(driver, wait, *product, material_slug),
+        products,
+        label="Caesarstone detail",
+        describe=lambda product: product[1],
+    )
 
 
 def to_unified(record: CaesarstoneSlabRecord, scraped_at: str, material_slug: str) -> UnifiedSlabRecord:
@@ -448,6 +443,7 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_LIMIT,
         help="Optional max number of listing products to scrape.",
     )
+    add_pool_arguments(parser)
     return parser.parse_args()
 
 
@@ -461,7 +457,7 @@ def main() -> None:
     try:
         open_listing_page(driver, wait, listing_url)
         products = collect_listing_products(driver, wait, args.material, args.limit)
-        records = scrape_detail_pages(driver, wait, products, args.material)
+        records = scrape_detail_pages(pool_from_args(args, build_options, "caesarstone", listing_driver=driver), products, args.material)
         json_path, csv_path = export_records(records, output_dir, args.material)
         logging.info("Export complete")
         logging.info("JSON: %s", json_path)
@@ -470,7 +466,8 @@ def main() -> None:
     except TimeoutException as error:
         raise RuntimeError("Timed out while loading Caesarstone listing or detail pages") from error
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("caesarstone")
 
 
 if __name__ == "__main__":
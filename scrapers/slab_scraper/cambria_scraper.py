@@ -31,6 +31,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -44,6 +46,8 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -118,18 +122,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2400")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless)
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -147,7 +144,7 @@ def safe_inline_text(text: str) -> str:
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait, url: str) -> None:
     logging.info("Opening Cambria listing page: %s", url)
-    driver.get(url)
+    load_page(driver, url)
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
 
 
@@ -307,7 +304,7 @@ def collect_detail_record(
     listing_name: str,
     detail_url: str,
 ) -> CambriaSlabRecord:
-    driver.get(detail_url)
+    load_page(driver, detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_PAGE_READY_SELECTOR)))
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, DETAIL_ATTR_SELECTOR)))
 
@@ -343,17 +340,15 @@ def collect_detail_record(
 
 
 def scrape_detail_pages(
-    driver: webdriver.Chrome,
-    wait: WebDriverWait,
+    pool: BrowserPool,
     products: list[tuple[str, str]],
 ) -> list[CambriaSlabRecord]:
-    records: list[CambriaSlabRecord] = []
-
-    for index, (listing_name, detail_url) in enumerate(products, start=1):
-        logging.info("Scraping Cambria detail %s/%s: %s", index, len(products), detail_url)
-        records.append(collect_detail_record(driver, wait, listing_name, detail_url))
-
-    return records
+    return pool.map(
+        lambda driver, wait, product: collect_detail_record(driver, wait, *product),
+        products,
+        label="Cambria detail",
+        describe=lambda product: product[1],
+    )
 
 
 def to_unified(record: CambriaSlabRecord, scraped_at: str) -> UnifiedSlabRecord:
@@ -430,6 +425,7 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_LIMIT,
         help="Optional max number of listing products to scrape.",
     )
+    add_pool_arguments(parser)
     return parser.parse_args()
 
 
@@ -442,7 +438,7 @@ def main() -> None:
     try:
         open_listing_page(driver, wait, LISTING_URL)
         products = collect_listing_products(driver, wait, args.limit)
-        records = scrape_detail_pages(driver, wait, products)
+        records = scrape_detail_pages(pool_from_args(args, build_options, "cambria", listing_driver=driver), products)
         json_path, csv_path = export_records(records, output_dir)
 
         logging.info("Export complete")
@@ -450,7 +446,8 @@ def main() -> None:
         logging.info("CSV: %s", csv_path)
         logging.info("Collected %s Cambria quartz slabs", len(records))
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("cambria")
 
 
 if __name__ == "__main__":
@@ -32,6 +32,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -44,6 +46,8 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -109,18 +113,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2400")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless)
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -129,7 +126,7 @@ def safe_text(element) -> str:
 
 def open_page(driver: webdriver.Chrome, wait: WebDriverWait, url: str, ready_selector: str, crawl_delay_sec: float) -> None:
     logging.info("Opening Cosentino page: %s", url)
-    driver.get(url)
+    load_page(driver, url)
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, ready_selector)))
     if crawl_delay_sec > 0:
         time.sleep(crawl_delay_sec)
@@ -296,22 +293,20 @@ def collect_detail_record(
 
 
 def scrape_detail_pages(
-    driver: webdriver.Chrome,
-    wait: WebDriverWait,
+    pool: BrowserPool,
     products: list[tuple[str, str]],
     brand: str,
-    crawl_delay_sec: float,
 ) -> list[CosentinoSlabRecord]:
-    records: list[CosentinoSlabRecord] = []
     skipped: list[str] = []
-
-    for index, (listing_name, detail_url) in enumerate(products, start=1):
-        logging.info("Scraping Cosentino detail %s/%s: %s", index, len(products), detail_url)
-        try:
-            records.append(collect_detail_record(driver, wait, listing_name, detail_url, brand, crawl_delay_sec))
-        except TimeoutException:
-            logging.warning("Cosentino detail %s timed out — skipping: %s", index, detail_url)
-            skipped.append(detail_url)
+    # The pool spaces detail pages by the crawl delay across all workers.
+    records = pool.map(
+        lambda driver, wait, product: collect_detail_record(driver, wait, *product, brand, 0),
+        products,
+        label="Cosentino detail",
+        describe=lambda product: product[1],
+        skip_errors=(TimeoutException,),
+        on_failure=lambda product, error: skipped.append(product[1]),
+    )
 
     if skipped:
         logging.warning("Cosentino skipped %s detail pages: %s", len(skipped), skipped)
@@ -394,8 +389,10 @@ def parse_args() -> argparse.Namespace:
         "--crawl-delay-sec",
         type=float,
         default=DEFAULT_CRAWL_DELAY_SEC,
-        help="Delay between requests to respect the site's crawl guidance.",
+        help="Delay between requests to respect the site's crawl guidance; detail pages keep it across all workers.",
     )
+    # One browser by default: Cosentino's crawl guidance asks for a slow crawl.
+    add_pool_arguments(parser, workers=1)
     return parser.parse_args()
 
 
@@ -409,7 +406,14 @@ def main() -> None:
     try:
         open_page(driver, wait, listing_url, PRODUCT_CARD_SELECTOR, args.crawl_delay_sec)
         products = collect_listing_products(driver, wait, args.brand, args.limit, args.crawl_delay_sec)
-        records = scrape_detail_pages(driver, wait, products, args.brand, args.crawl_delay_sec)
+        pool = pool_from_args(
+            args,
+            build_options,
+            "cosentino",
+            min_interval_sec=args.crawl_delay_sec,
+            listing_driver=driver,
+        )
+        records = scrape_detail_pages(pool, products, args.brand)
         json_path, csv_path = export_records(records, output_dir, args.brand)
 
         logging.info("Export complete")
@@ -417,7 +421,8 @@ def main() -> None:
         logging.info("CSV: %s", csv_path)
         logging.info("Collected %s Cosentino %s slabs", len(records), args.brand)
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("cosentino")
 
 
 if __name__ == "__main__":
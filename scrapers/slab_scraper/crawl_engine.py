@@ -0,0 +1,328 @@
+"""
+Shared async HTTP crawl engine for the requests/BeautifulSoup slab scrapers.
+
+Suppliers describe a crawl as a listing step that returns detail items and a
+detail step that turns one item into records; `CrawlEngine.crawl` runs the
+listing step and then every detail step concurrently. Independent listings
+(series, categories, catalogs) can be fanned out with `CrawlEngine.map`.
+
+Politeness is enforced per host rather than by sleeping between requests:
+- at most `max_per_host` requests are open to a host at once
+- requests to a host start at least `min_interval_sec` apart, or the host's
+  robots.txt Crawl-delay / Request-rate when that is slower
+- robots.txt is fetched once per host and disallowed URLs raise
+  `RobotsDisallowedError` (`--ignore-robots` turns this off)
+- timeouts, connection errors, 429 and 5xx responses are retried with
+  exponential backoff; a Retry-After header holds back the whole host
+
+A detail page that is disallowed or still failing after its retries is logged
+and left out (`SKIPPABLE_ERRORS`), so one bad page does not sink a supplier run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Iterable
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import httpx
+from bs4 import BeautifulSoup
+
+
+DEFAULT_MAX_PER_HOST = 4
+DEFAULT_MIN_INTERVAL_SEC = 0.25
+DEFAULT_MAX_ATTEMPTS = 4
+MAX_BACKOFF_SEC = 6
+MAX_RETRY_AFTER_SEC = 60
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# httpx logs every request at INFO; the engine reports progress itself.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+class RobotsDisallowedError(RuntimeError):
+    pass
+
+
+# Per-page failures `map(..., skip_errors=...)` and `crawl` drop instead of aborting.
+SKIPPABLE_ERRORS = (RobotsDisallowedError, httpx.HTTPStatusError, httpx.TransportError)
+
+
+@dataclass(frozen=True)
+class CrawlOptions:
+    user_agent: str
+    timeout_sec: float = 30
+    max_per_host: int = DEFAULT_MAX_PER_HOST
+    min_interval_sec: float = DEFAULT_MIN_INTERVAL_SEC
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    respect_robots: bool = True
+
+
+class HostState:
+    def __init__(self, max_per_host: int, min_interval_sec: float):
+        self.slots = asyncio.Semaphore(max(1, max_per_host))
+        self.interval_sec = max(0.0, min_interval_sec)
+        self.next_start = 0.0
+        self.turn_lock = asyncio.Lock()
+        self.robots_lock = asyncio.Lock()
+        self.robots: RobotFileParser | None = None
+
+    async def wait_turn(self) -> None:
+        async with self.turn_lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval_sec
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def hold_off(self, delay_sec: float) -> None:
+        self.next_start = max(self.next_start, time.monotonic() + delay_sec)
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    value = (response.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_SEC)
+
+
+def backoff_seconds(attempt: int) -> float:
+    return min(2 ** (attempt - 1), MAX_BACKOFF_SEC) * random.uniform(0.75, 1.25)
+
+
+class CrawlEngine:
+    def __init__(self, options: CrawlOptions):
+        self.options = options
+        self.client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=options.timeout_sec,
+            headers={"User-Agent": options.user_agent},
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=32),
+        )
+        self.hosts: dict[str, HostState] = {}
+        self.stats: Counter = Counter()
+        self.started = time.monotonic()
+
+    async def __aenter__(self) -> "CrawlEngine":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        logging.info(
+            "Crawl finished: %s requests (%s retries, %s skipped, %s bytes) across %s hosts in %.1fs",
+            self.stats["requests"],
+            self.stats["retries"],
+            self.stats["skipped"],
+            self.stats["bytes"],
+            len(self.hosts),
+            time.monotonic() - self.started,
+        )
+
+    def host_state(self, url: str) -> HostState:
+        host = urlsplit(url).netloc.lower()
+        if host not in self.hosts:
+            self.hosts[host] = HostState(self.options.max_per_host, self.options.min_interval_sec)
+        return self.hosts[host]
+
+    async def load_robots(self, url: str, host: HostState) -> RobotFileParser:
+        async with host.robots_lock:
+            if host.robots is not None:
+                return host.robots
+
+            parts = urlsplit(url)
+            robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+            robots = RobotFileParser(robots_url)
+            try:
+                response = await self.client.get(robots_url)
+                self.stats["requests"] += 1
+            except httpx.HTTPError as exc:
+                logging.warning("Could not read %s (%s); crawling without it", robots_url, exc)
+                robots.allow_all = True
+            else:
+                # Same reading of the status as RobotFileParser.read().
+                if response.status_code in (401, 403):
+                    robots.disallow_all = True
+                elif response.status_code >= 400:
+                    robots.allow_all = True
+                else:
+                    robots.parse(response.text.splitlines())
+
+            agent = self.options.user_agent
+            delay = robots.crawl_delay(agent)
+            rate = robots.request_rate(agent)
+            robots_interval = max(
+                float(delay or 0),
+                rate.seconds / rate.requests if rate and rate.requests else 0.0,
+            )
+            if robots_interval > host.interval_sec:
+                logging.info("%s asks for %.2fs between requests", robots_url, robots_interval)
+                host.interval_sec = robots_interval
+
+            host.robots = robots
+            return robots
+
+    async def fetch(self, url: str) -> httpx.Response:
+        """GETs `url` within the host's limits. Raises `httpx.HTTPStatusError` once retries run out."""
+        host = self.host_state(url)
+        if self.options.respect_robots:
+            robots = await self.load_robots(url, host)
+            if not robots.can_fetch(self.options.user_agent, url):
+                raise RobotsDisallowedError(f"robots.txt disallows {url}")
+
+        attempts = max(1, self.options.max_attempts)
+        for attempt in range(1, attempts + 1):
+            async with host.slots:
+                await host.wait_turn()
+                try:
+                    response = await self.client.get(url)
+                except httpx.TransportError as exc:
+                    if attempt >= attempts:
+                        raise
+                    logging.warning("Request failed for %s (attempt %s/%s): %s", url, attempt, attempts, exc)
+                    self.stats["retries"] += 1
+                    host.hold_off(backoff_seconds(attempt))
+                    continue
+                finally:
+                    self.stats["requests"] += 1
+
+            self.stats["bytes"] += len(response.content)
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= attempts:
+                response.raise_for_status()
+                return response
+
+            delay = retry_after_seconds(response)
+            logging.warning(
+                "HTTP %s for %s (attempt %s/%s)%s",
+                response.status_code,
+                url,
+                attempt,
+                attempts,
+                f"; retrying after {delay:.0f}s" if delay is not None else "",
+            )
+            self.stats["retries"] += 1
+            host.hold_off(delay if delay is not None else backoff_seconds(attempt))
+
+        raise AssertionError("unreachable")
+
+    async def fetch_text(self, url: str) -> str:
+        response = await self.fetch(url)
+        return response.text
+
+    async def get_soup(self, url: str) -> BeautifulSoup:
+        return BeautifulSoup(await self.fetch_text(url), "html.parser")
+
+    async def map(
+        self,
+        step: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        *,
+        label: str | None = None,
+        describe: Callable[[Any], str] = str,
+        skip_errors: tuple[type[BaseException], ...] = (),
+    ) -> list[Any]:
+        """
+        Runs `step(item)` for every item concurrently; results keep the order
+        of `items`. Items whose step raises one of `skip_errors` are logged and
+        left out; any other error cancels the rest and propagates.
+        """
+        items = list(items)
+        done = 0
+        skipped = object()
+
+        async def run(item):
+            nonlocal done
+            try:
+                result = await step(item)
+            except skip_errors as exc:
+                logging.warning("%s: skipping %s: %s", label or "crawl", describe(item), exc)
+                self.stats["skipped"] += 1
+                result = skipped
+            done += 1
+            if label:
+                logging.info("%s %s/%s done", label, done, len(items))
+            return result
+
+        tasks = [asyncio.ensure_future(run(item)) for item in items]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return [result for result in results if result is not skipped]
+
+    async def crawl(
+        self,
+        listing: Awaitable[Iterable[Any]],
+        detail: Callable[[Any], Awaitable[Any]],
+        *,
+        label: str,
+        describe: Callable[[Any], str] = str,
+    ) -> list[Any]:
+        """
+        Awaits the listing step, then runs the detail step for each item it
+        returned. A detail step may return one record or a list of them;
+        detail pages failing with `SKIPPABLE_ERRORS` are skipped.
+        """
+        items = list(await listing)
+        logging.info("%s: %s detail pages to fetch", label, len(items))
+        records: list[Any] = []
+        detail_results = await self.map(
+            detail, items, label=f"{label} detail", describe=describe, skip_errors=SKIPPABLE_ERRORS
+        )
+        for result in detail_results:
+            if isinstance(result, list):
+                records.extend(result)
+            else:
+                records.append(result)
+        return records
+
+
+def run_crawl(crawl: Callable[[CrawlEngine], Awaitable[Any]], options: CrawlOptions) -> Any:
+    """Runs `crawl(engine)` on a fresh event loop and closes the engine afterwards."""
+
+    async def runner():
+        async with CrawlEngine(options) as engine:
+            return await crawl(engine)
+
+    return asyncio.run(runner())
+
+
+def add_crawl_arguments(parser: argparse.ArgumentParser, *, min_interval_flag: bool = True) -> None:
+    parser.add_argument(
+        "--max-per-host",
+        type=int,
+        default=DEFAULT_MAX_PER_HOST,
+        help="Maximum concurrent requests to one host.",
+    )
+    if min_interval_flag:
+        parser.add_argument(
+            "--min-interval-sec",
+            type=float,
+            default=DEFAULT_MIN_INTERVAL_SEC,
+            help="Minimum seconds between request starts to one host.",
+        )
+    parser.add_argument(
+        "--ignore-robots",
+        action="store_true",
+        help="Do not read robots.txt or honor its Disallow/Crawl-delay rules.",
+    )
@@ -15,13 +15,14 @@ import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 try:
+    from .crawl_engine import SKIPPABLE_ERRORS, CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -34,6 +35,7 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from crawl_engine import SKIPPABLE_ERRORS, CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -93,22 +95,10 @@ def now_timestamp_slug() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
-def build_session() -> requests.Session:
-    session = requests.Session()
-    session.headers.update({"User-Agent": USER_AGENT})
-    return session
-
-
 def safe_text(value: str | None) -> str:
     return " ".join((value or "").split())
 
 
-def get_soup(session: requests.Session, url: str, timeout_sec: int) -> BeautifulSoup:
-    response = session.get(url, timeout=timeout_sec)
-    response.raise_for_status()
-    return BeautifulSoup(response.text, "html.parser")
-
-
 def get_input_value(container, name: str) -> str | None:
     node = container.select_one(f"input[name='{name}']")
     if not node:
@@ -199,12 +189,13 @@ def collect_series_pages() -> list[DaltileSeriesSource]:
     return [DaltileSeriesSource(material=material, series_url=url) for material, url in SERIES_SOURCES]
 
 
-def collect_color_links(
-    session: requests.Session,
+async def collect_color_links(
+    engine: CrawlEngine,
     source: DaltileSeriesSource,
-    timeout_sec: int,
+    limit: int,
 ) -> list[str]:
-    soup = get_soup(session, source.series_url, timeout_sec)
+    logging.info("Opening Daltile series page: %s", source.series_url)
+    soup = await engine.get_soup(source.series_url)
     links: list[str] = []
     seen: set[str] = set()
 
@@ -221,6 +212,8 @@ def collect_color_links(
         seen.add(detail_url)
         links.append(detail_url)
 
+    if limit > 0:
+        links = links[:limit]
     return links
 
 
@@ -234,13 +227,12 @@ def collect_series_name(soup: BeautifulSoup) -> str | None:
     return None
 
 
-def parse_detail_records(
-    session: requests.Session,
+async def parse_detail_records(
+    engine: CrawlEngine,
     source: DaltileSeriesSource,
     detail_url: str,
-    timeout_sec: int,
 ) -> list[DaltileSlabRecord]:
-    soup = get_soup(session, detail_url, timeout_sec)
+    soup = await engine.get_soup(detail_url)
     page_series_name = collect_series_name(soup)
     product_images = collect_product_images(soup)
     rows: list[DaltileSlabRecord] = []
@@ -297,30 +289,31 @@ def parse_detail_records(
     return rows
 
 
-def scrape_material_records(
-    session: requests.Session,
+async def scrape_material_records(
+    engine: CrawlEngine,
     source: DaltileSeriesSource,
-    timeout_sec: int,
     limit: int,
 ) -> list[DaltileSlabRecord]:
-    color_links = collect_color_links(session, source, timeout_sec)
-    if limit > 0:
-        color_links = color_links[:limit]
-
-    records: list[DaltileSlabRecord] = []
-    for index, detail_url in enumerate(color_links, start=1):
-        logging.info(
-            "Scraping %s %s/%s: %s",
-            source.material.lower(),
-            index,
-            len(color_links),
-            detail_url,
-        )
-        records.extend(parse_detail_records(session, source, detail_url, timeout_sec))
-
+    records = await engine.crawl(
+        collect_color_links(engine, source, limit),
+        partial(parse_detail_records, engine, source),
+        label=f"Daltile {source.series_url.rstrip('/').rsplit('/', 1)[-1]}",
+    )
+    logging.info("Collected %s rows from %s", len(records), source.series_url)
     return records
 
 
+async def scrape_all_series(engine: CrawlEngine, limit: int) -> list[DaltileSlabRecord]:
+    series_records = await engine.map(
+        partial(scrape_material_records, engine, limit=limit),
+        collect_series_pages(),
+        label="Daltile series",
+        describe=lambda source: source.series_url,
+        skip_errors=SKIPPABLE_ERRORS,
+    )
+    return [record for records in series_records for record in records]
+
+
 def record_to_payload(record: DaltileSlabRecord) -> dict[str, str | None]:
     return {
         "name": record.name,
@@ -406,28 +399,20 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_TIMEOUT_SEC,
         help="HTTP timeout in seconds.",
     )
+    add_crawl_arguments(parser)
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    session = build_session()
-    all_records: list[DaltileSlabRecord] = []
-
-    for source in collect_series_pages():
-        logging.info("Opening Daltile series page: %s", source.series_url)
-        series_records = scrape_material_records(
-            session=session,
-            source=source,
-            timeout_sec=args.timeout_sec,
-            limit=args.limit,
-        )
-        all_records.extend(series_records)
-        logging.info(
-            "Collected %s rows from %s",
-            len(series_records),
-            source.series_url,
-        )
+    options = CrawlOptions(
+        user_agent=USER_AGENT,
+        timeout_sec=args.timeout_sec,
+        max_per_host=args.max_per_host,
+        min_interval_sec=args.min_interval_sec,
+        respect_robots=not args.ignore_robots,
+    )
+    all_records = run_crawl(partial(scrape_all_series, limit=args.limit), options)
 
     exports = export_records(all_records, Path(args.output_dir))
     for material, json_path, csv_path in exports:
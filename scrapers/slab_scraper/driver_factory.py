@@ -0,0 +1,434 @@
+"""
+Shared Chrome setup for the Selenium slab scrapers.
+
+The scrapers only read text and `src`/`srcset` attributes, so by default Chrome
+is started with a resource-blocking profile:
+- images are disabled through content-settings prefs
+- fonts, audio/video and common analytics/chat/ads hosts are blocked with
+  CDP `Network.setBlockedURLs`
+- pages are loaded with the `eager` strategy (return at DOMContentLoaded);
+  the scrapers already wait for the elements they read
+
+A supplier that needs one of those resources passes its own `ResourceProfile`,
+e.g. `ResourceProfile(allow=("fonts.googleapis.com",))` drops every block
+pattern containing that string. Set `SLAB_BLOCK_RESOURCES=false` to turn
+blocking off for a run.
+
+Every driver records its network traffic through Chrome's performance log.
+`log_network_summary` reports bytes transferred and requests blocked. It also
+reports bytes saved, estimated against the per-page size recorded the last time
+the supplier ran with blocking off.
+
+With `SLAB_CAPTURE_XHR=true` the same log is used to record every XHR/fetch
+call the pages make. `log_network_summary` then writes one JSON summary per
+supplier to `XHR_CAPTURE_DIR`, listing JSON endpoints first. It is the
+starting point for replacing a rendered crawl with direct API calls.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+
+NETWORK_BASELINE_PATH = Path("scrapers/slab_scraper/.browser_profiles/network_baseline.json")
+XHR_CAPTURE_DIR = Path("scrapers/slab_scraper/output/xhr_capture")
+XHR_RESOURCE_TYPES = {"XHR", "Fetch"}
+MAX_SAMPLE_CHARS = 500
+
+FONT_PATTERNS = (
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.eot",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+    "*use.typekit.net*",
+    "*use.fontawesome.com*",
+)
+MEDIA_PATTERNS = (
+    "*.mp4",
+    "*.webm",
+    "*.mov",
+    "*.m3u8",
+    "*.mp3",
+    "*youtube.com/embed*",
+    "*player.vimeo.com*",
+)
+TRACKER_PATTERNS = (
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*doubleclick.net*",
+    "*googleadservices.com*",
+    "*connect.facebook.net*",
+    "*facebook.com/tr*",
+    "*analytics.tiktok.com*",
+    "*snap.licdn.com*",
+    "*bat.bing.com*",
+    "*clarity.ms*",
+    "*hotjar.com*",
+    "*js.hs-scripts.com*",
+    "*js.hs-analytics.net*",
+    "*js.hsforms.net*",
+    "*widget.intercom.io*",
+    "*js.driftt.com*",
+    "*embed.tawk.to*",
+    "*static.zdassets.com*",
+    "*cdn.livechatinc.com*",
+    "*pinimg.com/ct*",
+    "*cookielaw.org*",
+    "*cookiebot.com*",
+    "*userway.org*",
+    "*accessibe.com*",
+)
+
+
+def blocking_enabled() -> bool:
+    return os.getenv("SLAB_BLOCK_RESOURCES", "true").lower() in {"1", "true", "yes"}
+
+
+def capture_enabled() -> bool:
+    return os.getenv("SLAB_CAPTURE_XHR", "false").lower() in {"1", "true", "yes"}
+
+
+@dataclass(frozen=True)
+class ResourceProfile:
+    block_images: bool = True
+    block_fonts: bool = True
+    block_media: bool = True
+    block_trackers: bool = True
+    allow: tuple[str, ...] = ()
+    page_load_strategy: str = "eager"
+
+    def blocked_patterns(self) -> list[str]:
+        patterns: list[str] = []
+        if self.block_fonts:
+            patterns.extend(FONT_PATTERNS)
+        if self.block_media:
+            patterns.extend(MEDIA_PATTERNS)
+        if self.block_trackers:
+            patterns.extend(TRACKER_PATTERNS)
+        return [pattern for pattern in patterns if not any(allowed in pattern for allowed in self.allow)]
+
+
+DEFAULT_RESOURCES = ResourceProfile()
+
+
+def active_resources(resources: ResourceProfile | None) -> ResourceProfile | None:
+    if not blocking_enabled():
+        return None
+    return resources or DEFAULT_RESOURCES
+
+
+def build_chrome_options(
+    headless: bool,
+    *,
+    window_size: str = "1600,2400",
+    resources: ResourceProfile | None = None,
+) -> Options:
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument(f"--window-size={window_size}")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-gpu")
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+    resources = active_resources(resources)
+    if resources:
+        options.page_load_strategy = resources.page_load_strategy
+        if resources.block_images:
+            options.add_experimental_option(
+                "prefs",
+                {"profile.managed_default_content_settings.images": 2},
+            )
+    return options
+
+
+def start_chrome(options: Options, resources: ResourceProfile | None = None) -> webdriver.Chrome:
+    driver = webdriver.Chrome(options=options)
+    resources = active_resources(resources)
+    patterns = resources.blocked_patterns() if resources else []
+    if patterns or capture_enabled():
+        # Response bodies for the XHR capture are also read through the Network domain.
+        driver.execute_cdp_cmd("Network.enable", {})
+    if patterns:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    return driver
+
+
+class NetworkStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pages = 0
+        self.bytes = 0
+        self.blocked: Counter = Counter()
+
+    def add(self, entries: list[dict]) -> None:
+        pages = 0
+        received = 0
+        blocked: Counter = Counter()
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params") or {}
+            if method == "Network.requestWillBeSent":
+                # Navigations use the loader id as their request id; subresources do not.
+                if params.get("type") == "Document" and params.get("requestId") == params.get("loaderId"):
+                    pages += 1
+            elif method == "Network.loadingFinished":
+                received += int(params.get("encodedDataLength") or 0)
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked[params.get("type") or "Other"] += 1
+        with self.lock:
+            self.pages += pages
+            self.bytes += received
+            self.blocked.update(blocked)
+
+
+NETWORK_STATS = NetworkStats()
+
+
+def describe_json(body: str) -> str | None:
+    """A short outline of a JSON body: top-level keys, or list length plus the first item's keys."""
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    if isinstance(payload, dict):
+        return "object keys: " + ", ".join(list(payload)[:20])
+    if isinstance(payload, list):
+        first = payload[0] if payload else None
+        while isinstance(first, list) and first:
+            first = first[0]
+        if isinstance(first, dict):
+            return f"list of {len(payload)}; first item keys: " + ", ".join(list(first)[:20])
+        return f"list of {len(payload)}"
+    return type(payload).__name__
+
+
+class EndpointCapture:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints: dict[tuple[str, str], dict] = {}
+        # XHRs still in flight when the log was drained, by (session, request id).
+        self.in_flight: dict[tuple[str, str], dict] = {}
+
+    def add(self, driver: webdriver.Chrome, entries: list[dict]) -> None:
+        session = getattr(driver, "session_id", None) or ""
+        with self.lock:
+            requests = {
+                request_id: request
+                for (request_session, request_id), request in self.in_flight.items()
+                if request_session == session
+            }
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params") or {}
+            request_id = params.get("requestId")
+
+            if method == "Network.requestWillBeSent" and params.get("type") in XHR_RESOURCE_TYPES:
+                request = params.get("request") or {}
+                requests[request_id] = {
+                    "method": request.get("method") or "GET",
+                    "url": request.get("url") or "",
+                    "post_data": (request.get("postData") or "")[:MAX_SAMPLE_CHARS] or None,
+                }
+            elif request_id not in requests:
+                continue
+            elif method == "Network.responseReceived":
+                response = params.get("response") or {}
+                requests[request_id]["status"] = response.get("status")
+                requests[request_id]["mime_type"] = response.get("mimeType") or ""
+            elif method == "Network.loadingFinished":
+                requests[request_id]["bytes"] = int(params.get("encodedDataLength") or 0)
+                requests[request_id]["finished"] = True
+            elif method == "Network.loadingFailed":
+                requests[request_id]["status"] = params.get("blockedReason") or params.get("errorText") or "failed"
+                requests[request_id]["finished"] = True
+
+        with self.lock:
+            for request_id, request in requests.items():
+                if request.get("finished"):
+                    self.in_flight.pop((session, request_id), None)
+                else:
+                    self.in_flight[(session, request_id)] = request
+        for request_id, request in requests.items():
+            if request.get("finished"):
+                self.record(driver, request_id, request)
+
+    def record(self, driver: webdriver.Chrome, request_id: str, request: dict) -> None:
+        parts = urlsplit(request["url"])
+        key = (request["method"], f"{parts.scheme}://{parts.netloc}{parts.path}")
+        is_json = "json" in request.get("mime_type", "") or parts.path.endswith(".json")
+        with self.lock:
+            endpoint = self.endpoints.setdefault(
+                key,
+                {
+                    "method": key[0],
+                    "endpoint": key[1],
+                    "json": is_json,
+                    "mime_type": request.get("mime_type"),
+                    "calls": 0,
+                    "bytes": 0,
+                    "statuses": Counter(),
+                    "query_params": set(),
+                    "example_url": request["url"],
+                    "example_post_data": request.get("post_data"),
+                    "response_outline": None,
+                    "response_sample": None,
+                },
+            )
+            endpoint["calls"] += 1
+            endpoint["bytes"] += request.get("bytes", 0)
+            endpoint["statuses"][str(request.get("status"))] += 1
+            endpoint["query_params"].update(name for name, _ in parse_qsl(parts.query, keep_blank_values=True))
+            needs_sample = endpoint["response_sample"] is None and isinstance(request.get("status"), int)
+
+        if not needs_sample:
+            return
+        # Chrome drops bodies once the page that loaded them is gone, so this is best effort.
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id}).get("body") or ""
+        except Exception:
+            return
+        with self.lock:
+            endpoint["response_sample"] = body[:MAX_SAMPLE_CHARS]
+            if is_json:
+                endpoint["response_outline"] = describe_json(body)
+
+    def write_summary(self, supplier: str) -> Path | None:
+        with self.lock:
+            endpoints = [
+                {
+                    **endpoint,
+                    "statuses": dict(endpoint["statuses"]),
+                    "query_params": sorted(endpoint["query_params"]),
+                }
+                for endpoint in self.endpoints.values()
+            ]
+        if not endpoints:
+            return None
+        endpoints.sort(key=lambda endpoint: (not endpoint["json"], -endpoint["calls"], endpoint["endpoint"]))
+        XHR_CAPTURE_DIR.mkdir(parents=True, exist_ok=True)
+        path = XHR_CAPTURE_DIR / f"{supplier}_endpoints.json"
+        path.write_text(json.dumps(endpoints, indent=2, ensure_ascii=True) + "\n", encoding="utf-8")
+        return path
+
+
+ENDPOINT_CAPTURE = EndpointCapture()
+
+
+def drain_network_log(driver: webdriver.Chrome) -> list[dict]:
+    """Reads (and clears) the driver's performance log into `NETWORK_STATS`. Returns the raw entries."""
+    try:
+        entries = driver.get_log("performance")
+    except Exception as exc:
+        logging.debug("Could not read Chrome performance log: %s", exc)
+        return []
+    NETWORK_STATS.add(entries)
+    if capture_enabled():
+        ENDPOINT_CAPTURE.add(driver, entries)
+    return entries
+
+
+def load_page(driver: webdriver.Chrome, url: str) -> None:
+    """
+    Drains the network log of the page being left, then loads `url`. Response
+    bodies for XHR capture are only readable while their page is still loaded,
+    and an undrained log keeps growing in chromedriver until `quit_chrome`.
+    """
+    drain_network_log(driver)
+    driver.get(url)
+
+
+def quit_chrome(driver: webdriver.Chrome) -> None:
+    drain_network_log(driver)
+    try:
+        driver.quit()
+    except Exception as exc:
+        logging.debug("Ignoring error while closing Chrome: %s", exc)
+
+
+def load_network_baseline() -> dict[str, float]:
+    if not NETWORK_BASELINE_PATH.exists():
+        return {}
+    try:
+        return json.loads(NETWORK_BASELINE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def log_network_summary(supplier: str) -> None:
+    if capture_enabled():
+        capture_path = ENDPOINT_CAPTURE.write_summary(supplier)
+        if capture_path:
+            json_count = sum(1 for endpoint in ENDPOINT_CAPTURE.endpoints.values() if endpoint["json"])
+            logging.info(
+                "XHR capture: %s endpoints (%s JSON) written to %s",
+                len(ENDPOINT_CAPTURE.endpoints),
+                json_count,
+                capture_path,
+            )
+        else:
+            logging.info("XHR capture: no XHR/fetch calls seen for %s", supplier)
+
+    with NETWORK_STATS.lock:
+        pages = NETWORK_STATS.pages
+        received = NETWORK_STATS.bytes
+        blocked = Counter(NETWORK_STATS.blocked)
+    if not pages:
+        return
+
+    bytes_per_page = received / pages
+    baseline = load_network_baseline()
+
+    if not blocking_enabled():
+        baseline[supplier] = round(bytes_per_page)
+        NETWORK_BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        NETWORK_BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True), encoding="utf-8")
+        logging.info(
+            "Chrome network (blocking off): %s pages, %s bytes (%.0f KB/page); saved as %s baseline",
+            pages,
+            received,
+            bytes_per_page / 1024,
+            supplier,
+        )
+        return
+
+    logging.info(
+        "Chrome network: %s pages, %s bytes (%.0f KB/page), %s requests blocked (%s)",
+        pages,
+        received,
+        bytes_per_page / 1024,
+        sum(blocked.values()),
+        ", ".join(f"{kind} {count}" for kind, count in blocked.most_common()) or "none",
+    )
+    if supplier in baseline:
+        saved = max(0.0, baseline[supplier] - bytes_per_page) * pages
+        logging.info(
+            "Chrome network: ~%.0f bytes saved against the %.0f KB/page unblocked baseline",
+            saved,
+            baseline[supplier] / 1024,
+        )
+    else:
+        logging.info("Chrome network: run once with SLAB_BLOCK_RESOURCES=false to record a %s baseline", supplier)
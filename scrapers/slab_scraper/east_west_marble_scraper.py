@@ -28,10 +28,14 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import UnifiedSlabRecord, canonical_material, export_unified_csv, iso_now
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import UnifiedSlabRecord, canonical_material, export_unified_csv, iso_now  # type: ignore
 
 
@@ -70,18 +74,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2400")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless)
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -99,7 +96,7 @@ def has_unstable_detail_url(detail_url: str) -> bool:
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait) -> None:
     logging.info("Opening East West Marble listing page: %s", LISTING_URL)
-    driver.get(LISTING_URL)
+    load_page(driver, LISTING_URL)
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
 
 
@@ -148,7 +145,7 @@ def collect_detail_record(
             brand=DEFAULT_BRAND,
         )
 
-    driver.get(detail_url)
+    load_page(driver, detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_IMAGE_LINK_SELECTOR)))
 
     page_name = listing_name
@@ -175,17 +172,15 @@ def collect_detail_record(
 
 
 def scrape_detail_pages(
-    driver: webdriver.Chrome,
-    wait: WebDriverWait,
+    pool: BrowserPool,
     products: list[tuple[str, str]],
 ) -> list[EastWestMarbleRecord]:
-    records: list[EastWestMarbleRecord] = []
-
-    for index, (listing_name, detail_url) in enumerate(products, start=1):
-        logging.info("Scraping East West Marble detail %s/%s: %s", index, len(products), detail_url)
-        records.append(collect_detail_record(driver, wait, listing_name, detail_url))
-
-    return records
+    return pool.map(
+        lambda driver, wait, product: collect_detail_record(driver, wait, *product),
+        products,
+        label="East West Marble detail",
+        describe=lambda product: product[1],
+    )
 
 
 def to_unified(record: EastWestMarbleRecord, scraped_at: str) -> UnifiedSlabRecord:
@@ -245,6 +240,7 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_LIMIT,
         help="Optional max number of listing products to scrape.",
     )
+    add_pool_arguments(parser)
     return parser.parse_args()
 
 
@@ -257,7 +253,7 @@ def main() -> None:
     try:
         open_listing_page(driver, wait)
         products = collect_listing_products(driver, args.limit)
-        records = scrape_detail_pages(driver, wait, products)
+        records = scrape_detail_pages(pool_from_args(args, build_options, "east_west_marble", listing_driver=driver), products)
         json_path, csv_path = export_records(records, output_dir)
 
         logging.info("Export complete")
@@ -265,7 +261,8 @@ def main() -> None:
         logging.info("CSV: %s", csv_path)
         logging.info("Collected %s East West Marble Vision Quartz slabs", len(records))
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("east_west_marble")
 
 
 if __name__ == "__main__":
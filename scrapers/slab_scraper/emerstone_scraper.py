@@ -29,6 +29,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -41,6 +43,8 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -101,18 +105,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2400")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless)
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -120,7 +117,7 @@ def safe_text(element) -> str:
 
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait) -> None:
-    driver.get(LISTING_URL)
+    load_page(driver, LISTING_URL)
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
 
 
@@ -151,7 +148,7 @@ def collect_listing_products(
 
     for page_index, page_url in enumerate(page_urls, start=1):
         if page_index > 1:
-            driver.get(page_url)
+            load_page(driver, page_url)
             wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
 
         logging.info("Collecting listing page %s/%s: %s", page_index, len(page_urls), page_url)
@@ -219,7 +216,7 @@ def collect_detail_record(
     listing_name: str,
     detail_url: str,
 ) -> EmerstoneSlabRecord:
-    driver.get(detail_url)
+    load_page(driver, detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_NAME_SELECTOR)))
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, DETAIL_SPEC_ROW_SELECTOR)))
 
@@ -248,17 +245,15 @@ def collect_detail_record(
 
 
 def scrape_detail_pages(
-    driver: webdriver.Chrome,
-    wait: WebDriverWait,
+    pool: BrowserPool,
     products: list[tuple[str, str]],
 ) -> list[EmerstoneSlabRecord]:
-    records: list[EmerstoneSlabRecord] = []
-
-    for index, (listing_name, detail_url) in enumerate(products, start=1):
-        logging.info("Scraping detail %s/%s: %s", index, len(products), detail_url)
-        records.append(collect_detail_record(driver, wait, listing_name, detail_url))
-
-    return records
+    return pool.map(
+        lambda driver, wait, product: collect_detail_record(driver, wait, *product),
+        products,
+        label="detail",
+        describe=lambda product: product[1],
+    )
 
 
 def to_unified(record: EmerstoneSlabRecord, scraped_at: str) -> UnifiedSlabRecord:
@@ -336,6 +331,7 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_TIMEOUT_SEC,
         help="Selenium wait timeout in seconds.",
     )
+    add_pool_arguments(parser)
     return parser.parse_args()
 
 
@@ -353,7 +349,7 @@ def main() -> None:
         products = collect_listing_products(driver, wait, limit)
         logging.info("Collected %s product links for this run", len(products))
 
-        records = scrape_detail_pages(driver, wait, products)
+        records = scrape_detail_pages(pool_from_args(args, build_options, "emerstone", listing_driver=driver), products)
         json_path, csv_path = export_records(records, output_dir)
 
         logging.info("Export complete")
@@ -362,7 +358,8 @@ def main() -> None:
     except TimeoutException as error:
         raise RuntimeError("Timed out while loading Emerstone listing or detail pages") from error
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("emerstone")
 
 
 if __name__ == "__main__":
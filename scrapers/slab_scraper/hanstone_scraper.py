@@ -30,6 +30,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -42,6 +44,8 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -114,18 +118,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2400")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless)
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -140,7 +137,7 @@ def title_case_name(name: str) -> str:
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait, url: str) -> None:
     logging.info("Opening HanStone listing page: %s", url)
-    driver.get(url)
+    load_page(driver, url)
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
 
 
@@ -247,7 +244,7 @@ def collect_detail_record(
     listing_name: str,
     detail_url: str,
 ) -> HanstoneSlabRecord:
-    driver.get(detail_url)
+    load_page(driver, detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_STATS_SELECTOR)))
 
     image_url = None
@@ -284,17 +281,15 @@ def collect_detail_record(
 
 
 def scrape_detail_pages(
-    driver: webdriver.Chrome,
-    wait: WebDriverWait,
+    pool: BrowserPool,
     products: list[tuple[str, str]],
 ) -> list[HanstoneSlabRecord]:
-    records: list[HanstoneSlabRecord] = []
-
-    for index, (listing_name, detail_url) in enumerate(products, start=1):
-        logging.info("Scraping HanStone detail %s/%s: %s", index, len(products), detail_url)
-        records.append(collect_detail_record(driver, wait, listing_name, detail_url))
-
-    return records
+    return pool.map(
+        lambda driver, wait, product: collect_detail_record(driver, wait, *product),
+        products,
+        label="HanStone detail",
+        describe=lambda product: product[1],
+    )
 
 
 def to_unified(record: HanstoneSlabRecord, scraped_at: str) -> UnifiedSlabRecord:
@@ -369,6 +364,7 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_LIMIT,
         help="Optional max number of listing products to scrape.",
     )
+    add_pool_arguments(parser)
     return parser.parse_args()
 
 
@@ -381,7 +377,7 @@ def main() -> None:
     try:
         open_listing_page(driver, wait, LISTING_URL)
         products = collect_listing_products(driver, wait, args.limit)
-        records = scrape_detail_pages(driver, wait, products)
+        records = scrape_detail_pages(pool_from_args(args, build_options, "hanstone", listing_driver=driver), products)
         json_path, csv_path = export_records(records, output_dir)
 
         logging.info("Export complete")
@@ -389,7 +385,8 @@ def main() -> None:
         logging.info("CSV: %s", csv_path)
         logging.info("Collected %s HanStone quartz slabs", len(records))
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("hanstone")
 
 
 if __name__ == "__main__":
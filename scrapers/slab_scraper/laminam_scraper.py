@@ -19,17 +19,16 @@ import csv
 import json
 import logging
 import re
-import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Iterable
 
-import requests
 from bs4 import BeautifulSoup
-from requests import RequestException
 
 try:
+    from .crawl_engine import CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -40,6 +39,7 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from crawl_engine import CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -67,7 +67,7 @@ DEFAULT_OUTPUT_DIR = Path("scrapers/slab_scraper/output/laminam")
 DEFAULT_TIMEOUT_SEC = 45
 DEFAULT_REQUEST_DELAY_SEC = 0.1
 MAX_LISTING_PAGES = 20
-MAX_REQUEST_ATTEMPTS = 4
+USER_AGENT = "Mozilla/5.0 (compatible; LaminamScraper/1.0)"
 DEFAULT_SUPPLIER = "Emerstone"
 DEFAULT_BRAND = "Laminam"
 DEFAULT_MATERIAL = "Porcelain"
@@ -113,40 +113,6 @@ def dedupe_preserve_order(values: Iterable[str]) -> list[str]:
     return output
 
 
-def build_session() -> requests.Session:
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (compatible; LaminamScraper/1.0)",
-        }
-    )
-    return session
-
-
-def fetch_html(session: requests.Session, url: str, timeout_sec: int) -> str:
-    last_error: Exception | None = None
-    for attempt in range(1, MAX_REQUEST_ATTEMPTS + 1):
-        try:
-            response = session.get(url, timeout=timeout_sec)
-            response.raise_for_status()
-            return response.text
-        except RequestException as exc:
-            last_error = exc
-            logging.warning(
-                "Request failed for %s (attempt %s/%s): %s",
-                url,
-                attempt,
-                MAX_REQUEST_ATTEMPTS,
-                exc,
-            )
-            if attempt >= MAX_REQUEST_ATTEMPTS:
-                break
-            time.sleep(min(2 ** (attempt - 1), 6))
-
-    assert last_error is not None
-    raise last_error
-
-
 def normalize_listing_url(url: str) -> str:
     return url.rstrip("/") + "/"
 
@@ -189,19 +155,14 @@ def parse_listing_card(card) -> dict[str, object] | None:
     }
 
 
-def collect_listing_products(
-    session: requests.Session,
-    timeout_sec: int,
-    request_delay_sec: float,
-) -> list[dict[str, object]]:
+async def collect_listing_products(engine: CrawlEngine) -> list[dict[str, object]]:
     seen_urls: set[str] = set()
     products: list[dict[str, object]] = []
     current_url = LISTING_URL
 
     for _ in range(MAX_LISTING_PAGES):
         logging.info("Collecting listing page: %s", current_url)
-        html = fetch_html(session, current_url, timeout_sec)
-        soup = BeautifulSoup(html, "html.parser")
+        soup = await engine.get_soup(current_url)
 
         page_new_count = 0
         for card in soup.select('a.card[href*="/en/products/"]'):
@@ -223,7 +184,6 @@ def collect_listing_products(
             break
 
         current_url = next_url
-        time.sleep(request_delay_sec)
 
     return products
 
@@ -296,14 +256,12 @@ def parse_og_image_url(soup: BeautifulSoup) -> str | None:
     return clean_text(node.get("content")) if node else None
 
 
-def collect_detail_record(
-    session: requests.Session,
+async def collect_detail_record(
+    engine: CrawlEngine,
     listing_payload: dict[str, object],
-    timeout_sec: int,
 ) -> LaminamRecord:
     detail_url = str(listing_payload["detail_url"])
-    html = fetch_html(session, detail_url, timeout_sec)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = await engine.get_soup(detail_url)
 
     title_node = soup.select_one(".product__content h1")
     name = clean_text(title_node.get_text(" ", strip=True) if title_node else str(listing_payload["name"]))
@@ -357,6 +315,14 @@ def collect_detail_record(
     )
 
 
+async def scrape_laminam(engine: CrawlEngine) -> list[LaminamRecord]:
+    return await engine.crawl(
+        collect_listing_products(engine),
+        partial(collect_detail_record, engine),
+        label="Laminam",
+    )
+
+
 def to_unified(record: LaminamRecord, scraped_at: str) -> UnifiedSlabRecord:
     extra: dict = {"book_match": bool(record.book_match)}
     if record.sizes:
@@ -416,32 +382,26 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Scrape Laminam products into local JSON/CSV exports.")
     parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
     parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT_SEC)
-    parser.add_argument("--delay", type=float, default=DEFAULT_REQUEST_DELAY_SEC)
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=DEFAULT_REQUEST_DELAY_SEC,
+        help="Minimum seconds between request starts to laminam.com.",
+    )
+    add_crawl_arguments(parser, min_interval_flag=False)
     return parser.parse_args()
 
 
 def main() -> int:
     args = parse_args()
-    session = build_session()
-
-    products = collect_listing_products(
-        session=session,
+    options = CrawlOptions(
+        user_agent=USER_AGENT,
         timeout_sec=args.timeout,
-        request_delay_sec=args.delay,
+        max_per_host=args.max_per_host,
+        min_interval_sec=args.delay,
+        respect_robots=not args.ignore_robots,
     )
-    logging.info("Collected %s unique Laminam product urls", len(products))
-
-    records: list[LaminamRecord] = []
-    for index, payload in enumerate(products, start=1):
-        logging.info("Scraping Laminam detail %s/%s: %s", index, len(products), payload["detail_url"])
-        records.append(
-            collect_detail_record(
-                session=session,
-                listing_payload=payload,
-                timeout_sec=args.timeout,
-            )
-        )
-        time.sleep(args.delay)
+    records: list[LaminamRecord] = run_crawl(scrape_laminam, options)
 
     json_path, csv_path = export_records(records, args.output_dir)
     logging.info("Exported %s Laminam records to %s and %s", len(records), json_path, csv_path)
@@ -30,6 +30,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -43,6 +45,8 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -117,18 +121,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2400")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless)
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -147,7 +144,7 @@ def safe_text_content(element) -> str:
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait, url: str) -> None:
     logging.info("Opening Marble Systems listing page: %s", url)
-    driver.get(url)
+    load_page(driver, url)
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
 
 
@@ -313,7 +310,7 @@ def collect_detail_record(
     listing_name: str,
     detail_url: str,
 ) -> dict[str, object] | None:
-    driver.get(detail_url)
+    load_page(driver, detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_READY_SELECTOR)))
 
     technical = parse_technical_info(driver)
@@ -333,15 +330,18 @@ def collect_detail_record(
 
 
 def scrape_detail_pages(
-    driver: webdriver.Chrome,
-    wait: WebDriverWait,
+    pool: BrowserPool,
     products: list[tuple[str, str]],
 ) -> list[MarbleSystemsSlabRecord]:
     records: list[MarbleSystemsSlabRecord] = []
+    details = pool.map(
+        lambda driver, wait, product: collect_detail_record(driver, wait, *product),
+        products,
+        label="Marble Systems detail",
+        describe=lambda product: product[1],
+    )
 
-    for index, (listing_name, detail_url) in enumerate(products, start=1):
-        logging.info("Scraping Marble Systems detail %s/%s: %s", index, len(products), detail_url)
-        detail = collect_detail_record(driver, wait, listing_name, detail_url)
+    for detail in details:
         if detail is None:
             continue
         for batch in detail["va_batches"]:
@@ -429,6 +429,7 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_LIMIT,
         help="Optional max number of listing products to scrape.",
     )
+    add_pool_arguments(parser)
     return parser.parse_args()
 
 
@@ -441,7 +442,7 @@ def main() -> None:
     try:
         open_listing_page(driver, wait, LISTING_URL)
         products = collect_listing_products(driver, wait, args.limit)
-        records = scrape_detail_pages(driver, wait, products)
+        records = scrape_detail_pages(pool_from_args(args, build_options, "marble_systems", listing_driver=driver), products)
         json_path, csv_path = export_records(records, output_dir)
 
         logging.info("Export complete")
@@ -449,7 +450,8 @@ def main() -> None:
         logging.info("CSV: %s", csv_path)
         logging.info("Collected %s Marble Systems slabs with Fairfax, VA batches", len(records))
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("marble_systems")
 
 
 if __name__ == "__main__":
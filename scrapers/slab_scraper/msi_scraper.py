@@ -30,6 +30,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -41,6 +43,8 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -109,18 +113,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2200")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless, window_size="1600,2200")
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -132,7 +129,7 @@ def detect_product_material(driver: webdriver.Chrome) -> str:
 
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait) -> None:
-    driver.get(LISTING_URL)
+    load_page(driver, LISTING_URL)
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_LINK_SELECTOR)))
 
 
@@ -181,7 +178,7 @@ def collect_detail_record(
     listing_name: str,
     detail_url: str,
 ) -> MsiSlabRecord:
-    driver.get(detail_url)
+    load_page(driver, detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_NAME_SELECTOR)))
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, DETAIL_SPEC_ROW_SELECTOR)))
 
@@ -285,8 +282,7 @@ def load_checkpoint(output_dir: Path) -> list[MsiSlabRecord]:
 
 
 def scrape_detail_pages(
-    driver: webdriver.Chrome,
-    wait: WebDriverWait,
+    pool: BrowserPool,
     product_links: list[tuple[str, str]],
     output_dir: Path,
     existing_records: list[MsiSlabRecord] | None = None,
@@ -299,25 +295,27 @@ def scrape_detail_pages(
     if completed_urls:
         logging.info("Resuming from checkpoint with %s completed records", len(completed_urls))
 
-    for index, (listing_name, detail_url) in enumerate(remaining_links, start=1):
-        logging.info(
-            "Scraping detail %s/%s: %s",
-            len(records) + 1,
-            len(product_links),
-            detail_url,
-        )
-        try:
-            record = collect_detail_record(driver, wait, listing_name, detail_url)
-        except TimeoutException:
-            logging.warning("Timed out on detail page, skipping for now: %s", detail_url)
-            failed_urls.append(detail_url)
-            write_checkpoint(output_dir, records, failed_urls)
-            continue
-
-        records.append(record)
-        write_checkpoint(output_dir, records, failed_urls)
-
-    return records
+    # Checkpoints follow completion order; the export below keeps catalog order.
+    checkpointed = list(records)
+
+    def save(product: tuple[str, str], record: MsiSlabRecord) -> None:
+        checkpointed.append(record)
+        write_checkpoint(output_dir, checkpointed, failed_urls)
+
+    def skip(product: tuple[str, str], error: BaseException) -> None:
+        failed_urls.append(product[1])
+        write_checkpoint(output_dir, checkpointed, failed_urls)
+
+    scraped = pool.map(
+        lambda driver, wait, product: collect_detail_record(driver, wait, *product),
+        remaining_links,
+        label="MSI detail",
+        describe=lambda product: product[1],
+        skip_errors=(TimeoutException,),
+        on_result=save,
+        on_failure=skip,
+    )
+    return records + scraped
 
 
 def to_unified(record: MsiSlabRecord, scraped_at: str) -> UnifiedSlabRecord:
@@ -380,6 +378,7 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Ignore any MSI checkpoint files and start the detail scrape from scratch.",
     )
+    add_pool_arguments(parser)
     return parser.parse_args()
 
 
@@ -398,7 +397,7 @@ def main() -> None:
         product_links = collect_listing_products(driver, limit)
         logging.info("Collected %s product links for this run", len(product_links))
 
-        records = scrape_detail_pages(driver, wait, product_links, output_dir, existing_records)
+        records = scrape_detail_pages(pool_from_args(args, build_options, "msi", listing_driver=driver), product_links, output_dir, existing_records)
         json_path, csv_path = export_records(records, output_dir)
 
         logging.info("Export complete")
@@ -411,7 +410,8 @@ def main() -> None:
     except TimeoutException as error:
         raise RuntimeError("Timed out while loading MSI listing or detail pages") from error
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("msi")
 
 
 if __name__ == "__main__":
@@ -17,13 +17,14 @@ import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
 try:
+    from .crawl_engine import SKIPPABLE_ERRORS, CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -36,6 +37,7 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from crawl_engine import SKIPPABLE_ERRORS, CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -99,12 +101,6 @@ def now_timestamp_slug() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
-def build_session() -> requests.Session:
-    session = requests.Session()
-    session.headers.update({"User-Agent": USER_AGENT})
-    return session
-
-
 def safe_text(value: str | None) -> str:
     return " ".join((value or "").split())
 
@@ -122,12 +118,6 @@ def normalize_slug_text(value: str | None) -> str | None:
     return cleaned.replace("-", " ").title()
 
 
-def get_soup(session: requests.Session, url: str, timeout_sec: int) -> BeautifulSoup:
-    response = session.get(url, timeout=timeout_sec)
-    response.raise_for_status()
-    return BeautifulSoup(response.text, "html.parser")
-
-
 def collect_catalog_sources() -> list[RaphaelCatalogSource]:
     return [
         RaphaelCatalogSource(source_name=source_name, material=material, listing_url=listing_url)
@@ -153,20 +143,27 @@ def build_page_url(base_url: str, page_number: int) -> str:
     return urljoin(base_url, f"page/{page_number}/")
 
 
-def collect_listing_products(
-    session: requests.Session,
+async def collect_listing_products(
+    engine: CrawlEngine,
     source: RaphaelCatalogSource,
-    timeout_sec: int,
     limit: int,
 ) -> list[tuple[str, str]]:
-    first_page = get_soup(session, source.listing_url, timeout_sec)
+    logging.info("Opening Raphael catalog page: %s", source.listing_url)
+    first_page = await engine.get_soup(source.listing_url)
     max_page = collect_max_page(first_page)
+    page_urls = [build_page_url(source.listing_url, page_number) for page_number in range(1, max_page + 1)]
+    # With --limit, pages are fetched one at a time so paging stops once enough products are in.
+    later_pages = None if limit > 0 else await engine.map(engine.get_soup, page_urls[1:])
     products: list[tuple[str, str]] = []
     seen_urls: set[str] = set()
 
-    for page_number in range(1, max_page + 1):
-        page_url = build_page_url(source.listing_url, page_number)
-        soup = first_page if page_number == 1 else get_soup(session, page_url, timeout_sec)
+    for page_number, page_url in enumerate(page_urls, start=1):
+        if page_number == 1:
+            soup = first_page
+        elif later_pages is None:
+            soup = await engine.get_soup(page_url)
+        else:
+            soup = later_pages[page_number - 2]
         logging.info("Collecting Raphael listing page %s/%s: %s", page_number, max_page, page_url)
 
         for anchor in soup.select("a[href*='/design/engineered-stone/'], a[href*='/design/printed-stone/']"):
@@ -385,14 +382,13 @@ def choose_best_image_url(variation_image_url: str | None, soup: BeautifulSoup)
     return scored[0][2]
 
 
-def collect_detail_records(
-    session: requests.Session,
+async def collect_detail_records(
+    engine: CrawlEngine,
     source: RaphaelCatalogSource,
-    listing_name: str,
-    detail_url: str,
-    timeout_sec: int,
+    product: tuple[str, str],
 ) -> list[RaphaelSlabRecord]:
-    soup = get_soup(session, detail_url, timeout_sec)
+    listing_name, detail_url = product
+    soup = await engine.get_soup(detail_url)
     attributes = parse_attributes_table(soup)
     variations = parse_variations_form(soup)
     acf_variations = parse_acf_variations(soup)
@@ -467,6 +463,30 @@ def collect_detail_records(
     return records
 
 
+async def scrape_catalog(
+    engine: CrawlEngine,
+    source: RaphaelCatalogSource,
+    limit: int,
+) -> list[RaphaelSlabRecord]:
+    return await engine.crawl(
+        collect_listing_products(engine, source, limit),
+        partial(collect_detail_records, engine, source),
+        label=f"Raphael {source.source_name}",
+        describe=lambda product: product[1],
+    )
+
+
+async def scrape_all_catalogs(engine: CrawlEngine, limit: int) -> list[RaphaelSlabRecord]:
+    catalog_records = await engine.map(
+        partial(scrape_catalog, engine, limit=limit),
+        collect_catalog_sources(),
+        label="Raphael catalogs",
+        describe=lambda source: source.listing_url,
+        skip_errors=SKIPPABLE_ERRORS,
+    )
+    return [record for records in catalog_records for record in records]
+
+
 def record_to_payload(record: RaphaelSlabRecord) -> dict[str, str | None]:
     return {
         "name": record.name,
@@ -548,35 +568,20 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_TIMEOUT_SEC,
         help="HTTP timeout in seconds.",
     )
+    add_crawl_arguments(parser)
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    session = build_session()
-    all_records: list[RaphaelSlabRecord] = []
-
-    for source in collect_catalog_sources():
-        logging.info("Opening Raphael catalog page: %s", source.listing_url)
-        products = collect_listing_products(
-            session=session,
-            source=source,
-            timeout_sec=args.timeout_sec,
-            limit=args.limit,
-        )
-        logging.info("Collected %s products from %s", len(products), source.listing_url)
-
-        for index, (listing_name, detail_url) in enumerate(products, start=1):
-            logging.info("Scraping Raphael detail %s/%s: %s", index, len(products), detail_url)
-            all_records.extend(
-                collect_detail_records(
-                    session=session,
-                    source=source,
-                    listing_name=listing_name,
-                    detail_url=detail_url,
-                    timeout_sec=args.timeout_sec,
-                )
-            )
+    options = CrawlOptions(
+        user_agent=USER_AGENT,
+        timeout_sec=args.timeout_sec,
+        max_per_host=args.max_per_host,
+        min_interval_sec=args.min_interval_sec,
+        respect_robots=not args.ignore_robots,
+    )
+    all_records = run_crawl(partial(scrape_all_catalogs, limit=args.limit), options)
 
     exports = export_records(all_records, Path(args.output_dir))
     for material, json_path, csv_path in exports:
@@ -17,13 +17,14 @@ import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
 try:
+    from .crawl_engine import CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -36,6 +37,7 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from crawl_engine import CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -86,22 +88,10 @@ def now_timestamp_slug() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
-def build_session() -> requests.Session:
-    session = requests.Session()
-    session.headers.update({"User-Agent": USER_AGENT})
-    return session
-
-
 def safe_text(value: str | None) -> str:
     return " ".join((value or "").split())
 
 
-def get_soup(session: requests.Session, url: str, timeout_sec: int) -> BeautifulSoup:
-    response = session.get(url, timeout=timeout_sec)
-    response.raise_for_status()
-    return BeautifulSoup(response.text, "html.parser")
-
-
 def normalize_size(value: str | None) -> str | None:
     cleaned = safe_text(value).replace("\xa0", " ")
     if not cleaned:
@@ -214,11 +204,7 @@ def choose_best_image_url(variation_image_url: str | None, soup: BeautifulSoup)
     return scored[0][2]
 
 
-def collect_listing_products(
-    session: requests.Session,
-    timeout_sec: int,
-    limit: int,
-) -> list[tuple[str, str]]:
+async def collect_listing_products(engine: CrawlEngine, limit: int) -> list[tuple[str, str]]:
     products: list[tuple[str, str]] = []
     seen_urls: set[str] = set()
     next_url: str | None = LISTING_URL
@@ -226,7 +212,7 @@ def collect_listing_products(
 
     while next_url:
         page_index += 1
-        soup = get_soup(session, next_url, timeout_sec)
+        soup = await engine.get_soup(next_url)
         logging.info("Collecting Reliance listing page %s: %s", page_index, next_url)
 
         for anchor in soup.select("a.woocommerce-LoopProduct-link.woocommerce-loop-product__link[href]"):
@@ -314,13 +300,9 @@ def choose_fallback_value(options: dict[str, list[str]], key: str) -> str | None
     return ", ".join(values)
 
 
-def collect_detail_records(
-    session: requests.Session,
-    listing_name: str,
-    detail_url: str,
-    timeout_sec: int,
-) -> list[RelianceSlabRecord]:
-    soup = get_soup(session, detail_url, timeout_sec)
+async def collect_detail_records(engine: CrawlEngine, product: tuple[str, str]) -> list[RelianceSlabRecord]:
+    listing_name, detail_url = product
+    soup = await engine.get_soup(detail_url)
     variations = parse_variations_form(soup)
     selector_options = parse_selector_options(soup)
     spec_values = parse_specification_blocks(soup)
@@ -394,6 +376,14 @@ def collect_detail_records(
     return records
 
 
+async def scrape_reliance(engine: CrawlEngine, limit: int) -> list[RelianceSlabRecord]:
+    return await engine.crawl(
+        collect_listing_products(engine, limit),
+        partial(collect_detail_records, engine),
+        label="Reliance",
+    )
+
+
 def record_to_payload(record: RelianceSlabRecord) -> dict[str, str | None]:
     return {
         "name": record.name,
@@ -467,19 +457,20 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_TIMEOUT_SEC,
         help="HTTP timeout in seconds.",
     )
+    add_crawl_arguments(parser)
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    session = build_session()
-    products = collect_listing_products(session, args.timeout_sec, args.limit)
-    logging.info("Collected %s Reliance products", len(products))
-
-    records: list[RelianceSlabRecord] = []
-    for index, (listing_name, detail_url) in enumerate(products, start=1):
-        logging.info("Scraping Reliance detail %s/%s: %s", index, len(products), detail_url)
-        records.extend(collect_detail_records(session, listing_name, detail_url, args.timeout_sec))
+    options = CrawlOptions(
+        user_agent=USER_AGENT,
+        timeout_sec=args.timeout_sec,
+        max_per_host=args.max_per_host,
+        min_interval_sec=args.min_interval_sec,
+        respect_robots=not args.ignore_robots,
+    )
+    records: list[RelianceSlabRecord] = run_crawl(partial(scrape_reliance, limit=args.limit), options)
 
     exports = export_records(records, Path(args.output_dir))
     for material, json_path, csv_path in exports:
@@ -14,17 +14,18 @@ import csv
 import json
 import logging
 import re
-import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Iterable
 from urllib.parse import urljoin
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 
 try:
+    from .crawl_engine import SKIPPABLE_ERRORS, CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_material,
@@ -35,6 +36,7 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from crawl_engine import SKIPPABLE_ERRORS, CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_material,
@@ -55,6 +57,7 @@ DEFAULT_OUTPUT_DIR = Path("scrapers/slab_scraper/output/stone_action")
 DEFAULT_TIMEOUT_SEC = 45
 DEFAULT_REQUEST_DELAY_SEC = 0.15
 MAX_PAGES_PER_CATEGORY = 20
+USER_AGENT = "Mozilla/5.0 (compatible; StoneActionScraper/1.0)"
 CATEGORY_CONFIGS = [
     {
         "key": "quartz",
@@ -164,22 +167,6 @@ def normalize_thickness(value: str | None) -> str | None:
     return re.sub(r"(?i)\b(\d+(?:\.\d+)?)\s*cm\b", r"\1 CM", cleaned)
 
 
-def build_session() -> requests.Session:
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (compatible; StoneActionScraper/1.0)",
-        }
-    )
-    return session
-
-
-def fetch_html(session: requests.Session, url: str, timeout_sec: int) -> str:
-    response = session.get(url, timeout=timeout_sec)
-    response.raise_for_status()
-    return response.text
-
-
 def archive_page_url(base_archive_url: str, page_number: int) -> str:
     if page_number <= 1:
         return base_archive_url
@@ -221,19 +208,14 @@ def parse_archive_cards(html: str, base_archive_url: str) -> list[dict[str, str
     return cards
 
 
-def collect_archive_cards(
-    session: requests.Session,
-    archive_url: str,
-    timeout_sec: int,
-    request_delay_sec: float,
-) -> list[dict[str, str | None]]:
+async def collect_archive_cards(engine: CrawlEngine, archive_url: str) -> list[dict[str, str | None]]:
     deduped: dict[str, dict[str, str | None]] = {}
     for page_number in range(1, MAX_PAGES_PER_CATEGORY + 1):
         page_url = archive_page_url(archive_url, page_number)
         try:
-            html = fetch_html(session, page_url, timeout_sec)
-        except requests.HTTPError as exc:
-            if exc.response is not None and exc.response.status_code == 404:
+            html = await engine.fetch_text(page_url)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
                 break
             raise
         cards = parse_archive_cards(html, archive_url)
@@ -255,7 +237,6 @@ def collect_archive_cards(
         )
         if new_count == 0:
             break
-        time.sleep(request_delay_sec)
 
     return list(deduped.values())
 
@@ -337,17 +318,15 @@ def normalize_records(rows: list[StoneActionRecord]) -> list[StoneActionRecord]:
     return normalized_rows
 
 
-def parse_detail_page(
-    session: requests.Session,
+async def parse_detail_page(
+    engine: CrawlEngine,
     card: dict[str, str | None],
     material: str,
     brand: str | None,
     category_key: str,
-    timeout_sec: int,
 ) -> StoneActionRecord:
     detail_url = clean_text(card["detail_url"])
-    html = fetch_html(session, detail_url, timeout_sec)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = await engine.get_soup(detail_url)
 
     title_node = soup.select_one("h1")
     name = clean_text(title_node.get_text(" ", strip=True) if title_node else "")
@@ -381,32 +360,29 @@ def parse_detail_page(
     )
 
 
-def scrape_stone_action(timeout_sec: int, request_delay_sec: float) -> list[StoneActionRecord]:
-    session = build_session()
-    records: list[StoneActionRecord] = []
+async def scrape_category(engine: CrawlEngine, config: dict) -> list[StoneActionRecord]:
+    return await engine.crawl(
+        collect_archive_cards(engine, config["archive_url"]),
+        partial(
+            parse_detail_page,
+            engine,
+            material=config["material"],
+            brand=config["brand"],
+            category_key=config["key"],
+        ),
+        label=f"Stone Action {config['key']}",
+    )
 
-    for config in CATEGORY_CONFIGS:
-        cards = collect_archive_cards(
-            session,
-            archive_url=config["archive_url"],
-            timeout_sec=timeout_sec,
-            request_delay_sec=request_delay_sec,
-        )
-        logging.info("Stone Action %s total unique detail pages: %s", config["key"], len(cards))
-        for index, card in enumerate(cards, start=1):
-            record = parse_detail_page(
-                session=session,
-                card=card,
-                material=config["material"],
-                brand=config["brand"],
-                category_key=config["key"],
-                timeout_sec=timeout_sec,
-            )
-            records.append(record)
-            if index % 10 == 0:
-                logging.info("Stone Action %s processed %s/%s detail pages", config["key"], index, len(cards))
-            time.sleep(request_delay_sec)
 
+async def scrape_stone_action(engine: CrawlEngine) -> list[StoneActionRecord]:
+    category_records = await engine.map(
+        partial(scrape_category, engine),
+        CATEGORY_CONFIGS,
+        label="Stone Action categories",
+        describe=lambda config: config["key"],
+        skip_errors=SKIPPABLE_ERRORS,
+    )
+    records = [record for records in category_records for record in records]
     records.sort(key=lambda row: (row.material, row.name, row.detail_url))
     return records
 
@@ -459,17 +435,27 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Scrape Stone Action slabs into local JSON and CSV files.")
     parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR)
     parser.add_argument("--timeout-sec", type=int, default=DEFAULT_TIMEOUT_SEC)
-    parser.add_argument("--request-delay-sec", type=float, default=DEFAULT_REQUEST_DELAY_SEC)
+    parser.add_argument(
+        "--request-delay-sec",
+        type=float,
+        default=DEFAULT_REQUEST_DELAY_SEC,
+        help="Minimum seconds between request starts to stoneaction.net.",
+    )
+    add_crawl_arguments(parser, min_interval_flag=False)
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
     timestamp = now_timestamp_slug()
-    rows = scrape_stone_action(
+    options = CrawlOptions(
+        user_agent=USER_AGENT,
         timeout_sec=args.timeout_sec,
-        request_delay_sec=args.request_delay_sec,
+        max_per_host=args.max_per_host,
+        min_interval_sec=args.request_delay_sec,
+        respect_robots=not args.ignore_robots,
     )
+    rows = run_crawl(scrape_stone_action, options)
     normalized_rows = normalize_records(rows)
 
     json_path = args.output_dir / f"stone_action_inventory_{timestamp}.json"
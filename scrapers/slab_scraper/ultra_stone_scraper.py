@@ -5,6 +5,8 @@ Scope:
 - Extract the public Stone Profits item gallery for Ultra Stone
 - Normalize the API payload into review-friendly JSON/CSV exports
 - Keep the first pass product-based to match the upstream gallery behavior
+- Per-item inventory is fetched on a small thread pool and cached on disk by
+  item id, so re-runs within the cache TTL do not call the API for it
 """
 
 from __future__ import annotations
@@ -14,12 +16,17 @@ import csv
 import json
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from .unified_csv import (
@@ -55,6 +62,10 @@ AUTH_TOKEN = "N9TAY8J0ln3blUE0pjoSbTrGBxdsBPn+YQi2WUFCYxAvCYwY6v0QGHhZtv3a04plQq
 WEBCONNECT_SETTING_ID = "1"
 DEFAULT_OUTPUT_DIR = Path("scrapers/slab_scraper/output/ultra_stone")
 DEFAULT_TIMEOUT_SEC = 60
+DEFAULT_INVENTORY_WORKERS = 8
+DEFAULT_CACHE_DIR = Path("scrapers/slab_scraper/.cache/ultra_stone_inventory")
+DEFAULT_CACHE_TTL_SEC = 3600
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 ENGINEERED_MATERIALS = {"Quartz", "Porcelain Slabs", "Porcelain Tile", "Glass", "Unknown"}
 SUPPORTED_DB_MATERIALS = {
     "Dolomite",
@@ -271,8 +282,17 @@ def build_detail_url(item_id: int, name: str) -> str:
     return f"{CATALOG_BASE_URL}/#/InventoryItemDetail/{slug}/{item_id}"
 
 
-def build_session() -> requests.Session:
+def build_session(pool_size: int = 10) -> requests.Session:
     session = requests.Session()
+    retry = Retry(
+        total=4,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_maxsize=pool_size, max_retries=retry))
     session.headers.update(
         {
             "Authorization": AUTH_TOKEN,
@@ -401,6 +421,91 @@ def fetch_item_inventory_rows(
     )
 
 
+class InventoryCache:
+    """`getItemInventory` responses stored as one JSON file per item id."""
+
+    def __init__(self, cache_dir: Path, ttl_sec: float):
+        self.cache_dir = cache_dir
+        self.ttl_sec = ttl_sec
+
+    def path(self, item_id: int) -> Path:
+        return self.cache_dir / f"{item_id}.json"
+
+    def load(self, item_id: int) -> list[dict[str, Any]] | None:
+        if self.ttl_sec <= 0:
+            return None
+        path = self.path(item_id)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if time.time() - float(payload.get("fetched_at") or 0) > self.ttl_sec:
+            return None
+        rows = payload.get("rows")
+        return rows if isinstance(rows, list) else None
+
+    def store(self, item_id: int, rows: list[dict[str, Any]]) -> None:
+        if self.ttl_sec <= 0:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path(item_id)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"fetched_at": time.time(), "rows": rows}), encoding="utf-8")
+        temp_path.replace(path)
+
+
+def fetch_all_inventory_rows(
+    timeout_sec: int,
+    settings: dict[str, Any],
+    item_ids: list[int],
+    workers: int,
+    cache: InventoryCache,
+) -> dict[int, list[dict[str, Any]]]:
+    inventory: dict[int, list[dict[str, Any]]] = {}
+    missing: list[int] = []
+    for item_id in item_ids:
+        cached = cache.load(item_id)
+        if cached is None:
+            missing.append(item_id)
+        else:
+            inventory[item_id] = cached
+
+    workers = max(1, workers)
+    logging.info(
+        "Ultra Stone inventory: %s items cached, %s to fetch with %s workers",
+        len(inventory),
+        len(missing),
+        workers,
+    )
+
+    # requests.Session is not thread-safe; each worker keeps its own pooled session.
+    local = threading.local()
+    sessions: list[requests.Session] = []
+    sessions_lock = threading.Lock()
+
+    def fetch(item_id: int) -> list[dict[str, Any]]:
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = build_session(pool_size=1)
+            with sessions_lock:
+                sessions.append(session)
+        rows = fetch_item_inventory_rows(session, timeout_sec, settings, item_id)
+        cache.store(item_id, rows)
+        return rows
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ultra-stone-inventory") as executor:
+            for index, (item_id, rows) in enumerate(zip(missing, executor.map(fetch, missing)), start=1):
+                inventory[item_id] = rows
+                if index % 50 == 0 or index == len(missing):
+                    logging.info("Ultra Stone inventory fetched %s/%s", index, len(missing))
+    finally:
+        for session in sessions:
+            session.close()
+
+    return inventory
+
+
 def build_lookup(search_details: list[dict[str, Any]], option_name: str) -> dict[str, str]:
     lookup: dict[str, str] = {}
     for row in search_details:
@@ -644,11 +749,31 @@ def normalize_records(records: list[UltraStoneRecord]) -> list[UltraStoneRecord]
     return normalized
 
 
-def scrape(timeout_sec: int) -> tuple[list[UltraStoneRecord], dict[str, Any]]:
+def scrape(
+    timeout_sec: int,
+    workers: int = DEFAULT_INVENTORY_WORKERS,
+    cache: InventoryCache | None = None,
+) -> tuple[list[UltraStoneRecord], dict[str, Any]]:
     session = build_session()
     settings = fetch_settings(session, timeout_sec)
     search_details = fetch_search_details(session, timeout_sec)
     item_rows = dedupe_item_rows(fetch_item_rows(session, timeout_sec, settings))
+    session.close()
+
+    item_ids: list[int] = []
+    seen_item_ids: set[int] = set()
+    for item_row in item_rows:
+        item_id = as_optional_int(item_row.get("ItemID"))
+        if item_id is not None and item_id not in seen_item_ids:
+            seen_item_ids.add(item_id)
+            item_ids.append(item_id)
+    inventory_by_item = fetch_all_inventory_rows(
+        timeout_sec,
+        settings,
+        item_ids,
+        workers,
+        cache or InventoryCache(DEFAULT_CACHE_DIR, 0),
+    )
 
     finish_lookup = build_lookup(search_details, "Finish")
     origin_lookup = build_lookup(search_details, "Origin")
@@ -660,7 +785,7 @@ def scrape(timeout_sec: int) -> tuple[list[UltraStoneRecord], dict[str, Any]]:
         material = normalize_material(item_row.get("CategoryName"))
         inventory_rows: list[dict[str, Any]] = []
         if item_id is not None:
-            inventory_rows = dedupe_inventory_rows(fetch_item_inventory_rows(session, timeout_sec, settings, item_id))
+            inventory_rows = dedupe_inventory_rows(inventory_by_item[item_id])
 
         if should_expand_to_inventory_rows(material) and inventory_rows:
             for inventory_row in inventory_rows:
@@ -692,6 +817,24 @@ def build_parser() -> argparse.ArgumentParser:
         default=DEFAULT_TIMEOUT_SEC,
         help=f"HTTP timeout in seconds (default: {DEFAULT_TIMEOUT_SEC})",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_INVENTORY_WORKERS,
+        help=f"Concurrent per-item inventory requests (default: {DEFAULT_INVENTORY_WORKERS})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached per-item inventory responses (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--cache-ttl-sec",
+        type=float,
+        default=DEFAULT_CACHE_TTL_SEC,
+        help=f"Reuse cached inventory younger than this; 0 disables the cache (default: {DEFAULT_CACHE_TTL_SEC})",
+    )
     return parser
 
 
@@ -699,7 +842,11 @@ def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
 
-    records, settings = scrape(timeout_sec=args.timeout_sec)
+    records, settings = scrape(
+        timeout_sec=args.timeout_sec,
+        workers=args.workers,
+        cache=InventoryCache(args.cache_dir, args.cache_ttl_sec),
+    )
     normalized_records = normalize_records(records)
     timestamp = now_timestamp_slug()
 
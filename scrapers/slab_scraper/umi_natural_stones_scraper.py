@@ -6,17 +6,21 @@ Current scope:
 - Separate scraper from the Vicostone quartz flow
 - Listing pagination across rendered pages
 - Detail-page expansion into row-level slab inventory
+- `--api-mode` reads the lot rows straight from UMI's JSON endpoints instead of
+  through the browser
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import json
 import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from urllib.parse import urlencode
 
@@ -25,6 +29,15 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.chrome.options import Options
 
 try:
+    from .crawl_engine import SKIPPABLE_ERRORS, CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl
+    from .driver_factory import (
+        build_chrome_options,
+        drain_network_log,
+        load_page,
+        log_network_summary,
+        quit_chrome,
+        start_chrome,
+    )
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -37,6 +50,15 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from crawl_engine import SKIPPABLE_ERRORS, CrawlEngine, CrawlOptions, add_crawl_arguments, run_crawl  # type: ignore
+    from driver_factory import (  # type: ignore
+        build_chrome_options,
+        drain_network_log,
+        load_page,
+        log_network_summary,
+        quit_chrome,
+        start_chrome,
+    )
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -58,6 +80,14 @@ logging.basicConfig(
 
 
 BASE_URL = "https://umistone.com"
+LOT_API_URLS = (
+    "https://apps.umistone.com/linv/ILot.php",
+    "https://apps.umistone.com/linv/isoon.php",
+)
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36"
+)
 DEFAULT_OUTPUT_DIR = Path("scrapers/slab_scraper/output/umi_natural_stones")
 DEFAULT_TIMEOUT_SEC = 25
 DEFAULT_LIMIT = 0
@@ -119,18 +149,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2600")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless, window_size="1600,2600")
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(value: str | None) -> str:
@@ -155,7 +178,7 @@ def wait_for_pagination_ready(driver: webdriver.Chrome, wait: WebDriverWait) ->
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait, config: dict[str, str]) -> None:
     logging.info("Opening UMI natural stone inventory: %s", config["listing_url"])
-    driver.get(config["listing_url"])
+    load_page(driver, config["listing_url"])
     wait_for_cards(driver, wait)
     wait_for_pagination_ready(driver, wait)
 
@@ -267,6 +290,8 @@ def collect_listing_products(
     for page_number in range(1, total_pages + 1):
         wait.until(lambda current_driver: parse_current_page(current_driver) == page_number)
         wait_for_cards(driver, wait)
+        # Pages change by XHR, so drain while this page's responses are still readable.
+        drain_network_log(driver)
         logging.info("Collecting UMI %s listing page %s/%s", category_key, page_number, total_pages)
 
         for card in driver.find_elements(By.CSS_SELECTOR, "#loadedData .product-Item"):
@@ -416,12 +441,57 @@ def fetch_lot_payload(
     return payload
 
 
+def lot_rows_from_response(payload) -> list[dict]:
+    # Both endpoints answer [[row, ...], ...]; anything else has no rows.
+    if not isinstance(payload, list) or not payload or not isinstance(payload[0], list):
+        return []
+    return payload[0]
+
+
+async def fetch_lot_rows(engine: CrawlEngine, product: UmiListingProduct, branch_slug: str) -> list[dict]:
+    query = urlencode(
+        {
+            "branch": branch_slug,
+            "item": product.item_code,
+            "GroupCode": product.group_code,
+            "qty": product.qty_lots,
+        }
+    )
+    responses = await asyncio.gather(*(engine.fetch(f"{url}?{query}") for url in LOT_API_URLS))
+    rows: list[dict] = []
+    for response in responses:
+        rows.extend(lot_rows_from_response(response.json()))
+    return rows
+
+
+async def fetch_all_lot_rows(
+    engine: CrawlEngine,
+    products: list[UmiListingProduct],
+    branch_slug: str,
+) -> list[tuple[UmiListingProduct, list[dict]]]:
+    """(product, lot rows) pairs; products whose lot requests fail are left out."""
+
+    async def fetch(product: UmiListingProduct) -> tuple[UmiListingProduct, list[dict]]:
+        return product, await fetch_lot_rows(engine, product, branch_slug)
+
+    return await engine.map(
+        fetch,
+        products,
+        label="UMI lots",
+        describe=lambda product: product.item_code,
+        skip_errors=SKIPPABLE_ERRORS,
+    )
+
+
 def collect_detail_records(
     driver: webdriver.Chrome,
     product: UmiListingProduct,
     branch_slug: str,
 ) -> list[UmiNaturalStoneRecord]:
-    rows = fetch_lot_payload(driver, product, branch_slug)
+    return build_detail_records(product, fetch_lot_payload(driver, product, branch_slug))
+
+
+def build_detail_records(product: UmiListingProduct, rows: list[dict]) -> list[UmiNaturalStoneRecord]:
     material, finish_from_name = parse_material_and_finish(product.product_category, product.listing_name)
     records: list[UmiNaturalStoneRecord] = []
 
@@ -486,6 +556,18 @@ def scrape_products(
     return records
 
 
+def scrape_products_api(
+    products: list[UmiListingProduct],
+    branch_slug: str,
+    crawl_options: CrawlOptions,
+) -> list[UmiNaturalStoneRecord]:
+    lot_rows = run_crawl(partial(fetch_all_lot_rows, products=products, branch_slug=branch_slug), crawl_options)
+    records: list[UmiNaturalStoneRecord] = []
+    for product, rows in lot_rows:
+        records.extend(build_detail_records(product, rows))
+    return records
+
+
 def record_to_payload(record: UmiNaturalStoneRecord) -> dict[str, str | None]:
     return {
         "name": record.name,
@@ -576,6 +658,12 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run Chrome with a visible window for local debugging.",
     )
+    parser.add_argument(
+        "--api-mode",
+        action="store_true",
+        help="Fetch lot rows from UMI's JSON endpoints over HTTP instead of through the browser.",
+    )
+    add_crawl_arguments(parser)
     return parser.parse_args()
 
 
@@ -590,7 +678,17 @@ def main() -> int:
         products = collect_listing_products(driver, wait, args.category, args.limit)
         logging.info("Collected %s top-level UMI %s products", len(products), args.category)
 
-        records = scrape_products(driver, products, config["branch_slug"])
+        if args.api_mode:
+            crawl_options = CrawlOptions(
+                user_agent=USER_AGENT,
+                timeout_sec=args.timeout_sec,
+                max_per_host=args.max_per_host,
+                min_interval_sec=args.min_interval_sec,
+                respect_robots=not args.ignore_robots,
+            )
+            records = scrape_products_api(products, config["branch_slug"], crawl_options)
+        else:
+            records = scrape_products(driver, products, config["branch_slug"])
         logging.info("Collected %s slab rows", len(records))
 
         json_path, csv_path = export_records(records, args.output_dir, args.category)
@@ -601,7 +699,8 @@ def main() -> int:
         logging.error("Timed out while scraping UMI %s inventory: %s", args.category, exc)
         return 1
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("umi_natural_stones")
 
 
 if __name__ == "__main__":
@@ -18,13 +18,29 @@ import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from urllib.parse import urlencode, urljoin
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 
 try:
+    from .crawl_engine import (
+        CrawlEngine,
+        CrawlOptions,
+        RobotsDisallowedError,
+        add_crawl_arguments,
+        run_crawl,
+    )
+    from .driver_factory import (
+        build_chrome_options,
+        drain_network_log,
+        load_page,
+        log_network_summary,
+        quit_chrome,
+        start_chrome,
+    )
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -37,6 +53,21 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from crawl_engine import (  # type: ignore
+        CrawlEngine,
+        CrawlOptions,
+        RobotsDisallowedError,
+        add_crawl_arguments,
+        run_crawl,
+    )
+    from driver_factory import (  # type: ignore
+        build_chrome_options,
+        drain_network_log,
+        load_page,
+        log_network_summary,
+        quit_chrome,
+        start_chrome,
+    )
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -103,24 +134,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2600")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless, window_size="1600,2600")
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
-
-
-def build_session() -> requests.Session:
-    session = requests.Session()
-    session.headers.update({"User-Agent": USER_AGENT})
-    return session
+    return start_chrome(build_options(headless))
 
 
 def safe_text(value: str | None) -> str:
@@ -145,7 +163,7 @@ def wait_for_pagination_ready(driver: webdriver.Chrome, wait: WebDriverWait) ->
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait) -> None:
     logging.info("Opening UMI Vicostone inventory: %s", LISTING_URL)
-    driver.get(LISTING_URL)
+    load_page(driver, LISTING_URL)
     wait_for_cards(driver, wait)
     wait_for_pagination_ready(driver, wait)
 
@@ -262,6 +280,8 @@ def collect_listing_products(
     for page_number in range(1, total_pages + 1):
         wait.until(lambda current_driver: parse_current_page(current_driver) == page_number)
         wait_for_cards(driver, wait)
+        # Pages change by XHR, so drain while this page's responses are still readable.
+        drain_network_log(driver)
         logging.info("Collecting UMI listing page %s/%s", page_number, total_pages)
 
         for card in driver.find_elements(By.CSS_SELECTOR, "#loadedData .product-Item"):
@@ -340,26 +360,13 @@ def infer_half_jumbo_size(full_3cm_size: str | None) -> str | None:
     return f"{format_dimension(long_side)}X{format_dimension(short_side / 2)}"
 
 
-def fetch_vicostone_image_url(
-    session: requests.Session,
-    vicostone_code: str | None,
-    cache: dict[str, str | None],
-    timeout_sec: int,
-) -> str | None:
-    if not vicostone_code:
-        return None
-    if vicostone_code in cache:
-        return cache[vicostone_code]
-
+async def fetch_vicostone_image_url(engine: CrawlEngine, vicostone_code: str) -> str | None:
     detail_url = VICOSTONE_DETAIL_URL_TEMPLATE.format(code=vicostone_code)
     try:
-        response = session.get(detail_url, timeout=timeout_sec)
-        response.raise_for_status()
-    except requests.RequestException:
-        cache[vicostone_code] = None
+        html = await engine.fetch_text(detail_url)
+    except (httpx.HTTPError, RobotsDisallowedError):
         return None
 
-    html = response.text
     lower_code = vicostone_code.lower()
     match = re.search(
         rf"(/[^\"']*{re.escape(lower_code)}-fullslab\.jpg(?:\?[^\"']*)?)",
@@ -367,34 +374,34 @@ def fetch_vicostone_image_url(
         flags=re.IGNORECASE,
     )
     if match:
-        cache[vicostone_code] = urljoin(detail_url, match.group(1).replace("&amp;", "&"))
-        return cache[vicostone_code]
+        return urljoin(detail_url, match.group(1).replace("&amp;", "&"))
 
     soup = BeautifulSoup(html, "html.parser")
     og_image = soup.select_one('meta[property="og:image"]')
     if og_image and og_image.get("content"):
-        cache[vicostone_code] = urljoin(detail_url, og_image.get("content"))
-        return cache[vicostone_code]
+        return urljoin(detail_url, og_image.get("content"))
 
-    cache[vicostone_code] = None
     return None
 
 
-def collect_detail_records(
+async def fetch_vicostone_image_urls(engine: CrawlEngine, vicostone_codes: list[str]) -> dict[str, str | None]:
+    image_urls = await engine.map(
+        partial(fetch_vicostone_image_url, engine),
+        vicostone_codes,
+        label="Vicostone image page",
+    )
+    return dict(zip(vicostone_codes, image_urls))
+
+
+def collect_detail_variants(
     driver: webdriver.Chrome,
     wait: WebDriverWait,
-    session: requests.Session,
     product: UmiListingProduct,
-    timeout_sec: int,
-    image_cache: dict[str, str | None],
-) -> list[UmiVicostoneRecord]:
-    driver.get(product.detail_url)
+) -> list[dict[str, str | None]]:
+    load_page(driver, product.detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#loadedData .product-Item")))
 
-    base_name = normalize_name(product.listing_name)
     rows = driver.find_elements(By.CSS_SELECTOR, "#loadedData .product-Item")
-
-    full_3cm_size: str | None = None
     raw_variants: list[dict[str, str | None]] = []
 
     for row in rows:
@@ -409,20 +416,29 @@ def collect_detail_records(
         except NoSuchElementException:
             pass
 
-        size = parse_variant_size(variant_title)
-        thickness = parse_variant_thickness(variant_title)
-        if size and thickness == "3CM":
-            full_3cm_size = size
-
         raw_variants.append(
             {
                 "variant_title": variant_title,
                 "sku": sku,
-                "size": size,
-                "thickness": thickness,
+                "size": parse_variant_size(variant_title),
+                "thickness": parse_variant_thickness(variant_title),
             }
         )
 
+    return raw_variants
+
+
+def build_detail_records(
+    product: UmiListingProduct,
+    raw_variants: list[dict[str, str | None]],
+    image_urls: dict[str, str | None],
+) -> list[UmiVicostoneRecord]:
+    base_name = normalize_name(product.listing_name)
+    full_3cm_size: str | None = None
+    for variant in raw_variants:
+        if variant["size"] and variant["thickness"] == "3CM":
+            full_3cm_size = variant["size"]
+
     grouped_records: dict[tuple[str, str | None], UmiVicostoneRecord] = {}
     grouped_thicknesses: dict[tuple[str, str | None], list[str]] = {}
 
@@ -441,7 +457,7 @@ def collect_detail_records(
             if vicostone_code
             else None
         )
-        image_url = fetch_vicostone_image_url(session, vicostone_code, image_cache, timeout_sec)
+        image_url = image_urls.get(vicostone_code) if vicostone_code else None
 
         if is_half:
             group_key = (base_name, f"half::{size}")
@@ -490,17 +506,28 @@ def collect_detail_records(
 def scrape_products(
     driver: webdriver.Chrome,
     wait: WebDriverWait,
-    session: requests.Session,
     products: list[UmiListingProduct],
-    timeout_sec: int,
+    crawl_options: CrawlOptions,
 ) -> list[UmiVicostoneRecord]:
-    records: list[UmiVicostoneRecord] = []
-    image_cache: dict[str, str | None] = {}
-
+    product_variants: list[tuple[UmiListingProduct, list[dict[str, str | None]]]] = []
     for index, product in enumerate(products, start=1):
         logging.info("Scraping UMI Vicostone detail %s/%s: %s", index, len(products), product.listing_name)
-        records.extend(collect_detail_records(driver, wait, session, product, timeout_sec, image_cache))
+        product_variants.append((product, collect_detail_variants(driver, wait, product)))
+
+    # The browser only walks UMI; the Vicostone image pages are plain HTTP and fetched together.
+    vicostone_codes = sorted(
+        {
+            code
+            for _, variants in product_variants
+            for variant in variants
+            if (code := extract_bq_code(variant["sku"]))
+        }
+    )
+    image_urls = run_crawl(partial(fetch_vicostone_image_urls, vicostone_codes=vicostone_codes), crawl_options)
 
+    records: list[UmiVicostoneRecord] = []
+    for product, variants in product_variants:
+        records.extend(build_detail_records(product, variants, image_urls))
     return records
 
 
@@ -586,12 +613,19 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run Chrome with a visible window for local debugging.",
     )
+    add_crawl_arguments(parser)
     return parser.parse_args()
 
 
 def main() -> int:
     args = parse_args()
-    session = build_session()
+    crawl_options = CrawlOptions(
+        user_agent=USER_AGENT,
+        timeout_sec=args.timeout_sec,
+        max_per_host=args.max_per_host,
+        min_interval_sec=args.min_interval_sec,
+        respect_robots=not args.ignore_robots,
+    )
     driver = create_driver(headless=not args.headed)
     wait = WebDriverWait(driver, args.timeout_sec)
 
@@ -601,7 +635,7 @@ def main() -> int:
         products = collect_listing_products(driver, wait, args.limit)
         logging.info("Collected %s top-level UMI Vicostone products", len(products))
 
-        records = scrape_products(driver, wait, session, products, args.timeout_sec)
+        records = scrape_products(driver, wait, products, crawl_options)
         logging.info("Collected %s slab rows", len(records))
 
         json_path, csv_path = export_records(records, args.output_dir)
@@ -612,7 +646,8 @@ def main() -> int:
         logging.error("Timed out while scraping UMI Vicostone inventory: %s", exc)
         return 1
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("umi_vicostone")
 
 
 if __name__ == "__main__":
@@ -29,6 +29,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_finishes,
@@ -41,6 +43,8 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_finishes,
@@ -101,18 +105,11 @@ def now_timestamp_slug() -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2600")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless, window_size="1600,2600")
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def safe_text(element) -> str:
@@ -121,7 +118,7 @@ def safe_text(element) -> str:
 
 def open_listing_page(driver: webdriver.Chrome, wait: WebDriverWait) -> None:
     logging.info("Opening Vadara listing page: %s", LISTING_URL)
-    driver.get(LISTING_URL)
+    load_page(driver, LISTING_URL)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, LISTING_GRID_SELECTOR)))
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_CARD_SELECTOR)))
 
@@ -229,7 +226,7 @@ def collect_detail_record(
     listing_name: str,
     detail_url: str,
 ) -> VadaraSlabRecord:
-    driver.get(detail_url)
+    load_page(driver, detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, DETAIL_READY_SELECTOR)))
 
     page_name = listing_name
@@ -268,17 +265,15 @@ def collect_detail_record(
 
 
 def scrape_detail_pages(
-    driver: webdriver.Chrome,
-    wait: WebDriverWait,
+    pool: BrowserPool,
     product_links: list[tuple[str, str]],
 ) -> list[VadaraSlabRecord]:
-    records: list[VadaraSlabRecord] = []
-
-    for index, (listing_name, detail_url) in enumerate(product_links, start=1):
-        logging.info("Scraping detail %s/%s: %s", index, len(product_links), detail_url)
-        records.append(collect_detail_record(driver, wait, listing_name, detail_url))
-
-    return records
+    return pool.map(
+        lambda driver, wait, product: collect_detail_record(driver, wait, *product),
+        product_links,
+        label="detail",
+        describe=lambda product: product[1],
+    )
 
 
 def to_unified(record: VadaraSlabRecord, scraped_at: str) -> UnifiedSlabRecord:
@@ -371,6 +366,7 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_TIMEOUT_SEC,
         help="Selenium wait timeout in seconds.",
     )
+    add_pool_arguments(parser)
     return parser.parse_args()
 
 
@@ -385,7 +381,7 @@ def main() -> None:
         product_links = collect_listing_products(driver, args.limit)
         logging.info("Collected %s Vadara products from the listing", len(product_links))
 
-        records = scrape_detail_pages(driver, wait, product_links)
+        records = scrape_detail_pages(pool_from_args(args, build_options, "vadara", listing_driver=driver), product_links)
         json_path, csv_path = export_records(records, output_dir)
 
         logging.info("Export complete")
@@ -394,7 +390,8 @@ def main() -> None:
     except TimeoutException as error:
         raise RuntimeError("Timed out while loading the Vadara catalog") from error
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("vadara")
 
 
 if __name__ == "__main__":
@@ -31,6 +31,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from .browser_pool import BrowserPool, add_pool_arguments, pool_from_args
+    from .driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome
     from .unified_csv import (
         UnifiedSlabRecord,
         canonical_material,
@@ -41,6 +43,8 @@ try:
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from browser_pool import BrowserPool, add_pool_arguments, pool_from_args  # type: ignore
+    from driver_factory import build_chrome_options, load_page, log_network_summary, quit_chrome, start_chrome  # type: ignore
     from unified_csv import (  # type: ignore
         UnifiedSlabRecord,
         canonical_material,
@@ -92,22 +96,15 @@ def material_label_from_slug(category_slug: str) -> str:
 
 
 def build_options(headless: bool) -> Options:
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--window-size=1600,2200")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-gpu")
-    return options
+    return build_chrome_options(headless, window_size="1600,2200")
 
 
 def create_driver(headless: bool = True) -> webdriver.Chrome:
-    return webdriver.Chrome(options=build_options(headless))
+    return start_chrome(build_options(headless))
 
 
 def ensure_dmv_filter(driver: webdriver.Chrome, wait: WebDriverWait, listing_url: str) -> None:
-    driver.get(listing_url)
+    load_page(driver, listing_url)
     checkbox = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, DMV_FILTER_SELECTOR)))
 
     # The site uses an inline submit on checkbox click. If the checkbox is
@@ -175,7 +172,7 @@ def collect_detail_record(
     detail_url: str,
     material_label: str,
 ) -> VeneziaSlabRecord:
-    driver.get(detail_url)
+    load_page(driver, detail_url)
     wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "#dp-slider")))
     wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, DETAIL_SPEC_ROW_SELECTOR)))
 
@@ -212,18 +209,16 @@ def collect_detail_record(
 
 
 def scrape_detail_pages(
-    driver: webdriver.Chrome,
-    wait: WebDriverWait,
+    pool: BrowserPool,
     product_links: list[tuple[str, str]],
     material_label: str,
 ) -> list[VeneziaSlabRecord]:
-    records: list[VeneziaSlabRecord] = []
-
-    for index, (listing_name, detail_url) in enumerate(product_links, start=1):
-        logging.info("Scraping detail %s: %s", index, detail_url)
-        records.append(collect_detail_record(driver, wait, listing_name, detail_url, material_label))
-
-    return records
+    return pool.map(
+        lambda driver, wait, product: collect_detail_record(driver, wait, *product, material_label),
+        product_links,
+        label="Venezia detail",
+        describe=lambda product: product[1],
+    )
 
 
 def to_unified(record: VeneziaSlabRecord, scraped_at: str, category_slug: str) -> UnifiedSlabRecord:
@@ -293,6 +288,7 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_TIMEOUT_SEC,
         help="Request and Selenium wait timeout in seconds.",
     )
+    add_pool_arguments(parser)
     return parser.parse_args()
 
 
@@ -312,7 +308,7 @@ def main() -> None:
         product_links = collect_listing_products(driver)
         logging.info("Collected %s products from the filtered listing", len(product_links))
 
-        records = scrape_detail_pages(driver, wait, product_links, material_label)
+        records = scrape_detail_pages(pool_from_args(args, build_options, "venezia", listing_driver=driver), product_links, material_label)
         json_path, csv_path = export_records(records, output_dir, category_slug)
 
         logging.info("Export complete")
@@ -321,7 +317,8 @@ def main() -> None:
     except TimeoutException as error:
         raise RuntimeError("Timed out while loading the Venezia catalog/filter state") from error
     finally:
-        driver.quit()
+        quit_chrome(driver)
+        log_network_summary("venezia")
 
 
 if __name__ == "__main__":
@@ -146,6 +146,12 @@ create table if not exists public.remnants (
   photo_hash text,
   image_path text,
   photo_synced_at timestamptz,
+  photo_source_etag text,
+  photo_source_last_modified text,
+  photo_source_length bigint,
+  photo_source_hash text,
+  image_variants jsonb,
+  image_variant_paths jsonb,
   source_image_url text,
   created_at timestamptz not null default now(),
   deleted_at timestamptz,
@@ -381,6 +387,10 @@ create index if not exists idx_remnants_company_id
 create index if not exists idx_remnants_deleted_at
   on public.remnants(deleted_at);
 
+create index if not exists idx_remnants_moraware_active_last_seen
+  on public.remnants(company_id, last_seen_at)
+  where deleted_at is null and moraware_remnant_id is not null;
+
 create index if not exists idx_remnants_material_id
   on public.remnants(material_id);
 
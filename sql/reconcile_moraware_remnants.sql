@@ -0,0 +1,54 @@
+-- End-of-run reconciliation for the Moraware remnant sync.
+--
+-- `reconcile_moraware_remnants` bumps `last_seen_at` for every Moraware id the
+-- sync saw this run and, when `p_soft_delete` is true, soft-deletes the
+-- company's Moraware rows that were not seen — both in one transaction. Only
+-- the two counts travel back to the scraper, instead of every updated row.
+--
+-- Idempotent — safe to re-run.
+
+create index if not exists idx_remnants_moraware_active_last_seen
+  on public.remnants (company_id, last_seen_at)
+  where deleted_at is null and moraware_remnant_id is not null;
+
+create or replace function public.reconcile_moraware_remnants(
+  p_company_id bigint,
+  p_run_started_at timestamptz,
+  p_seen_remnant_ids bigint[] default '{}',
+  p_soft_delete boolean default true
+)
+returns table (touched_count int, deleted_count int)
+language plpgsql
+security definer
+set search_path = public, pg_temp
+as $$
+declare
+  v_touched int := 0;
+  v_deleted int := 0;
+begin
+  update public.remnants
+  set last_seen_at = p_run_started_at
+  where company_id = p_company_id
+    and moraware_remnant_id = any(p_seen_remnant_ids)
+    and (last_seen_at is null or last_seen_at < p_run_started_at);
+
+  get diagnostics v_touched = row_count;
+
+  if p_soft_delete then
+    update public.remnants
+    set deleted_at = now()
+    where company_id = p_company_id
+      and moraware_remnant_id is not null
+      and deleted_at is null
+      and last_seen_at < p_run_started_at;
+
+    get diagnostics v_deleted = row_count;
+  end if;
+
+  return query select v_touched, v_deleted;
+end;
+$$;
+
+revoke all on function public.reconcile_moraware_remnants(bigint, timestamptz, bigint[], boolean) from public;
+revoke all on function public.reconcile_moraware_remnants(bigint, timestamptz, bigint[], boolean) from anon, authenticated;
+grant execute on function public.reconcile_moraware_remnants(bigint, timestamptz, bigint[], boolean) to service_role;
@@ -0,0 +1,62 @@
+-- Garbage collection for content-addressed remnant photos.
+--
+-- With MORAWARE_CONTENT_ADDRESSED_STORAGE on, the remnant sync stores photos
+-- under `by-hash/ab/cd/<sha256>.<ext>` and several remnants may share one
+-- object. After reconciliation the sync calls this function for the objects
+-- under `by-hash/` that no remnant row (soft-deleted rows included) references
+-- through `image_path` or `image_variant_paths`, then removes them through
+-- the Storage API. Objects younger than `p_min_age_hours` are left alone so an
+-- upload whose row write is still in flight is never collected.
+--
+-- `image_variant_paths` holds the object path of each variant next to the
+-- public URLs in `image_variants` ({"medium": "by-hash/...", ...}). GC compares
+-- those paths directly, so a CDN host or signed URL in `image_variants` can
+-- never make a live object look unreferenced.
+--
+-- Idempotent — safe to re-run.
+
+alter table public.remnants
+  add column if not exists image_variant_paths jsonb;
+
+-- Rows synced before `image_variant_paths` existed only have the public URLs,
+-- which the sync always built with `get_public_url`.
+update public.remnants r
+set image_variant_paths = (
+  select jsonb_object_agg(v.key, regexp_replace(v.value, '^.*/object/public/[^/]+/', ''))
+  from jsonb_each_text(r.image_variants) as v
+)
+where r.image_variant_paths is null
+  and jsonb_typeof(r.image_variants) = 'object'
+  and r.image_variants::text like '%/by-hash/%';
+
+create or replace function public.unreferenced_remnant_content_objects(
+  p_bucket text,
+  p_min_age_hours numeric default 1
+)
+returns table (name text)
+language sql
+stable
+security definer
+set search_path = public, storage, pg_temp
+as $$
+  with referenced as (
+    select r.image_path as path
+    from public.remnants r
+    where r.image_path like 'by-hash/%'
+    union
+    select v.value as path
+    from public.remnants r
+    cross join lateral jsonb_each_text(coalesce(r.image_variant_paths, '{}'::jsonb)) as v
+    where v.value like 'by-hash/%'
+  )
+  select o.name
+  from storage.objects o
+  where o.bucket_id = p_bucket
+    and o.name like 'by-hash/%'
+    and o.created_at < now() - make_interval(secs => p_min_age_hours * 3600)
+    and not exists (select 1 from referenced ref where ref.path = o.name);
+$$;
+
+revoke all on function public.unreferenced_remnant_content_objects(text, numeric) from public;
+revoke all on function public.unreferenced_remnant_content_objects(text, numeric) from anon, authenticated;
+grant execute on function public.unreferenced_remnant_content_objects(text, numeric) to service_role;
@@ -0,0 +1,10 @@
+-- Responsive WebP renditions of each synced remnant photo.
+-- With MORAWARE_IMAGE_VARIANTS on, the remnant sync uploads
+-- `remnant_<id>_medium.webp` and `remnant_<id>_thumb.webp` next to the full
+-- image and stores their public URLs here as {"medium": ..., "thumb": ...}.
+-- `{}` means the photo was synced with variants on but has none (e.g. GIFs).
+--
+-- Idempotent — safe to re-run.
+
+alter table public.remnants
+  add column if not exists image_variants jsonb;
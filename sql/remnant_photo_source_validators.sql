@@ -0,0 +1,12 @@
+-- Upstream validators for the Moraware photo each remnant was synced from.
+-- The remnant sync sends If-None-Match / If-Modified-Since with these values
+-- and compares `photo_source_hash` (sha256 of the raw downloaded bytes) before
+-- re-encoding, so unchanged photos are neither downloaded nor decoded again.
+--
+-- Idempotent — safe to re-run.
+
+alter table public.remnants
+  add column if not exists photo_source_etag text,
+  add column if not exists photo_source_last_modified text,
+  add column if not exists photo_source_length bigint,
+  add column if not exists photo_source_hash text;
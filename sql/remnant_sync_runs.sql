@@ -0,0 +1,20 @@
+-- One row per Moraware remnant sync run when MORAWARE_PUSH_METRICS is on.
+-- `metrics` holds the same document as `last_sync_metrics.json`: totals plus
+-- per-phase count, p50/p95/max seconds, request counts and bytes moved.
+--
+-- Idempotent — safe to re-run.
+
+create table if not exists public.remnant_sync_runs (
+  id bigint generated by default as identity primary key,
+  company_id bigint not null references public.companies(id) on delete cascade,
+  status text not null,
+  started_at timestamptz not null,
+  completed_at timestamptz,
+  error_count integer not null default 0,
+  issue_count integer not null default 0,
+  metrics jsonb not null default '{}'::jsonb,
+  created_at timestamptz not null default timezone('utc'::text, now())
+);
+
+create index if not exists remnant_sync_runs_company_started_idx
+  on public.remnant_sync_runs (company_id, started_at desc);